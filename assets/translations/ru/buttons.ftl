@@ -330,6 +330,8 @@ btn-importer-sync = 🌀 Запустить синхронизацию
 btn-importer-squads = 🔗 Внутренние сквады
 btn-importer-import-all = ✅ Импортировать всех
 btn-importer-import-active = ❇️ Импортировать активных
+btn-importer-refresh = 🔄 Обновить данные
+btn-importer-resume = ▶️ Продолжить импорт
 
 
 # Subscription
@@ -233,6 +233,19 @@ msg-broadcast-view =
     • <b>Неудачных</b>: { $failed_count }
     </blockquote>
 
+    { $has_deletion ->
+    [1]
+    <blockquote>
+    • <b>Удаление</b>: { $is_deleting ->
+        [1] в процессе
+        *[0] завершено
+    }
+    • <b>Удалено</b>: { $deletion_deleted_count } / { $deletion_total_count }
+    • <b>Не удалось удалить</b>: { $deletion_failed_count }
+    </blockquote>
+    *[0] { empty }
+    }
+
 
 # Users
 msg-users-recent-registered = <b>🆕 Последние зарегистрированные</b>
@@ -678,7 +691,7 @@ msg-importer-from-xui =
 
     Рекомендуется заранее отключить пользователей, у которых в поле email отсутствует Telegram ID. Операция может занять значительное время в зависимости от количества пользователей.
 
-    Отправьте файл базы данных (в формате .db).
+    Отправьте файл базы данных (в формате .db) или список пользователей в формате .csv / .jsonl с полями telegram_id, expire_at, traffic_limit_bytes и hwid_device_limit.
     }
 
 msg-importer-squads =
@@ -687,7 +700,13 @@ msg-importer-squads =
     Выберите, какие внутренние группы будут доступны импортированным пользователям.
 
 msg-importer-import-completed =
-    <b>📥 Импорт пользователей завершен</b>
+    <b>📥 Импорт пользователей { $is_finished ->
+        [1] завершен
+        *[0] { $is_running ->
+            [1] в процессе
+            *[0] приостановлен
+        }
+    }</b>
 
     <b>📃 Информация:</b>
     <blockquote>
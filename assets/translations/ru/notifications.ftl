@@ -323,6 +323,14 @@ ntf-importer-db-failed = <i>❌ Ошибка при импорте базы да
 ntf-importer-exported-users-empty =  <i>❌ Список пользователей в базе данных пуст.</i>
 ntf-importer-internal-squads-empty = <i>❌ Выберите хотя бы один внутренний сквад.</i>
 ntf-importer-import-started = <i>✅ Импорт пользователей запущен, ожидайте...</i>
+ntf-importer-import-completed =
+    ✅ Импорт пользователей завершен.
+
+    <blockquote>
+    • <b>Всего пользователей</b>: { $total_count }
+    • <b>Успешно импортированы</b>: { $success_count }
+    • <b>Не удалось импортировать</b>: { $failed_count }
+    </blockquote>
 ntf-importer-sync-started = <i>✅ Синхронизация пользователей запущена, ожидайте...</i>
 ntf-importer-users-not-found = <i>❌ Не удалось найти пользователей для синхронизации.</i>
 ntf-importer-not-support = <i>⚠️ Импорт всех данных из 3xui-shop временно недоступен. Вы можете воспользоваться импортом из панели 3X-UI!</i>
\ No newline at end of file
@@ -1,7 +1,6 @@
 import traceback
 from typing import Any, Awaitable, Callable, Union
 
-from aiogram import Bot
 from aiogram.enums import ChatMemberStatus
 from aiogram.types import CallbackQuery, Message, TelegramObject
 from aiogram.utils.formatting import Text
@@ -13,18 +12,14 @@ from src.core.constants import CONTAINER_KEY, USER_KEY
 from src.core.enums import MiddlewareEventType
 from src.core.utils.message_payload import MessagePayload
 from src.infrastructure.database.models.dto import UserDto
+from src.infrastructure.redis import MessageDeletionQueue
 from src.infrastructure.taskiq.tasks.notifications import send_error_notification_task
+from src.services.channel import ChannelService
 from src.services.notification import NotificationService
 from src.services.settings import SettingsService
 
 from .base import EventTypedMiddleware
 
-ALLOWED_STATUSES = (
-    ChatMemberStatus.CREATOR,
-    ChatMemberStatus.ADMINISTRATOR,
-    ChatMemberStatus.MEMBER,
-)
-
 
 class ChannelMiddleware(EventTypedMiddleware):
     __event_types__ = [MiddlewareEventType.MESSAGE, MiddlewareEventType.CALLBACK_QUERY]
@@ -46,17 +41,13 @@ class ChannelMiddleware(EventTypedMiddleware):
             logger.debug(f"User '{user.telegram_id}' skipped channel check (privileged)")
             return await handler(event, data)
 
-        bot: Bot = await container.get(Bot)
+        channel_service: ChannelService = await container.get(ChannelService)
         notification_service: NotificationService = await container.get(NotificationService)
 
         settings = await settings_service.get()
 
-        chat_id: Union[str, int, None] = None
         channel_link = settings.channel_link.get_secret_value()
-        if settings.channel_has_username:
-            chat_id = channel_link
-        elif settings.channel_id:
-            chat_id = settings.channel_id
+        chat_id: Union[str, int, None] = channel_service.get_chat_id(settings)
 
         if chat_id is None:
             logger.warning(
@@ -65,9 +56,11 @@ class ChannelMiddleware(EventTypedMiddleware):
             return await handler(event, data)
 
         try:
-            member = await bot.get_chat_member(
+            # A confirm click means the user claims to have just joined, so skip the cache
+            status = await channel_service.get_member_status(
                 chat_id=chat_id,
-                user_id=user.telegram_id,
+                telegram_id=user.telegram_id,
+                force=self._is_click_confirm(event),
             )
         except Exception as exception:
             traceback_str = traceback.format_exc()
@@ -88,16 +81,16 @@ class ChannelMiddleware(EventTypedMiddleware):
             )
             return await handler(event, data)
 
-        if member.status in ALLOWED_STATUSES:
+        if channel_service.is_member(status):
             if self._is_click_confirm(event):
-                await self._delete_channel_message(event)
+                await self._delete_channel_message(event, container)
 
-            logger.debug(f"User '{user.telegram_id}' passed channel check. Status: {member.status}")
+            logger.debug(f"User '{user.telegram_id}' passed channel check. Status: {status}")
             # TODO: Auto confirming
             return await handler(event, data)
 
         if self._is_click_confirm(event):
-            await self._delete_channel_message(event)
+            await self._delete_channel_message(event, container)
             await notification_service.notify_user(
                 user=user,
                 payload=MessagePayload(
@@ -110,7 +103,7 @@ class ChannelMiddleware(EventTypedMiddleware):
             logger.debug(f"User '{user.telegram_id}' failed channel check")
             return
 
-        if member.status == ChatMemberStatus.LEFT:
+        if status == ChatMemberStatus.LEFT:
             i18n_key = "ntf-channel-join-required-left"
         else:
             i18n_key = "ntf-channel-join-required"
@@ -130,9 +123,17 @@ class ChannelMiddleware(EventTypedMiddleware):
     def _is_click_confirm(self, event: TelegramObject) -> bool:
         return isinstance(event, CallbackQuery) and event.data == CALLBACK_CHANNEL_CONFIRM
 
-    async def _delete_channel_message(self, event: TelegramObject) -> None:
+    async def _delete_channel_message(
+        self,
+        event: TelegramObject,
+        container: AsyncContainer,
+    ) -> None:
         if not isinstance(event, CallbackQuery):
             return
 
         if event.message is not None and isinstance(event.message, Message):
-            await event.message.delete()
+            deletion_queue: MessageDeletionQueue = await container.get(MessageDeletionQueue)
+            await deletion_queue.schedule(
+                chat_id=event.message.chat.id,
+                message_id=event.message.message_id,
+            )
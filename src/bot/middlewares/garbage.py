@@ -1,11 +1,13 @@
 from typing import Any, Awaitable, Callable, cast
 
 from aiogram.types import Message, TelegramObject
+from dishka import AsyncContainer
 from loguru import logger
 
-from src.core.constants import USER_KEY
+from src.core.constants import CONTAINER_KEY, USER_KEY
 from src.core.enums import Command, MiddlewareEventType
 from src.infrastructure.database.models.dto import UserDto
+from src.infrastructure.redis import MessageDeletionQueue
 
 from .base import EventTypedMiddleware
 
@@ -23,7 +25,12 @@ class GarbageMiddleware(EventTypedMiddleware):
         user: UserDto = data[USER_KEY]
 
         if message.text != f"/{Command.START.value.command}":
-            await message.delete()
-            logger.debug(f"Message '{message.content_type}' deleted from '{user.telegram_id}'")
+            container: AsyncContainer = data[CONTAINER_KEY]
+            deletion_queue: MessageDeletionQueue = await container.get(MessageDeletionQueue)
+            # Deleted in bulk by the queue poller, off the request path
+            await deletion_queue.schedule(chat_id=message.chat.id, message_id=message.message_id)
+            logger.debug(
+                f"Message '{message.content_type}' queued for deletion from '{user.telegram_id}'"
+            )
 
         return await handler(event, data)
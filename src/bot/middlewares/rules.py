@@ -11,6 +11,7 @@ from src.core.constants import CONTAINER_KEY
 from src.core.enums import MiddlewareEventType
 from src.core.utils.message_payload import MessagePayload
 from src.infrastructure.database.models.dto import UserDto
+from src.infrastructure.redis import MessageDeletionQueue
 from src.services.notification import NotificationService
 from src.services.settings import SettingsService
 from src.services.user import UserService
@@ -63,7 +64,7 @@ class RulesMiddleware(EventTypedMiddleware):
         )
 
         if self._is_click_accept(event):
-            await self._delete_rules_message(event)
+            await self._delete_rules_message(event, container)
             return await handler(event, data)
 
         if user is None:
@@ -86,9 +87,17 @@ class RulesMiddleware(EventTypedMiddleware):
             isinstance(event, CallbackQuery) and event.data == CALLBACK_RULES_ACCEPT
         )
 
-    async def _delete_rules_message(self, event: TelegramObject) -> None:
+    async def _delete_rules_message(
+        self,
+        event: TelegramObject,
+        container: AsyncContainer,
+    ) -> None:
         if not isinstance(event, CallbackQuery):
             return
 
         if event.message is not None and isinstance(event.message, Message):
-            await event.message.delete()
+            deletion_queue: MessageDeletionQueue = await container.get(MessageDeletionQueue)
+            await deletion_queue.schedule(
+                chat_id=event.message.chat.id,
+                message_id=event.message.message_id,
+            )
@@ -0,0 +1,43 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.bot.middlewares.garbage import GarbageMiddleware
+from src.core.constants import CONTAINER_KEY, USER_KEY
+
+
+def make_data():
+    deletion_queue = AsyncMock()
+    container = AsyncMock()
+    container.get = AsyncMock(return_value=deletion_queue)
+    return {CONTAINER_KEY: container, USER_KEY: MagicMock(telegram_id=123)}, deletion_queue
+
+
+@pytest.mark.asyncio
+async def test_middleware_queues_message_deletion():
+    middleware = GarbageMiddleware()
+    handler = AsyncMock(return_value="handled")
+    message = MagicMock(text="hello", message_id=10)
+    message.chat.id = 123
+    message.delete = AsyncMock()
+    data, deletion_queue = make_data()
+
+    result = await middleware.middleware_logic(handler, message, data)
+
+    # Сообщение не удаляется на пути обработки запроса
+    message.delete.assert_not_awaited()
+    deletion_queue.schedule.assert_awaited_once_with(chat_id=123, message_id=10)
+    assert result == "handled"
+
+
+@pytest.mark.asyncio
+async def test_middleware_keeps_start_command():
+    middleware = GarbageMiddleware()
+    handler = AsyncMock()
+    message = MagicMock(text="/start")
+    data, deletion_queue = make_data()
+
+    await middleware.middleware_logic(handler, message, data)
+
+    deletion_queue.schedule.assert_not_awaited()
+    handler.assert_awaited_once()
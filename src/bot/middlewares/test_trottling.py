@@ -1,95 +1,105 @@
 import pytest
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock
+from aiogram.types import CallbackQuery
+from redis.asyncio import Redis
 from src.core.constants import CONTAINER_KEY, USER_KEY
+from src.core.enums import MiddlewareEventType, UserRole
+from src.core.storage.keys import ThrottlingKey
 from src.bot.middlewares import ThrottlingMiddleware
-from src.infrastructure.database.models.dto import UserDto
+from src.services.notification import NotificationService
 
 
-@pytest.mark.asyncio
-async def test_throttling_middleware_allows_first_request():
-    middleware = ThrottlingMiddleware(ttl=1.0)
-    handler = AsyncMock(return_value="handled")
-
-    # Используем мок вместо создания UserDto
+def make_data(script_result):
     user = Mock()
     user.telegram_id = 123
+    user.role = UserRole.USER
 
-    event_mock = Mock()
+    script = AsyncMock(return_value=script_result)
+    redis_client = MagicMock()
+    redis_client.register_script.return_value = script
+    notification_service = AsyncMock()
 
     container = AsyncMock()
-    notification_service = AsyncMock()
-    container.get = AsyncMock(return_value=notification_service)
+    container.get = AsyncMock(
+        side_effect=lambda dependency: {
+            Redis: redis_client,
+            NotificationService: notification_service,
+        }[dependency]
+    )
 
     data = {CONTAINER_KEY: container, USER_KEY: user}
+    return data, script, notification_service
+
+
+@pytest.mark.asyncio
+async def test_throttling_middleware_allows_request_with_token():
+    middleware = ThrottlingMiddleware()
+    handler = AsyncMock(return_value="handled")
+    event_mock = Mock()
+    data, script, notification_service = make_data([1, 0])
 
     result = await middleware.middleware_logic(handler, event_mock, data)
 
     handler.assert_called_once_with(event_mock, data)
     assert result == "handled"
-    # Проверим, что пользователь добавлен в кэш
-    assert user.telegram_id in middleware.cache
+    notification_service.notify_user.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_throttling_middleware_blocks_repeated_request():
-    middleware = ThrottlingMiddleware(ttl=1.0)
+async def test_throttling_middleware_blocks_and_notifies_once():
+    middleware = ThrottlingMiddleware()
     handler = AsyncMock()
+    data, script, notification_service = make_data([0, 1])
 
-    user = Mock()
-    user.telegram_id = 123
-
-    event_mock = Mock()
-
-    container = AsyncMock()
-    notification_service = AsyncMock()
-    container.get = AsyncMock(return_value=notification_service)
-
-    data = {CONTAINER_KEY: container, USER_KEY: user}
-
-    # Добавим пользователя в кэш вручную
-    middleware.cache[user.telegram_id] = None
-
-    result = await middleware.middleware_logic(handler, event_mock, data)
+    result = await middleware.middleware_logic(handler, Mock(), data)
 
     handler.assert_not_called()
     assert result is None
-    # Проверим, что сервис уведомлений был вызван
     notification_service.notify_user.assert_called_once()
 
+    # Повторное ограничение в том же окне проходит без уведомления
+    script.return_value = [0, 0]
+    await middleware.middleware_logic(handler, Mock(), data)
 
-@pytest.mark.asyncio
-async def test_throttling_middleware_ttl_expires():
-    middleware = ThrottlingMiddleware(ttl=0.01)  # Очень маленький TTL для теста
-    handler = AsyncMock(return_value="handled")
-
-    user = Mock()
-    user.telegram_id = 123
-
-    event_mock = Mock()
-
-    container = AsyncMock()
-    notification_service = AsyncMock()
-    container.get = AsyncMock(return_value=notification_service)
+    handler.assert_not_called()
+    notification_service.notify_user.assert_called_once()
 
-    data = {CONTAINER_KEY: container, USER_KEY: user}
 
-    # Первый вызов - должен пройти
-    result1 = await middleware.middleware_logic(handler, event_mock, data)
-    assert result1 == "handled"
-    handler.assert_called_once()
+@pytest.mark.asyncio
+async def test_throttling_middleware_uses_limits_per_event_type_and_role():
+    middleware = ThrottlingMiddleware(
+        limits={
+            MiddlewareEventType.MESSAGE: (2, 1.0),
+            MiddlewareEventType.CALLBACK_QUERY: (4, 2.0),
+        },
+        role_multipliers={UserRole.ADMIN: 3.0},
+        notice_window=7,
+    )
+    data, script, _ = make_data([1, 0])
+    data[USER_KEY].role = UserRole.ADMIN
+    event_mock = Mock(spec=CallbackQuery)
+
+    await middleware.middleware_logic(AsyncMock(), event_mock, data)
+
+    kwargs = script.await_args.kwargs
+    assert (
+        kwargs["keys"][0]
+        == ThrottlingKey(telegram_id=123, event_type=MiddlewareEventType.CALLBACK_QUERY).pack()
+    )
+    assert kwargs["args"] == [12, 6.0, 7]
 
-    # Обнулим вызовы
-    handler.reset_mock()
 
-    # Ждем истечения TTL
-    import asyncio
+@pytest.mark.asyncio
+async def test_throttling_middleware_fails_open_on_redis_error():
+    middleware = ThrottlingMiddleware()
+    handler = AsyncMock(return_value="handled")
+    data, script, _ = make_data(None)
+    script.side_effect = ConnectionError("redis is down")
 
-    await asyncio.sleep(0.02)
+    result = await middleware.middleware_logic(handler, Mock(), data)
 
-    # Второй вызов - должен пройти, так как TTL истёк
-    result2 = await middleware.middleware_logic(handler, event_mock, data)
-    assert result2 == "handled"
-    handler.assert_called_once()
+    # Без Redis пользователь не должен терять доступ к боту
+    assert result == "handled"
 
 
 def test_throttling_middleware_attributes():
@@ -1,24 +1,73 @@
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, Final, Optional
 
-from aiogram.types import TelegramObject
-from cachetools import TTLCache
+from aiogram.types import CallbackQuery, TelegramObject
 from dishka import AsyncContainer
 from loguru import logger
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
 
-from src.core.constants import CONTAINER_KEY, USER_KEY
-from src.core.enums import MiddlewareEventType
+from src.core.constants import CONTAINER_KEY, THROTTLING_NOTICE_WINDOW, USER_KEY
+from src.core.enums import MiddlewareEventType, UserRole
+from src.core.storage.keys import ThrottlingKey, ThrottlingNoticeKey
 from src.core.utils.message_payload import MessagePayload
 from src.infrastructure.database.models.dto import UserDto
 from src.services.notification import NotificationService
 
 from .base import EventTypedMiddleware
 
+# (burst, tokens per second)
+DEFAULT_THROTTLING_LIMITS: Final[dict[MiddlewareEventType, tuple[int, float]]] = {
+    MiddlewareEventType.MESSAGE: (3, 2.0),
+    MiddlewareEventType.CALLBACK_QUERY: (5, 3.0),
+}
+DEFAULT_ROLE_MULTIPLIERS: Final[dict[UserRole, float]] = {
+    UserRole.DEV: 5.0,
+    UserRole.ADMIN: 5.0,
+    UserRole.USER: 1.0,
+}
+
+# Refills and takes a token in one round-trip using the Redis clock, so every worker
+# shares the same bucket. The notice key limits the warning to one per window
+TOKEN_BUCKET_SCRIPT: Final[str] = """
+local burst = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or burst
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+
+local notify = 0
+if allowed == 0 and redis.call('SET', KEYS[2], 1, 'NX', 'EX', ARGV[3]) then
+    notify = 1
+end
+return {allowed, notify}
+"""
+
 
 class ThrottlingMiddleware(EventTypedMiddleware):
     __event_types__ = [MiddlewareEventType.MESSAGE, MiddlewareEventType.CALLBACK_QUERY]
 
-    def __init__(self, ttl: float = 0.5) -> None:
-        self.cache: TTLCache[int, Any] = TTLCache(maxsize=10_000, ttl=ttl)
+    def __init__(
+        self,
+        limits: Optional[dict[MiddlewareEventType, tuple[int, float]]] = None,
+        role_multipliers: Optional[dict[UserRole, float]] = None,
+        notice_window: int = THROTTLING_NOTICE_WINDOW,
+    ) -> None:
+        self.limits = limits or DEFAULT_THROTTLING_LIMITS
+        self.role_multipliers = role_multipliers or DEFAULT_ROLE_MULTIPLIERS
+        self.notice_window = notice_window
+        self._script: Optional[AsyncScript] = None
 
     async def middleware_logic(
         self,
@@ -29,15 +78,49 @@ class ThrottlingMiddleware(EventTypedMiddleware):
         container: AsyncContainer = data[CONTAINER_KEY]
         user: UserDto = data[USER_KEY]
 
-        notification_service: NotificationService = await container.get(NotificationService)
+        try:
+            allowed, notify = await self._take_token(container, user, event)
+        except Exception as exception:
+            logger.warning(f"Throttling check failed for '{user.telegram_id}': {exception}")
+            return await handler(event, data)
+
+        if allowed:
+            return await handler(event, data)
 
-        if user.telegram_id in self.cache:
+        logger.warning(f"User '{user.telegram_id}' throttled")
+
+        if notify:
+            notification_service: NotificationService = await container.get(NotificationService)
             await notification_service.notify_user(
                 user=user,
                 payload=MessagePayload(i18n_key="ntf-throttling-many-requests"),
             )
-            logger.warning(f"User '{user.telegram_id}' throttled")
-            return
 
-        self.cache[user.telegram_id] = None
-        return await handler(event, data)
+    async def _take_token(
+        self,
+        container: AsyncContainer,
+        user: UserDto,
+        event: TelegramObject,
+    ) -> tuple[bool, bool]:
+        if self._script is None:
+            redis_client: Redis = await container.get(Redis)
+            self._script = redis_client.register_script(TOKEN_BUCKET_SCRIPT)
+
+        event_type = self._get_event_type(event)
+        burst, rate = self.limits[event_type]
+        multiplier = self.role_multipliers.get(user.role, 1.0)
+
+        allowed, notify = await self._script(
+            keys=[
+                ThrottlingKey(telegram_id=user.telegram_id, event_type=event_type).pack(),
+                ThrottlingNoticeKey(telegram_id=user.telegram_id).pack(),
+            ],
+            args=[max(1, int(burst * multiplier)), rate * multiplier, self.notice_window],
+        )
+        return bool(allowed), bool(notify)
+
+    @staticmethod
+    def _get_event_type(event: TelegramObject) -> MiddlewareEventType:
+        if isinstance(event, CallbackQuery):
+            return MiddlewareEventType.CALLBACK_QUERY
+        return MiddlewareEventType.MESSAGE
@@ -134,7 +134,7 @@ view = Window(
             I18nFormat("btn-broadcast-refresh"),
             id="refresh",
             state=DashboardBroadcast.VIEW,
-            when=F["broadcast_status"] == BroadcastStatus.PROCESSING,
+            when=(F["broadcast_status"] == BroadcastStatus.PROCESSING) | F["is_deleting"],
         ),
     ),
     Row(
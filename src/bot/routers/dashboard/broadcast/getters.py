@@ -75,7 +75,7 @@ async def list_getter(
     broadcast_service: FromDishka[BroadcastService],
     **kwargs: Any,
 ) -> dict[str, Any]:
-    broadcasts = await broadcast_service.get_all()
+    broadcasts = await broadcast_service.get_recent()
 
     formatted_broadcasts = [
         {
@@ -106,6 +106,7 @@ async def view_getter(
         raise ValueError(f"Broadcast '{task_id}' not found")
 
     dialog_manager.dialog_data["payload"] = broadcast.payload.model_dump()
+    deletion = await broadcast_service.get_deletion_progress(broadcast.task_id)
 
     return {
         "broadcast_id": str(broadcast.task_id),
@@ -115,4 +116,9 @@ async def view_getter(
         "total_count": broadcast.total_count,
         "success_count": broadcast.success_count,
         "failed_count": broadcast.failed_count,
+        "has_deletion": deletion is not None,
+        "is_deleting": deletion is not None and not deletion.is_finished,
+        "deletion_total_count": deletion.total_count if deletion else 0,
+        "deletion_deleted_count": deletion.deleted_count if deletion else 0,
+        "deletion_failed_count": deletion.failed_count if deletion else 0,
     }
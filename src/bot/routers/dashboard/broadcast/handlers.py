@@ -60,7 +60,7 @@ async def on_broadcast_list(
     notification_service: FromDishka[NotificationService],
 ) -> None:
     user: UserDto = dialog_manager.middleware_data[USER_KEY]
-    broadcasts = await broadcast_service.get_all()
+    broadcasts = await broadcast_service.get_recent(limit=1)
 
     if not broadcasts:
         await notification_service.notify_user(
@@ -282,13 +282,13 @@ async def on_send(
         raise ValueError("BroadcastAudience not found in dialog data")
 
     if is_double_click(dialog_manager, key="broadcast_confirm", cooldown=10):
-        users = await broadcast_service.get_audience_users(audience, plan_id=plan_id)
+        audience_count = await broadcast_service.get_audience_count(audience, plan_id=plan_id)
 
         task_id = uuid.uuid4()
         broadcast = BroadcastDto(
             task_id=task_id,
             status=BroadcastStatus.PROCESSING,
-            total_count=len(users),
+            total_count=audience_count,
             audience=audience,
             payload=payload,
         )
@@ -297,7 +297,7 @@ async def on_send(
         task = (
             await send_broadcast_task.kicker()
             .with_task_id(str(task_id))
-            .kiq(broadcast, users, payload)
+            .kiq(broadcast, audience, plan_id, payload)
         )
 
         dialog_manager.dialog_data["task_id"] = task.task_id
@@ -333,8 +333,7 @@ async def on_cancel(
         )
         return
 
-    broadcast.status = BroadcastStatus.CANCELED
-    await broadcast_service.update(broadcast)
+    await broadcast_service.cancel(broadcast)
 
     await notification_service.notify_user(
         user=user,
@@ -372,21 +371,4 @@ async def on_delete(
         payload=MessagePayload(i18n_key="ntf-broadcast-deleting"),
     )
 
-    task = await delete_broadcast_task.kiq(broadcast)
-    result = await task.wait_result()
-    total_count, deleted_count, failed_count = result.return_value
-
-    await notification_service.notify_user(
-        user=user,
-        payload=MessagePayload(
-            i18n_key="ntf-broadcast-deleted-success",
-            i18n_kwargs={
-                "task_id": str(broadcast.task_id),
-                "total_count": total_count,
-                "deleted_count": deleted_count,
-                "failed_count": failed_count,
-            },
-            auto_delete_after=None,
-            add_close_button=True,
-        ),
-    )
+    await delete_broadcast_task.kiq(broadcast, user)
@@ -17,6 +17,7 @@ from .handlers import (
     on_import_active_xui,
     on_import_all_xui,
     on_import_from_bot,
+    on_import_resume,
     on_squad_select,
     on_squads,
     on_sync,
@@ -100,6 +101,22 @@ from_xui = Window(
 import_completed = Window(
     Banner(BannerName.DASHBOARD),
     I18nFormat("msg-importer-import-completed"),
+    Row(
+        SwitchTo(
+            text=I18nFormat("btn-importer-refresh"),
+            id="refresh",
+            state=DashboardImporter.IMPORT_COMPLETED,
+        ),
+        when=F["is_running"],
+    ),
+    Row(
+        Button(
+            text=I18nFormat("btn-importer-resume"),
+            id="resume",
+            on_click=on_import_resume,
+        ),
+        when=~F["is_running"] & ~F["is_finished"],
+    ),
     Row(
         Start(
             text=I18nFormat("btn-back"),
@@ -1,43 +1,45 @@
 from typing import Any
+from uuid import UUID
 
 from aiogram_dialog import DialogManager
 from dishka import FromDishka
 from dishka.integrations.aiogram_dialog import inject
-from remnawave import RemnawaveSDK
-from remnawave.models import GetAllInternalSquadsResponseDto
+
+from src.infrastructure.database.models.dto import ExportedUsersDto
+from src.services.importer import ImporterService
+from src.services.remnawave import RemnawaveService
 
 
 async def from_xui_getter(
     dialog_manager: DialogManager,
     **kwargs: Any,
 ) -> dict[str, Any]:
-    users = dialog_manager.dialog_data.get("users")
+    exported_data = dialog_manager.dialog_data.get("exported")
     has_started = dialog_manager.dialog_data.get("has_started", False)
 
-    if not users:
+    if not exported_data:
         return {"has_exported": False}
 
+    exported = ExportedUsersDto.model_validate(exported_data)
+
     return {
         "has_exported": True,
         "has_started": has_started,
-        "total": len(users["all"]),
-        "active": len(users["active"]),
-        "expired": len(users["expired"]),
+        "total": exported.total_count,
+        "active": exported.active_count,
+        "expired": exported.expired_count,
     }
 
 
 @inject
 async def squads_getter(
     dialog_manager: DialogManager,
-    remnawave: FromDishka[RemnawaveSDK],
+    remnawave_service: FromDishka[RemnawaveService],
     **kwargs: Any,
 ) -> dict[str, Any]:
-    response = await remnawave.internal_squads.get_internal_squads()
+    response = await remnawave_service.get_internal_squads()
     selected_squads = dialog_manager.dialog_data.get("selected_squads", [])
 
-    if not isinstance(response, GetAllInternalSquadsResponseDto):
-        raise ValueError("Wrong response from Remnawave")
-
     squads = [
         {
             "uuid": str(squad.uuid),
@@ -53,10 +55,16 @@ async def squads_getter(
 @inject
 async def import_completed_getter(
     dialog_manager: DialogManager,
+    importer_service: FromDishka[ImporterService],
     **kwargs: Any,
 ) -> dict[str, Any]:
-    completed: dict = dialog_manager.dialog_data["completed"]
-    return completed
+    import_id = UUID(dialog_manager.dialog_data["import_id"])
+    progress = await importer_service.get_progress(import_id)
+
+    if not progress:
+        raise ValueError(f"Import '{import_id}' not found")
+
+    return progress.model_dump()
 
 
 async def sync_completed_getter(
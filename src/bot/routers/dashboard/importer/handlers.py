@@ -1,4 +1,5 @@
 from pathlib import Path
+from uuid import UUID
 
 from aiogram import Bot
 from aiogram.types import CallbackQuery, Message
@@ -8,20 +9,20 @@ from aiogram_dialog.widgets.kbd import Button, Select
 from dishka import FromDishka
 from dishka.integrations.aiogram_dialog import inject
 from loguru import logger
-from remnawave import RemnawaveSDK
-from remnawave.models import GetAllInternalSquadsResponseDto
 
 from src.bot.states import DashboardImporter
-from src.core.constants import USER_KEY
+from src.core.constants import IMPORT_SEGMENT_ACTIVE, IMPORT_SEGMENT_EXPIRED, USER_KEY
 from src.core.utils.formatters import format_user_log as log
 from src.core.utils.message_payload import MessagePayload
-from src.infrastructure.database.models.dto import UserDto
+from src.infrastructure.database.models.dto import ExportedUsersDto, UserDto
+from src.infrastructure.importers import get_import_source_type
 from src.infrastructure.taskiq.tasks.importer import (
     import_exported_users_task,
     sync_all_users_from_panel_task,
 )
 from src.services.importer import ImporterService
 from src.services.notification import NotificationService
+from src.services.remnawave import RemnawaveService
 
 
 @inject
@@ -60,6 +61,14 @@ async def on_database_input(
         return
 
     local_file_path = Path(f"/tmp/{document.file_name}")
+
+    if not get_import_source_type(local_file_path):
+        await notification_service.notify_user(
+            user=user,
+            payload=MessagePayload(i18n_key="ntf-importer-db-invalid"),
+        )
+        return
+
     file = await bot.get_file(document.file_id)
 
     if not file.file_path:
@@ -70,7 +79,7 @@ async def on_database_input(
     logger.info(f"{log(user)} Received file: '{local_file_path}'")
 
     try:
-        users = importer_service.get_users_from_xui(local_file_path)
+        exported = await importer_service.export_users(local_file_path)
     except Exception as exception:
         logger.exception(f"Failed to parse users: {exception}")
         await notification_service.notify_user(
@@ -78,21 +87,17 @@ async def on_database_input(
             payload=MessagePayload(i18n_key="ntf-importer-db-failed"),
         )
         return
+    finally:
+        local_file_path.unlink(missing_ok=True)
 
-    if not users:
+    if not exported.total_count:
         await notification_service.notify_user(
             user=user,
             payload=MessagePayload(i18n_key="ntf-importer-exported-users-empty"),
         )
         return
 
-    active, expired = importer_service.split_active_and_expired(users)
-
-    dialog_manager.dialog_data["users"] = {
-        "all": users,
-        "active": active,
-        "expired": expired,
-    }
+    dialog_manager.dialog_data["exported"] = exported.model_dump(mode="json")
 
 
 @inject
@@ -100,14 +105,11 @@ async def on_squads(
     callback: CallbackQuery,
     widget: Button,
     dialog_manager: DialogManager,
-    remnawave: FromDishka[RemnawaveSDK],
+    remnawave_service: FromDishka[RemnawaveService],
     notification_service: FromDishka[NotificationService],
 ) -> None:
     user: UserDto = dialog_manager.middleware_data[USER_KEY]
-    response = await remnawave.internal_squads.get_internal_squads()
-
-    if not isinstance(response, GetAllInternalSquadsResponseDto):
-        raise ValueError("Wrong response from Remnawave")
+    response = await remnawave_service.get_internal_squads()
 
     if not response.internal_squads:
         await notification_service.notify_user(
@@ -145,40 +147,15 @@ async def on_import_all_xui(
     widget: Button,
     dialog_manager: DialogManager,
     notification_service: FromDishka[NotificationService],
+    importer_service: FromDishka[ImporterService],
 ) -> None:
-    user: UserDto = dialog_manager.middleware_data[USER_KEY]
-    users = dialog_manager.dialog_data["users"]
-    selected_squads = dialog_manager.dialog_data.get("selected_squads", [])
-
-    if not selected_squads:
-        await notification_service.notify_user(
-            user=user,
-            payload=MessagePayload(i18n_key="ntf-importer-internal-squads-empty"),
-        )
-        return
-
-    dialog_manager.dialog_data["has_started"] = True
-    notification = await notification_service.notify_user(
-        user=user,
-        payload=MessagePayload.not_deleted(i18n_key="ntf-importer-import-started"),
+    await _start_import(
+        dialog_manager,
+        segments=[IMPORT_SEGMENT_ACTIVE, IMPORT_SEGMENT_EXPIRED],
+        notification_service=notification_service,
+        importer_service=importer_service,
     )
 
-    task = await import_exported_users_task.kiq(users["all"], selected_squads)
-
-    logger.info(f"{log(user)} Started import '{len(users['all'])}' users")
-    result = await task.wait_result()
-    success_count, failed_count = result.return_value
-
-    if notification:
-        await notification.delete()
-
-    dialog_manager.dialog_data["completed"] = {
-        "total_count": len(users["all"]),
-        "success_count": success_count,
-        "failed_count": failed_count,
-    }
-    await dialog_manager.switch_to(state=DashboardImporter.IMPORT_COMPLETED)
-
 
 @inject
 async def on_import_active_xui(
@@ -186,9 +163,37 @@ async def on_import_active_xui(
     widget: Button,
     dialog_manager: DialogManager,
     notification_service: FromDishka[NotificationService],
+    importer_service: FromDishka[ImporterService],
+) -> None:
+    await _start_import(
+        dialog_manager,
+        segments=[IMPORT_SEGMENT_ACTIVE],
+        notification_service=notification_service,
+        importer_service=importer_service,
+    )
+
+
+@inject
+async def on_import_resume(
+    callback: CallbackQuery,
+    widget: Button,
+    dialog_manager: DialogManager,
 ) -> None:
     user: UserDto = dialog_manager.middleware_data[USER_KEY]
-    users = dialog_manager.dialog_data["users"]
+    import_id = UUID(dialog_manager.dialog_data["import_id"])
+
+    await import_exported_users_task.kiq(import_id, user)
+    logger.info(f"{log(user)} Resumed import '{import_id}'")
+
+
+async def _start_import(
+    dialog_manager: DialogManager,
+    segments: list[str],
+    notification_service: NotificationService,
+    importer_service: ImporterService,
+) -> None:
+    user: UserDto = dialog_manager.middleware_data[USER_KEY]
+    exported = ExportedUsersDto.model_validate(dialog_manager.dialog_data["exported"])
     selected_squads = dialog_manager.dialog_data.get("selected_squads", [])
 
     if not selected_squads:
@@ -199,24 +204,20 @@ async def on_import_active_xui(
         return
 
     dialog_manager.dialog_data["has_started"] = True
-    notification = await notification_service.notify_user(
+    await notification_service.notify_user(
         user=user,
-        payload=MessagePayload.not_deleted(i18n_key="ntf-importer-import-started"),
+        payload=MessagePayload(i18n_key="ntf-importer-import-started"),
     )
 
-    task = await import_exported_users_task.kiq(users["active"], selected_squads)
-    logger.info(f"{log(user)} Started import '{len(users['active'])}' users")
-    result = await task.wait_result()
-    success_count, failed_count = result.return_value
-
-    if notification:
-        await notification.delete()
+    job = await importer_service.create_import(
+        exported.export_id,
+        segments=segments,
+        active_internal_squads=[UUID(squad) for squad in selected_squads],
+    )
+    await import_exported_users_task.kiq(job.import_id, user)
+    logger.info(f"{log(user)} Started import '{job.import_id}' of '{job.total_count}' users")
 
-    dialog_manager.dialog_data["completed"] = {
-        "total_count": len(users["active"]),
-        "success_count": success_count,
-        "failed_count": failed_count,
-    }
+    dialog_manager.dialog_data["import_id"] = str(job.import_id)
     await dialog_manager.switch_to(state=DashboardImporter.IMPORT_COMPLETED)
 
 
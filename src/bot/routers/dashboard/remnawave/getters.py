@@ -5,12 +5,7 @@ from dishka import FromDishka
 from dishka.integrations.aiogram_dialog import inject
 from fluentogram import TranslatorRunner
 from remnawave import RemnawaveSDK
-from remnawave.models import (
-    GetAllHostsResponseDto,
-    GetAllInboundsResponseDto,
-    GetAllNodesResponseDto,
-    GetStatsResponseDto,
-)
+from remnawave.models import GetAllHostsResponseDto, GetAllInboundsResponseDto
 
 from src.core.i18n.translator import get_translated_kwargs
 from src.core.utils.formatters import (
@@ -19,18 +14,16 @@ from src.core.utils.formatters import (
     i18n_format_bytes_to_unit,
     i18n_format_seconds,
 )
+from src.services.remnawave import RemnawaveService
 
 
 @inject
 async def system_getter(
     dialog_manager: DialogManager,
-    remnawave: FromDishka[RemnawaveSDK],
+    remnawave_service: FromDishka[RemnawaveService],
     **kwargs: Any,
 ) -> dict[str, Any]:
-    response = await remnawave.system.get_stats()
-
-    if not isinstance(response, GetStatsResponseDto):
-        raise ValueError("Wrong response from Remnawave")
+    response = await remnawave_service.get_system_stats()
 
     return {
         "cpu_cores": response.cpu.physical_cores,
@@ -48,13 +41,10 @@ async def system_getter(
 @inject
 async def users_getter(
     dialog_manager: DialogManager,
-    remnawave: FromDishka[RemnawaveSDK],
+    remnawave_service: FromDishka[RemnawaveService],
     **kwargs: Any,
 ) -> dict[str, Any]:
-    response = await remnawave.system.get_stats()
-
-    if not isinstance(response, GetStatsResponseDto):
-        raise ValueError("Wrong response from Remnawave")
+    response = await remnawave_service.get_system_stats()
 
     return {
         "users_total": str(response.users.total_users),
@@ -99,14 +89,11 @@ async def hosts_getter(
 @inject
 async def nodes_getter(
     dialog_manager: DialogManager,
-    remnawave: FromDishka[RemnawaveSDK],
+    remnawave_service: FromDishka[RemnawaveService],
     i18n: FromDishka[TranslatorRunner],
     **kwargs: Any,
 ) -> dict[str, Any]:
-    response = await remnawave.nodes.get_all_nodes()
-
-    if not isinstance(response, GetAllNodesResponseDto):
-        raise ValueError("Wrong response from Remnawave")
+    response = await remnawave_service.get_nodes()
 
     nodes_text = []
 
@@ -0,0 +1,59 @@
+from src.bot.routers.dashboard.statistics.getters import (
+    get_promocodes_statistics,
+    get_users_statistics,
+)
+from src.core.enums import PromocodeRewardType
+
+
+def test_users_statistics_from_aggregates():
+    users_stats = {
+        "total_users": 10,
+        "new_users_daily": 1,
+        "new_users_weekly": 3,
+        "new_users_monthly": 5,
+        "users_with_subscription": 4,
+        "users_with_trial": 2,
+        "blocked_users": 1,
+        "bot_blocked_users": 0,
+        "paying_users": 0,
+        "trial_users": 0,
+        "converted_from_trial": 0,
+    }
+
+    result = get_users_statistics(users_stats)
+
+    assert result["users_without_subscription"] == 6
+    # Без платящих и триальных пользователей конверсия не считается
+    assert result["user_conversion"] == "0.00"
+    assert result["trial_conversion"] == 0
+
+
+def test_promocodes_statistics_from_aggregates():
+    promocodes_stats = [
+        {
+            "code": "DAYS",
+            "reward_type": PromocodeRewardType.DURATION,
+            "reward": 7,
+            "activations": 3,
+        },
+        {
+            "code": "GB",
+            "reward_type": PromocodeRewardType.TRAFFIC,
+            "reward": 10,
+            "activations": 5,
+        },
+    ]
+
+    result = get_promocodes_statistics(promocodes_stats)
+
+    assert result["total_promo_activations"] == 8
+    assert result["most_popular_promo"] == "GB"
+    assert result["total_promo_days"] == 21
+    assert result["total_promo_traffic"] == 50
+
+
+def test_promocodes_statistics_without_promocodes():
+    result = get_promocodes_statistics([])
+
+    assert result["total_promo_activations"] == 0
+    assert result["most_popular_promo"] == "-"
@@ -49,12 +49,13 @@ async def blacklist_getter(
     **kwargs: Any,
 ) -> dict[str, Any]:
     blocked_users = await user_service.get_blocked_users()
+    count_blocked = await user_service.count_blocked()
     count_users = await user_service.count()
 
     return {
         "blocked_users_exists": bool(blocked_users),
         "blocked_users": blocked_users,
-        "count_blocked": len(blocked_users),
+        "count_blocked": count_blocked,
         "count_users": count_users,
-        "percent": format_percent(part=len(blocked_users), whole=count_users),
+        "percent": format_percent(part=count_blocked, whole=count_users),
     }
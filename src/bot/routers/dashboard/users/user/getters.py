@@ -3,8 +3,6 @@ from typing import Any, cast
 from aiogram_dialog import DialogManager
 from dishka import FromDishka
 from dishka.integrations.aiogram_dialog import inject
-from remnawave import RemnawaveSDK
-from remnawave.models import GetAllInternalSquadsResponseDto
 
 from src.core.config import AppConfig
 from src.core.constants import DATETIME_FORMAT
@@ -229,7 +227,7 @@ async def device_limit_getter(
 async def squads_getter(
     dialog_manager: DialogManager,
     subscription_service: FromDishka[SubscriptionService],
-    remnawave: FromDishka[RemnawaveSDK],
+    remnawave_service: FromDishka[RemnawaveService],
     **kwargs: Any,
 ) -> dict[str, Any]:
     target_telegram_id = dialog_manager.dialog_data["target_telegram_id"]
@@ -238,10 +236,7 @@ async def squads_getter(
     if not subscription:
         raise ValueError(f"Current subscription for user '{target_telegram_id}' not found")
 
-    response = await remnawave.internal_squads.get_internal_squads()
-
-    if not isinstance(response, GetAllInternalSquadsResponseDto):
-        raise ValueError("Wrong response from Remnawave")
+    response = await remnawave_service.get_internal_squads()
 
     squads = [
         {
@@ -4,13 +4,12 @@ from typing import Any, Optional
 from aiogram_dialog import DialogManager
 from dishka import FromDishka
 from dishka.integrations.aiogram_dialog import inject
-from remnawave import RemnawaveSDK
-from remnawave.models import GetAllInternalSquadsResponseDto
 
 from src.core.enums import Currency, PlanAvailability, PlanType
 from src.core.utils.adapter import DialogDataAdapter
 from src.infrastructure.database.models.dto import PlanDto, PlanDurationDto, PlanPriceDto
 from src.services.plan import PlanService
+from src.services.remnawave import RemnawaveService
 
 
 @inject
@@ -161,7 +160,7 @@ async def allowed_users_getter(dialog_manager: DialogManager, **kwargs: Any) ->
 @inject
 async def squads_getter(
     dialog_manager: DialogManager,
-    remnawave: FromDishka[RemnawaveSDK],
+    remnawave_service: FromDishka[RemnawaveService],
     **kwargs: Any,
 ) -> dict[str, Any]:
     adapter = DialogDataAdapter(dialog_manager)
@@ -170,10 +169,7 @@ async def squads_getter(
     if not plan:
         raise ValueError("PlanDto not found in dialog data")
 
-    response = await remnawave.internal_squads.get_internal_squads()
-
-    if not isinstance(response, GetAllInternalSquadsResponseDto):
-        raise ValueError("Wrong response from Remnawave")
+    response = await remnawave_service.get_internal_squads()
 
     existing_squad_uuids = {squad.uuid for squad in response.internal_squads}
 
@@ -6,6 +6,7 @@ from loguru import logger
 
 from src.core.utils.formatters import format_user_log as log
 from src.infrastructure.database.models.dto import UserDto
+from src.services.channel import ChannelService
 from src.services.user import UserService
 
 # For only ChatType.PRIVATE (app/bot/filters/private.py)
@@ -30,3 +31,16 @@ async def on_blocked(
 ) -> None:
     logger.info(f"{log(user)} Bot blocked")
     await user_service.set_bot_blocked(user=user, blocked=True)
+
+
+# Keeps the cached membership of the required channel fresh (bot must be a channel admin)
+@router.chat_member()
+async def on_channel_member_updated(
+    member: ChatMemberUpdated,
+    channel_service: FromDishka[ChannelService],
+) -> None:
+    await channel_service.handle_member_updated(
+        chat=member.chat,
+        telegram_id=member.new_chat_member.user.id,
+        status=member.new_chat_member.status,
+    )
@@ -5,7 +5,13 @@ from typing import Self
 from pydantic import Field, SecretStr, field_validator
 from pydantic_core.core_schema import FieldValidationInfo
 
-from src.core.constants import API_V1, ASSETS_DIR, DOMAIN_REGEX, PAYMENTS_WEBHOOK_PATH
+from src.core.constants import (
+    API_V1,
+    ASSETS_DIR,
+    DEFAULT_TRUSTED_PROXIES,
+    DOMAIN_REGEX,
+    PAYMENTS_WEBHOOK_PATH,
+)
 from src.core.enums import Locale, PaymentGatewayType
 from src.core.utils.types import LocaleList, StringList
 
@@ -28,6 +34,7 @@ class AppConfig(BaseConfig, env_prefix="APP_"):
     crypt_key: SecretStr
     assets_dir: Path = Field(default_factory=lambda: ASSETS_DIR)
     origins: StringList = StringList("")  # for miniapp
+    trusted_proxies: StringList = StringList(list(DEFAULT_TRUSTED_PROXIES))  # for X-Forwarded-For
 
     bot: BotConfig = Field(default_factory=BotConfig)
     remnawave: RemnawaveConfig = Field(default_factory=RemnawaveConfig)
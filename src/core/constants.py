@@ -19,6 +19,14 @@ API_V1: Final[str] = "/api/v1"
 BOT_WEBHOOK_PATH: Final[str] = "/telegram"
 PAYMENTS_WEBHOOK_PATH: Final[str] = "/payments"
 REMNAWAVE_WEBHOOK_PATH: Final[str] = "/remnawave"
+DEFAULT_TRUSTED_PROXIES: Final[tuple[str, ...]] = (
+    "127.0.0.0/8",
+    "10.0.0.0/8",
+    "172.16.0.0/12",
+    "192.168.0.0/16",
+    "::1/128",
+    "fc00::/7",
+)
 
 TIMEZONE: Final[timezone] = timezone.utc
 waveshop_PREFIX: Final[str] = "rs_"
@@ -37,9 +45,70 @@ IS_SUPER_DEV_KEY: Final[str] = "is_super_dev"
 TIME_1M: Final[int] = 60
 TIME_5M: Final[int] = TIME_1M * 5
 TIME_10M: Final[int] = TIME_1M * 10
+TIME_1H: Final[int] = TIME_1M * 60
+TIME_1D: Final[int] = TIME_1H * 24
 
 RECENT_REGISTERED_MAX_COUNT: Final[int] = 25
 RECENT_ACTIVITY_MAX_COUNT: Final[int] = 25
 
 BATCH_SIZE: Final[int] = 20
 BATCH_DELAY: Final[int] = 1
+AUDIENCE_BATCH_SIZE: Final[int] = 1000
+DATABASE_BATCH_SIZE: Final[int] = 1000
+BLACKLIST_PAGE_SIZE: Final[int] = 100
+BROADCAST_LIST_MAX_COUNT: Final[int] = 70
+
+BROADCAST_RATE_LIMIT: Final[int] = 30
+BROADCAST_CHAT_RATE_LIMIT: Final[int] = 1
+BROADCAST_CONCURRENCY: Final[int] = 16
+BROADCAST_MAX_RETRIES: Final[int] = 3
+BROADCAST_CANCEL_CHECK_INTERVAL: Final[int] = 100
+BROADCAST_FLUSH_SIZE: Final[int] = 500
+BROADCAST_FLUSH_INTERVAL: Final[int] = 5
+
+STATISTICS_RECONCILE_DAYS: Final[int] = 2
+
+PANEL_SYNC_PAGE_SIZE: Final[int] = 500
+PANEL_SYNC_CONCURRENCY: Final[int] = 4
+
+IMPORT_CHUNK_SIZE: Final[int] = 500
+IMPORT_CONCURRENCY: Final[int] = 10
+IMPORT_TRANSFORM_WORKERS: Final[int] = 2
+IMPORT_TTL: Final[int] = TIME_1D
+IMPORT_LOCK_TTL: Final[int] = TIME_5M
+IMPORT_SEGMENT_ACTIVE: Final[str] = "active"
+IMPORT_SEGMENT_EXPIRED: Final[str] = "expired"
+
+REMNAWAVE_EVENTS_BATCH_SIZE: Final[int] = 500
+REMNAWAVE_EVENTS_MAXLEN: Final[int] = 100_000
+REMNAWAVE_EVENT_DEDUP_TTL: Final[int] = TIME_1D
+REMNAWAVE_EVENTS_LOCK_TTL: Final[int] = TIME_5M
+
+REMNAWAVE_CACHE_TTL: Final[int] = 30
+REMNAWAVE_CACHE_STALE_TTL: Final[int] = TIME_5M
+
+SUBSCRIPTION_UPDATE_DEBOUNCE: Final[int] = 3
+SUBSCRIPTION_UPDATE_TTL: Final[int] = TIME_10M
+SUBSCRIPTION_UPDATE_POLL_INTERVAL: Final[float] = 1.0
+SUBSCRIPTION_UPDATE_BATCH_SIZE: Final[int] = 100
+
+LOCAL_CACHE_MAXSIZE: Final[int] = 10_000
+LOCAL_CACHE_TTL: Final[int] = 10
+
+GATEWAY_HTTP_MAX_CONNECTIONS: Final[int] = 20
+GATEWAY_HTTP_MAX_KEEPALIVE: Final[int] = 10
+GATEWAY_HTTP_KEEPALIVE_EXPIRY: Final[int] = TIME_1M
+GATEWAY_RETIRE_DELAY: Final[int] = TIME_1M
+
+MESSAGE_DELETION_POLL_INTERVAL: Final[float] = 1.0
+MESSAGE_DELETION_BATCH_SIZE: Final[int] = 1000
+TELEGRAM_DELETE_MESSAGES_LIMIT: Final[int] = 100
+
+THROTTLING_NOTICE_WINDOW: Final[int] = 10
+
+CHANNEL_MEMBER_TTL: Final[int] = TIME_1D
+CHANNEL_NON_MEMBER_TTL: Final[int] = TIME_1M
+CHANNEL_REVERIFY_BATCH_SIZE: Final[int] = 100
+CHANNEL_REVERIFY_RATE: Final[int] = 20
+
+I18N_RENDER_CACHE_SIZE: Final[int] = 4096
@@ -202,6 +202,12 @@ class PaymentGatewayType(UpperStrEnum):
     ROBOKASSA = auto()
 
 
+class ImportSourceType(UpperStrEnum):
+    XUI = auto()
+    CSV = auto()
+    JSONL = auto()
+
+
 class Currency(UpperStrEnum):
     USD = auto()
     XTR = auto()
@@ -0,0 +1,90 @@
+from unittest.mock import patch
+
+import pytest
+from fluent_compiler.bundle import FluentBundle
+from fluentogram.exceptions import FormatError
+from fluentogram.translator import FluentTranslator
+
+from src.core.i18n.translator import CachedTranslatorRunner, get_translated_kwargs
+
+FTL = """
+btn-back = Назад
+msg-balance = Баланс: { $amount }
+unit-day = { $value } д.
+msg-devices = { $count ->
+    [one] Устройство { $name }
+   *[other] Устройств: { $count }
+}
+"""
+
+
+@pytest.fixture
+def runner():
+    translator = FluentTranslator("ru", FluentBundle.from_string("ru", FTL, use_isolating=False))
+    return CachedTranslatorRunner([translator])
+
+
+def test_prerender_renders_only_static_keys(runner):
+    # Act
+    count = runner.prerender()
+
+    # Assert
+    assert count == 1
+    with patch.object(runner, "_render") as render:
+        for user_id in range(5):
+            assert runner.get("btn-back", user_id=user_id) == "Назад"
+
+    # Статичный ключ не рендерится и не занимает LRU, какие бы kwargs ни пришли
+    render.assert_not_called()
+    assert len(runner._rendered) == 0
+
+
+def test_get_memoizes_by_referenced_args(runner):
+    # Act
+    with patch.object(runner, "_render", wraps=runner._render) as render:
+        first = runner.get("msg-balance", amount=10, user_id=1, dialog_data={"a": 1})
+        second = runner.get("msg-balance", amount=10, user_id=2, dialog_data={"b": 2})
+        third = runner.get("msg-balance", amount=20)
+
+    # Assert
+    # Аргументы, которые сообщение не читает, не влияют на ключ кеша
+    assert first == second == "Баланс: 10"
+    assert third == "Баланс: 20"
+    assert render.call_count == 2
+    assert len(runner._rendered) == 2
+
+
+def test_get_tracks_args_of_every_select_branch(runner):
+    # Act
+    many = runner.get("msg-devices", count=2, name="a")
+    first = runner.get("msg-devices", count=1, name="a")
+    second = runner.get("msg-devices", count=1, name="b")
+
+    # Assert
+    # Имя читается только в одной ветке, но после неё входит в ключ кеша
+    assert many == "Устройств: 2"
+    assert first == "Устройство a"
+    assert second == "Устройство b"
+
+
+def test_get_does_not_cache_format_errors(runner):
+    # Act & Assert
+    with pytest.raises(FormatError):
+        runner.get("msg-balance", dialog_data={})
+
+    assert runner.get("msg-balance", amount=1) == "Баланс: 1"
+
+
+def test_get_translated_kwargs_renders_nested_keys(runner):
+    # Act
+    result = get_translated_kwargs(
+        runner,
+        {
+            "duration": [("unit-day", {"value": 2}), ("unit-day", {"value": 3})],
+            "back": ("btn-back", {}),
+            "count": 5,
+        },
+    )
+
+    # Assert
+    assert result == {"duration": "2 д. 3 д.", "back": "Назад", "count": 5}
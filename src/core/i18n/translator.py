@@ -1,14 +1,164 @@
-from typing import Any
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Final, Hashable, Iterable, Optional
 
-from fluentogram import TranslatorRunner
+from cachetools import LRUCache
+from fluentogram import TranslatorHub, TranslatorRunner
+from fluentogram.exceptions import FormatError, KeyNotFoundError
+from fluentogram.translator import FluentTranslator
+from loguru import logger
+
+from src.core.constants import I18N_RENDER_CACHE_SIZE
+
+# Only these argument types are memoized, messages reading anything else are rendered every time
+FLUENT_ARG_TYPES = (str, int, float, Decimal, date, datetime)
+MISSING_ARG: Final[object] = object()
+
+
+class RecordingArgs(dict[str, Any]):
+    # Compiled fluent messages read arguments only via message_args[name]
+    def __init__(self, kwargs: dict[str, Any]) -> None:
+        super().__init__(kwargs)
+        self.used: set[str] = set()
+
+    def __getitem__(self, name: str) -> Any:
+        self.used.add(name)
+        return super().__getitem__(name)
+
+
+class CachedTranslatorRunner(TranslatorRunner):
+    def __init__(
+        self,
+        translators: Iterable[FluentTranslator],
+        separator: str = "-",
+        maxsize: int = I18N_RENDER_CACHE_SIZE,
+    ) -> None:
+        super().__init__(translators, separator)
+        self._static: dict[str, str] = {}
+        self._arg_names: dict[str, frozenset[str]] = {}
+        self._rendered: LRUCache[Hashable, str] = LRUCache(maxsize=maxsize)
+
+    def get(self, key: str, **kwargs: Any) -> str:
+        text = self._static.get(key)
+        if text is not None:
+            return text
+
+        # The memo key holds only the arguments the message has been seen to read,
+        # so unrelated kwargs (user ids, dialog data...) don't multiply entries
+        arg_names = self._arg_names.get(key)
+        if arg_names is not None:
+            cache_key = self._build_cache_key(key, arg_names, kwargs)
+            text = self._rendered.get(cache_key) if cache_key else None
+            if text is not None:
+                return text
+
+        text, arg_names = self._render(key, kwargs)
+
+        if not arg_names:
+            self._static[key] = text
+        elif cache_key := self._build_cache_key(key, arg_names, kwargs):
+            self._rendered[cache_key] = text
+
+        return text
+
+    def prerender(self) -> int:
+        for translator in self.translators:
+            for key in translator.translator._compiled_messages:
+                if key in self._static or not translator.translator.has_message(key):
+                    continue
+
+                try:
+                    self.get(key)
+                except FormatError:
+                    # Needs arguments, rendered on demand
+                    continue
+
+        return len(self._static)
+
+    def clear(self) -> None:
+        self._static.clear()
+        self._arg_names.clear()
+        self._rendered.clear()
+
+    def _render(self, key: str, kwargs: dict[str, Any]) -> tuple[str, frozenset[str]]:
+        for translator in self.translators:
+            args = RecordingArgs(kwargs)
+
+            try:
+                text, errors = translator.translator.format(key, args)
+            except KeyError:
+                continue
+
+            # Another select branch may read other arguments, so the names only grow
+            arg_names = self._arg_names.get(key, frozenset()) | args.used
+            self._arg_names[key] = arg_names
+
+            if errors:
+                raise FormatError(errors.pop(), key)
+            return text, arg_names
+
+        raise KeyNotFoundError(key)
+
+    def _build_cache_key(
+        self,
+        key: str,
+        arg_names: frozenset[str],
+        kwargs: dict[str, Any],
+    ) -> Optional[Hashable]:
+        args = []
+
+        for name in sorted(arg_names):
+            value = kwargs.get(name, MISSING_ARG)
+            if value is not MISSING_ARG and not isinstance(value, FLUENT_ARG_TYPES):
+                return None
+            args.append((name, type(value), value))
+
+        return key, tuple(args)
+
+
+class CachedTranslatorHub(TranslatorHub):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._runners: dict[str, CachedTranslatorRunner] = {}
+
+    def get_translator_by_locale(self, locale: str) -> TranslatorRunner:
+        runner = self._runners.get(locale)
+
+        if runner is None:
+            translators = self.storage.get_translators_for_language(locale)
+            if not translators:
+                translators = self.storage.get_translators_for_language(self.root_locale)
+
+            runner = CachedTranslatorRunner(translators=translators, separator=self.separator)
+            self._runners[locale] = runner
+
+        return runner
+
+    def prerender(self, locales: Iterable[str]) -> None:
+        for locale in locales:
+            runner = self.get_translator_by_locale(locale)
+            if isinstance(runner, CachedTranslatorRunner):
+                logger.debug(f"Pre-rendered '{runner.prerender()}' static keys for '{locale}'")
+
+    async def update_translation(self, locale: str, key: str, value: str) -> bool:
+        updated = await super().update_translation(locale, key, value)
+
+        for runner in self._runners.values():
+            runner.clear()
+
+        return updated
 
 
 def get_translated_kwargs(i18n: TranslatorRunner, kwargs: dict[str, Any]) -> dict[str, Any]:
     result: dict[str, Any] = {}
 
     for k, v in kwargs.items():
+        # scalars are by far the most common, skip the pattern checks for them
+        if not isinstance(v, (tuple, list, dict)):
+            result[k] = v
+
         # case ("key", {"value": 5})
-        if (
+        elif (
             isinstance(v, tuple)
             and len(v) == 2
             and isinstance(v[0], str)
@@ -0,0 +1,92 @@
+from bisect import bisect_right
+from ipaddress import IPv6Address, ip_address, ip_network
+from typing import Iterable, Optional
+
+
+class IpAllowlist:
+    __slots__ = ("_ranges",)
+
+    _ranges: dict[int, tuple[list[int], list[int]]]
+
+    def __init__(self, networks: Iterable[str]) -> None:
+        intervals: dict[int, list[tuple[int, int]]] = {4: [], 6: []}
+
+        for network in networks:
+            if not network.strip():
+                continue
+            parsed = ip_network(network.strip(), strict=False)
+            intervals[parsed.version].append(
+                (int(parsed.network_address), int(parsed.broadcast_address))
+            )
+
+        self._ranges = {version: self._merge(ranges) for version, ranges in intervals.items()}
+
+    def __contains__(self, ip: object) -> bool:
+        if not isinstance(ip, str):
+            return False
+
+        try:
+            address = ip_address(ip)
+        except ValueError:
+            return False
+
+        if isinstance(address, IPv6Address) and address.ipv4_mapped:
+            address = address.ipv4_mapped
+
+        starts, ends = self._ranges[address.version]
+        value = int(address)
+        index = bisect_right(starts, value) - 1
+        return index >= 0 and value <= ends[index]
+
+    def __bool__(self) -> bool:
+        return any(starts for starts, _ in self._ranges.values())
+
+    @staticmethod
+    def _merge(ranges: list[tuple[int, int]]) -> tuple[list[int], list[int]]:
+        starts: list[int] = []
+        ends: list[int] = []
+
+        for start, end in sorted(ranges):
+            if ends and start <= ends[-1] + 1:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+
+        return starts, ends
+
+
+def _strip_port(value: str) -> str:
+    value = value.strip()
+
+    if value.startswith("["):
+        return value[1 : value.find("]")] if "]" in value else value
+    if value.count(":") == 1:
+        return value.split(":", 1)[0]
+
+    return value
+
+
+def get_client_ip(
+    peer: Optional[str],
+    forwarded_for: Iterable[str],
+    trusted_proxies: IpAllowlist,
+) -> Optional[str]:
+    if peer is None:
+        return None
+
+    chain = [
+        _strip_port(entry)
+        for header in forwarded_for
+        for entry in header.split(",")
+        if entry.strip()
+    ]
+    chain.append(peer)
+
+    # Walk from the nearest hop and stop at the first address we don't operate ourselves,
+    # anything to the left of it is client-controlled and can be spoofed
+    for ip in reversed(chain):
+        if ip not in trusted_proxies:
+            return ip
+
+    return chain[0]
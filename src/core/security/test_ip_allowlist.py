@@ -0,0 +1,46 @@
+from src.core.security.ip_allowlist import IpAllowlist, get_client_ip
+
+TRUSTED_PROXIES = IpAllowlist(["127.0.0.1", "10.0.0.0/8"])
+
+
+def test_allowlist_matches_v4_and_v6_ranges():
+    allowlist = IpAllowlist(["185.71.76.0/27", "77.75.156.11", "2a02:5180:0:1509::/64"])
+
+    assert "185.71.76.31" in allowlist
+    assert "185.71.76.32" not in allowlist
+    assert "77.75.156.11" in allowlist
+    assert "77.75.156.12" not in allowlist
+    assert "2a02:5180:0:1509::1" in allowlist
+    assert "2a02:5180:0:1510::1" not in allowlist
+
+
+def test_allowlist_merges_overlapping_networks():
+    allowlist = IpAllowlist(["10.0.0.0/24", "10.0.0.128/25", "10.0.1.0/24"])
+
+    # Пересекающиеся и соседние сети склеиваются в один интервал
+    assert allowlist._ranges[4][0] == [int.from_bytes(bytes([10, 0, 0, 0]), "big")]
+    assert "10.0.1.255" in allowlist
+
+
+def test_allowlist_handles_garbage_and_mapped_addresses():
+    allowlist = IpAllowlist(["185.71.76.0/27"])
+
+    assert "not-an-ip" not in allowlist
+    assert "" not in allowlist
+    assert "::ffff:185.71.76.1" in allowlist
+    assert not IpAllowlist([""])
+
+
+def test_get_client_ip_ignores_forwarded_for_from_untrusted_peer():
+    # Клиент напрямую подставил X-Forwarded-For — заголовку не верим
+    assert get_client_ip("8.8.8.8", ["185.71.76.1"], TRUSTED_PROXIES) == "8.8.8.8"
+
+
+def test_get_client_ip_walks_chain_through_trusted_proxies():
+    forwarded_for = ["185.71.76.1, 203.0.113.7:443", "10.0.0.5"]
+
+    # Левее первого недоверенного адреса значения подконтрольны клиенту
+    assert get_client_ip("127.0.0.1", forwarded_for, TRUSTED_PROXIES) == "203.0.113.7"
+    assert get_client_ip("127.0.0.1", ["[2a02:5180::1]:443"], TRUSTED_PROXIES) == "2a02:5180::1"
+    assert get_client_ip("127.0.0.1", [], TRUSTED_PROXIES) == "127.0.0.1"
+    assert get_client_ip(None, ["185.71.76.1"], TRUSTED_PROXIES) is None
@@ -1,3 +1,5 @@
+from uuid import UUID
+
 from src.core.storage.key_builder import StorageKey
 
 
@@ -13,3 +15,71 @@ class RecentRegisteredUsersKey(StorageKey, prefix="recent_registered_users"): ..
 
 
 class RecentActivityUsersKey(StorageKey, prefix="recent_activity_users"): ...
+
+
+class BroadcastCancelKey(StorageKey, prefix="broadcast_cancel"):
+    task_id: UUID
+
+
+class BroadcastDeletionKey(StorageKey, prefix="broadcast_deletion"):
+    task_id: UUID
+
+
+class ImportKey(StorageKey, prefix="import"):
+    import_id: UUID
+
+
+class ExportedUsersKey(StorageKey, prefix="exported_users"):
+    export_id: UUID
+    segment: str
+
+
+class ImportCheckpointKey(StorageKey, prefix="import_checkpoint"):
+    import_id: UUID
+
+
+class ImportLockKey(StorageKey, prefix="import_lock"):
+    import_id: UUID
+
+
+class RemnawaveEventsKey(StorageKey, prefix="remnawave_events"): ...
+
+
+class RemnawaveEventsLockKey(StorageKey, prefix="remnawave_events_lock"): ...
+
+
+class RemnawaveEventsScheduledKey(StorageKey, prefix="remnawave_events_scheduled"): ...
+
+
+class RemnawaveEventKey(StorageKey, prefix="remnawave_event"):
+    event: str
+    uuid: str
+    timestamp: int
+
+
+class SubscriptionUpdateKey(StorageKey, prefix="subscription_update"):
+    telegram_id: int
+
+
+class SubscriptionUpdateQueueKey(StorageKey, prefix="subscription_update_queue"): ...
+
+
+class MessageDeletionQueueKey(StorageKey, prefix="message_deletion_queue"): ...
+
+
+class ThrottlingKey(StorageKey, prefix="throttling"):
+    telegram_id: int
+    event_type: str
+
+
+class ThrottlingNoticeKey(StorageKey, prefix="throttling_notice"):
+    telegram_id: int
+
+
+class ChannelMemberKey(StorageKey, prefix="channel_member"):
+    chat_id: str
+    telegram_id: int
+
+
+class ChannelMembersKey(StorageKey, prefix="channel_members"):
+    chat_id: str
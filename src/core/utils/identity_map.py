@@ -0,0 +1,28 @@
+from typing import Any, Hashable
+
+
+class IdentityMap:
+    _entries: dict[tuple[str, Hashable], Any]
+
+    def __init__(self) -> None:
+        self._entries = {}
+
+    def __contains__(self, key: tuple[str, Hashable]) -> bool:
+        return key in self._entries
+
+    def __getitem__(self, key: tuple[str, Hashable]) -> Any:
+        return self._entries[key]
+
+    def __setitem__(self, key: tuple[str, Hashable], value: Any) -> None:
+        self._entries[key] = value
+
+    def evict(self, *keys: tuple[str, Hashable]) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def evict_namespace(self, namespace: str) -> None:
+        for key in [key for key in self._entries if key[0] == namespace]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -1,3 +1,4 @@
+from itertools import islice
 from typing import Iterable, Iterator, List, TypeVar
 
 T = TypeVar("T")
@@ -12,3 +13,7 @@ def chunked(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
             chunk = []
     if chunk:
         yield chunk
+
+
+def take(iterator: Iterator[T], size: int) -> List[T]:
+    return list(islice(iterator, size))
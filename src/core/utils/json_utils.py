@@ -3,6 +3,7 @@ from typing import Any, Callable, Final
 from msgspec.json import Decoder, Encoder
 
 decode: Final[Callable[..., Any]] = Decoder[dict[str, Any]]().decode
+decode_any: Final[Callable[..., Any]] = Decoder().decode
 bytes_encode: Final[Callable[..., bytes]] = Encoder().encode
 
 
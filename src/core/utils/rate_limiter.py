@@ -0,0 +1,71 @@
+import asyncio
+import time
+from typing import Optional
+
+from cachetools import TTLCache
+
+from src.core.constants import TIME_1M
+
+
+class TokenBucket:
+    rate: float
+    capacity: float
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        now = time.monotonic()
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._tokens = 0
+        self._updated_at = self._paused_until
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(now - self._updated_at, 0)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+
+class RateLimiter:
+    global_bucket: TokenBucket
+    chat_rate: float
+
+    def __init__(self, global_rate: float, chat_rate: float) -> None:
+        self.global_bucket = TokenBucket(rate=global_rate)
+        self.chat_rate = chat_rate
+        self._chat_buckets: TTLCache[int, TokenBucket] = TTLCache(maxsize=10_000, ttl=TIME_1M)
+
+    async def acquire(self, chat_id: int) -> None:
+        bucket = self._chat_buckets.get(chat_id)
+
+        if bucket is None:
+            bucket = TokenBucket(rate=self.chat_rate, capacity=1)
+            self._chat_buckets[chat_id] = bucket
+
+        await bucket.acquire()
+        await self.global_bucket.acquire()
+
+    def pause(self, seconds: float) -> None:
+        self.global_bucket.pause(seconds)
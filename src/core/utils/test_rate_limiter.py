@@ -0,0 +1,52 @@
+import time
+
+import pytest
+
+from src.core.utils.rate_limiter import RateLimiter, TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_up_to_capacity():
+    bucket = TokenBucket(rate=10, capacity=3)
+
+    started = time.monotonic()
+    for _ in range(3):
+        await bucket.acquire()
+
+    assert time.monotonic() - started < 0.05
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_throttles_after_burst():
+    bucket = TokenBucket(rate=20, capacity=1)
+
+    started = time.monotonic()
+    for _ in range(3):
+        await bucket.acquire()
+
+    # Первый токен сразу, ещё два по 1/20 секунды
+    assert time.monotonic() - started >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_pause_blocks_acquire():
+    bucket = TokenBucket(rate=100)
+    bucket.pause(0.1)
+
+    started = time.monotonic()
+    await bucket.acquire()
+
+    assert time.monotonic() - started >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_limits_each_chat_separately():
+    limiter = RateLimiter(global_rate=100, chat_rate=10)
+
+    started = time.monotonic()
+    await limiter.acquire(chat_id=1)
+    await limiter.acquire(chat_id=2)
+    assert time.monotonic() - started < 0.05
+
+    await limiter.acquire(chat_id=1)
+    assert time.monotonic() - started >= 0.09
@@ -0,0 +1,41 @@
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_statistics",
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("registrations", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("trial_starts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("trial_conversions", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("first_payments", sa.Integer(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("date"),
+    )
+    op.create_table(
+        "daily_gateway_statistics",
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column(
+            "gateway_type",
+            postgresql.ENUM(name="payment_gateway_type", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("completed_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("paid_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("revenue", sa.Numeric(), server_default="0", nullable=False),
+        sa.Column("discount", sa.Numeric(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("date", "gateway_type"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("daily_gateway_statistics")
+    op.drop_table("daily_statistics")
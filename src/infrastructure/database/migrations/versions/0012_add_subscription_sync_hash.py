@@ -0,0 +1,17 @@
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("subscriptions", sa.Column("sync_hash", sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("subscriptions", "sync_hash")
@@ -1,5 +1,6 @@
 from .base import BaseDto, TrackableDto
-from .broadcast import BroadcastDto, BroadcastMessageDto
+from .broadcast import BroadcastDeletionDto, BroadcastDto, BroadcastMessageDto
+from .importer import ExportedUsersDto, ImportChunkResultDto, ImportDto, ImportProgressDto
 from .payment_gateway import (
     AnyGatewaySettingsDto,
     CryptomusGatewaySettingsDto,
@@ -14,7 +15,12 @@ from .payment_gateway import (
 from .plan import PlanDto, PlanDurationDto, PlanPriceDto, PlanSnapshotDto
 from .promocode import PromocodeActivationDto, PromocodeDto
 from .settings import SettingsDto, SystemNotificationDto, UserNotificationDto
-from .subscription import BaseSubscriptionDto, RemnaSubscriptionDto, SubscriptionDto
+from .subscription import (
+    BaseSubscriptionDto,
+    RemnaSubscriptionDto,
+    SubscriptionDto,
+    SubscriptionUpdateDto,
+)
 from .transaction import BaseTransactionDto, PriceDetailsDto, TransactionDto
 from .user import BaseUserDto, UserDto
 
@@ -31,8 +37,13 @@ PaymentGatewayDto.model_rebuild()
 
 __all__ = [
     "BaseDto",
+    "BroadcastDeletionDto",
     "BroadcastDto",
     "BroadcastMessageDto",
+    "ExportedUsersDto",
+    "ImportChunkResultDto",
+    "ImportDto",
+    "ImportProgressDto",
     "TrackableDto",
     "AnyGatewaySettingsDto",
     "CryptomusGatewaySettingsDto",
@@ -54,6 +65,7 @@ __all__ = [
     "UserNotificationDto",
     "SubscriptionDto",
     "RemnaSubscriptionDto",
+    "SubscriptionUpdateDto",
     "PriceDetailsDto",
     "TransactionDto",
     "UserDto",
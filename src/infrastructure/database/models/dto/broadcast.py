@@ -8,7 +8,7 @@ from src.core.enums import BroadcastAudience, BroadcastMessageStatus, BroadcastS
 from src.core.utils.message_payload import MessagePayload
 from src.core.utils.time import datetime_now
 
-from .base import TrackableDto
+from .base import BaseDto, TrackableDto
 
 
 class BroadcastDto(TrackableDto):
@@ -45,3 +45,10 @@ class BroadcastMessageDto(TrackableDto):
     message_id: Optional[int] = None
 
     status: BroadcastMessageStatus
+
+
+class BroadcastDeletionDto(BaseDto):
+    total_count: int = 0
+    deleted_count: int = 0
+    failed_count: int = 0
+    is_finished: bool = False
@@ -0,0 +1,39 @@
+from uuid import UUID
+
+from .base import BaseDto
+
+
+class ExportedUsersDto(BaseDto):
+    export_id: UUID
+    active_count: int = 0
+    expired_count: int = 0
+
+    @property
+    def total_count(self) -> int:
+        return self.active_count + self.expired_count
+
+
+class ImportDto(BaseDto):
+    import_id: UUID
+    export_id: UUID
+    total_count: int
+    chunks: list[tuple[str, int, int]]
+    active_internal_squads: list[UUID]
+
+    @property
+    def chunks_count(self) -> int:
+        return len(self.chunks)
+
+
+class ImportChunkResultDto(BaseDto):
+    chunk: int
+    success_count: int = 0
+    failed_count: int = 0
+
+
+class ImportProgressDto(BaseDto):
+    total_count: int = 0
+    success_count: int = 0
+    failed_count: int = 0
+    is_running: bool = False
+    is_finished: bool = False
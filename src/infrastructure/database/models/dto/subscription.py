@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+import hashlib
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
+from src.core.utils import json_utils
 from src.core.utils.formatters import format_bytes_to_gb, format_device_count
 
 if TYPE_CHECKING:
@@ -34,6 +36,22 @@ class RemnaSubscriptionDto(BaseModel):
     internal_squads: list[UUID]
     external_squad: Optional[UUID] = None
 
+    SYNC_FIELDS: ClassVar[frozenset[str]] = frozenset(
+        {"status", "expire_at", "url", "traffic_limit", "device_limit", "internal_squads"}
+    )
+
+    @property
+    def fingerprint(self) -> str:
+        data = (
+            self.status,
+            self.expire_at,
+            self.url,
+            self.traffic_limit,
+            self.device_limit,
+            sorted(str(squad) for squad in self.internal_squads),
+        )
+        return hashlib.blake2b(json_utils.bytes_encode(data), digest_size=16).hexdigest()
+
     @classmethod
     def from_remna_user(cls, user: dict[str, Any]) -> "RemnaSubscriptionDto":
         def get_field(*keys: str, default: Any = None) -> Any:
@@ -64,6 +82,15 @@ class RemnaSubscriptionDto(BaseModel):
         )
 
 
+class SubscriptionUpdateDto(BaseModel):
+    remna_subscription: Optional[RemnaSubscriptionDto] = None
+    status: Optional[SubscriptionStatus] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return self.remna_subscription is None and self.status is None
+
+
 class BaseSubscriptionDto(TrackableDto):
     id: Optional[int] = Field(default=None, frozen=True)
 
@@ -80,6 +107,7 @@ class BaseSubscriptionDto(TrackableDto):
     url: str
 
     plan: "PlanSnapshotDto"
+    sync_hash: Optional[str] = None
 
     created_at: Optional[datetime] = Field(default=None, frozen=True)
     updated_at: Optional[datetime] = Field(default=None, frozen=True)
@@ -135,12 +163,18 @@ class SubscriptionDto(BaseSubscriptionDto):
     user: Optional["BaseUserDto"] = None
 
     def apply_sync(self, sync_data: RemnaSubscriptionDto) -> SubscriptionDto:
-        for field in type(sync_data).model_fields:
-            if hasattr(self, field):
-                old_value = getattr(self, field)
-                new_value = getattr(sync_data, field)
-                if old_value != new_value:
-                    setattr(self, field, new_value)
-                    logger.info(f"Field '{field}' updated: '{old_value}' → '{new_value}'")
+        fingerprint = sync_data.fingerprint
+
+        if self.sync_hash == fingerprint:
+            logger.debug(f"Subscription '{self.id}' is already in sync with panel")
+            return self
+
+        for field in sync_data.SYNC_FIELDS:
+            old_value = getattr(self, field)
+            new_value = getattr(sync_data, field)
+            if old_value != new_value:
+                setattr(self, field, new_value)
+                logger.info(f"Field '{field}' updated: '{old_value}' → '{new_value}'")
 
+        self.sync_hash = fingerprint
         return self
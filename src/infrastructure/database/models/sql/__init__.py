@@ -4,6 +4,7 @@ from .payment_gateway import PaymentGateway
 from .plan import Plan, PlanDuration, PlanPrice
 from .promocode import Promocode, PromocodeActivation
 from .settings import Settings
+from .statistics import DailyGatewayStatistics, DailyStatistics
 from .subscription import Subscription
 from .transaction import Transaction
 from .user import User
@@ -12,6 +13,8 @@ __all__ = [
     "BaseSql",
     "Broadcast",
     "BroadcastMessage",
+    "DailyGatewayStatistics",
+    "DailyStatistics",
     "PaymentGateway",
     "Plan",
     "PlanDuration",
@@ -0,0 +1,40 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Date, Enum, Integer, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.enums import PaymentGatewayType
+
+from .base import BaseSql
+
+
+class DailyStatistics(BaseSql):
+    __tablename__ = "daily_statistics"
+
+    date: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    registrations: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    trial_starts: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    trial_conversions: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    first_payments: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+
+
+class DailyGatewayStatistics(BaseSql):
+    __tablename__ = "daily_gateway_statistics"
+
+    date: Mapped[date] = mapped_column(Date, primary_key=True)
+    gateway_type: Mapped[PaymentGatewayType] = mapped_column(
+        Enum(
+            PaymentGatewayType,
+            name="payment_gateway_type",
+            create_constraint=True,
+            validate_strings=True,
+        ),
+        primary_key=True,
+    )
+
+    completed_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    paid_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    revenue: Mapped[Decimal] = mapped_column(Numeric, nullable=False, server_default="0")
+    discount: Mapped[Decimal] = mapped_column(Numeric, nullable=False, server_default="0")
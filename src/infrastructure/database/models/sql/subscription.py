@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from .user import User
@@ -51,6 +51,7 @@ class Subscription(BaseSql, TimestampMixin):
     url: Mapped[str] = mapped_column(String, nullable=False)
 
     plan: Mapped[PlanSnapshotDto] = mapped_column(JSON, nullable=False)
+    sync_hash: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
 
     user: Mapped["User"] = relationship(
         "User",
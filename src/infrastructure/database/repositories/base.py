@@ -1,9 +1,10 @@
-from typing import Any, Optional, Type, TypeVar, Union, cast
+from typing import Any, AsyncIterator, Optional, Type, TypeVar, Union, cast
 
 from sqlalchemy import ColumnExpressionArgument, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import InstrumentedAttribute
 
+from src.core.constants import DATABASE_BATCH_SIZE
 from src.infrastructure.database.models.sql import BaseSql
 
 T = TypeVar("T", bound=BaseSql)
@@ -70,6 +71,36 @@ class BaseRepository:
         result = await self.session.execute(query)
         return list(result.unique().scalars().all())
 
+    async def iter_batches(
+        self,
+        model: ModelType[T],
+        *conditions: ConditionType,
+        order_by: InstrumentedAttribute[Any],
+        batch_size: int = DATABASE_BATCH_SIZE,
+        descending: bool = False,
+    ) -> AsyncIterator[list[T]]:
+        last_value: Any = None
+
+        while True:
+            query = select(model).where(*conditions)
+
+            if last_value is not None:
+                query = query.where(order_by < last_value if descending else order_by > last_value)
+
+            query = query.order_by(order_by.desc() if descending else order_by.asc())
+            result = await self.session.execute(query.limit(batch_size))
+            batch = list(result.unique().scalars().all())
+
+            if not batch:
+                return
+
+            yield batch
+
+            if len(batch) < batch_size:
+                return
+
+            last_value = getattr(batch[-1], order_by.key)
+
     async def _update(
         self,
         model: ModelType[T],
@@ -1,7 +1,11 @@
-from typing import Any, Optional
+from datetime import datetime
+from typing import Any, AsyncIterator, Optional
 from uuid import UUID
 
-from src.core.enums import BroadcastStatus
+from sqlalchemy import BigInteger, Integer, cast, column, insert, update, values
+
+from src.core.constants import DATABASE_BATCH_SIZE
+from src.core.enums import BroadcastMessageStatus, BroadcastStatus
 from src.infrastructure.database.models.sql import Broadcast, BroadcastMessage
 
 from .base import BaseRepository
@@ -11,14 +15,35 @@ class BroadcastRepository(BaseRepository):
     async def create(self, broadcast: Broadcast) -> Broadcast:
         return await self.create_instance(broadcast)
 
-    async def create_messages(self, messages: list[BroadcastMessage]) -> list[BroadcastMessage]:
-        return await self.create_instances(messages)
+    async def create_messages(self, messages: list[dict[str, Any]]) -> list[BroadcastMessage]:
+        if not messages:
+            return []
+
+        result = await self.session.scalars(
+            # Bulk RETURNING rows only follow the parameter order when asked to
+            insert(BroadcastMessage).returning(BroadcastMessage, sort_by_parameter_order=True),
+            messages,
+        )
+        return list(result.all())
 
     async def get(self, task_id: UUID) -> Optional[Broadcast]:
         return await self._get_one(Broadcast, Broadcast.task_id == task_id)
 
-    async def get_all(self) -> list[Broadcast]:
-        return await self._get_many(Broadcast, order_by=Broadcast.id.asc())
+    async def get_recent(self, limit: int) -> list[Broadcast]:
+        return await self._get_many(Broadcast, order_by=Broadcast.id.desc(), limit=limit)
+
+    def iter_finished_before(
+        self,
+        created_before: datetime,
+        batch_size: int = DATABASE_BATCH_SIZE,
+    ) -> AsyncIterator[list[Broadcast]]:
+        return self.iter_batches(
+            Broadcast,
+            Broadcast.status != BroadcastStatus.PROCESSING,
+            Broadcast.created_at < created_before,
+            order_by=Broadcast.id,
+            batch_size=batch_size,
+        )
 
     async def get_message_by_user(
         self, broadcast_id: int, user_id: int
@@ -29,6 +54,31 @@ class BroadcastRepository(BaseRepository):
             BroadcastMessage.user_id == user_id,
         )
 
+    def iter_messages_by_status(
+        self,
+        broadcast_id: int,
+        statuses: list[BroadcastMessageStatus],
+        batch_size: int = DATABASE_BATCH_SIZE,
+    ) -> AsyncIterator[list[BroadcastMessage]]:
+        return self.iter_batches(
+            BroadcastMessage,
+            BroadcastMessage.broadcast_id == broadcast_id,
+            BroadcastMessage.status.in_(statuses),
+            order_by=BroadcastMessage.id,
+            batch_size=batch_size,
+        )
+
+    async def count_messages_by_status(
+        self,
+        broadcast_id: int,
+        statuses: list[BroadcastMessageStatus],
+    ) -> int:
+        return await self._count(
+            BroadcastMessage,
+            BroadcastMessage.broadcast_id == broadcast_id,
+            BroadcastMessage.status.in_(statuses),
+        )
+
     async def update(self, task_id: UUID, **data: Any) -> Optional[Broadcast]:
         return await self._update(Broadcast, Broadcast.task_id == task_id, **data)
 
@@ -41,3 +91,29 @@ class BroadcastRepository(BaseRepository):
             BroadcastMessage.user_id == user_id,
             **data,
         )
+
+    async def delete_messages(self, broadcast_id: int) -> int:
+        return await self._delete(BroadcastMessage, BroadcastMessage.broadcast_id == broadcast_id)
+
+    async def update_messages(
+        self,
+        messages: list[tuple[int, Optional[int], BroadcastMessageStatus]],
+    ) -> None:
+        if not messages:
+            return
+
+        data = values(
+            column("id", Integer),
+            column("message_id", BigInteger),
+            column("status", BroadcastMessage.__table__.c.status.type),
+            name="data",
+        ).data(messages)
+
+        await self.session.execute(
+            update(BroadcastMessage)
+            .where(BroadcastMessage.id == data.c.id)
+            .values(
+                message_id=cast(data.c.message_id, BigInteger),
+                status=data.c.status,
+            )
+        )
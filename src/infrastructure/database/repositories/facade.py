@@ -5,6 +5,7 @@ from .payment_gateway import PaymentGatewayRepository
 from .plan import PlanRepository
 from .promocode import PromocodeRepository
 from .settings import SettingsRepository
+from .statistics import StatisticsRepository
 from .subscription import SubscriptionRepository
 from .transaction import TransactionRepository
 from .user import UserRepository
@@ -21,6 +22,7 @@ class RepositoriesFacade:
     users: UserRepository
     settings: SettingsRepository
     broadcasts: BroadcastRepository
+    statistics: StatisticsRepository
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
@@ -33,3 +35,4 @@ class RepositoriesFacade:
         self.users = UserRepository(session)
         self.settings = SettingsRepository(session)
         self.broadcasts = BroadcastRepository(session)
+        self.statistics = StatisticsRepository(session)
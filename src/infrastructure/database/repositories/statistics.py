@@ -0,0 +1,388 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Optional
+
+from sqlalchemy import (
+    ColumnElement,
+    Date,
+    Numeric,
+    Select,
+    SQLColumnExpression,
+    cast,
+    delete,
+    exists,
+    extract,
+    func,
+    not_,
+    or_,
+    select,
+)
+from sqlalchemy.dialects.postgresql import Insert, insert
+
+from src.core.enums import PaymentGatewayType, SubscriptionStatus, TransactionStatus
+from src.infrastructure.database.models.sql import (
+    DailyGatewayStatistics,
+    DailyStatistics,
+    Promocode,
+    PromocodeActivation,
+    Subscription,
+    Transaction,
+    User,
+)
+
+from .base import BaseRepository, ModelType, T
+
+FINAL_AMOUNT = cast(Transaction.pricing["final_amount"].as_string(), Numeric)
+ORIGINAL_AMOUNT = cast(Transaction.pricing["original_amount"].as_string(), Numeric)
+SUBSCRIPTION_PLAN_ID = Subscription.plan["id"].as_integer()
+SUBSCRIPTION_PLAN_DURATION = Subscription.plan["duration"].as_integer()
+TRANSACTION_PLAN_ID = Transaction.plan["id"].as_integer()
+
+
+def utc_date(column: SQLColumnExpression[datetime]) -> ColumnElement[date]:
+    return cast(func.timezone("UTC", column), Date)
+
+
+def utc_day(moment: datetime) -> date:
+    return moment.astimezone(timezone.utc).date()
+
+
+class StatisticsRepository(BaseRepository):
+    async def get_users_statistics(self, now: datetime) -> dict[str, Any]:
+        users_query = (
+            select(
+                func.count().label("total_users"),
+                func.count(Subscription.id).label("users_with_subscription"),
+                func.count().filter(Subscription.is_trial.is_(True)).label("users_with_trial"),
+                func.count().filter(User.is_blocked.is_(True)).label("blocked_users"),
+                func.count().filter(User.is_bot_blocked.is_(True)).label("bot_blocked_users"),
+            )
+            .select_from(User)
+            .outerjoin(Subscription, Subscription.id == User.current_subscription_id)
+        )
+        users = (await self.session.execute(users_query)).mappings().one()
+
+        today = utc_day(now)
+        daily = DailyStatistics.date > today - timedelta(days=1)
+        weekly = DailyStatistics.date > today - timedelta(days=8)
+        monthly = DailyStatistics.date > today - timedelta(days=31)
+
+        rollups_query = select(
+            self._sum(DailyStatistics.registrations, daily).label("new_users_daily"),
+            self._sum(DailyStatistics.registrations, weekly).label("new_users_weekly"),
+            self._sum(DailyStatistics.registrations, monthly).label("new_users_monthly"),
+            self._sum(DailyStatistics.first_payments).label("paying_users"),
+            self._sum(DailyStatistics.trial_starts).label("trial_users"),
+            self._sum(DailyStatistics.trial_conversions).label("converted_from_trial"),
+        )
+        rollups = (await self.session.execute(rollups_query)).mappings().one()
+
+        return {**users, **rollups}
+
+    async def get_transactions_statistics(self, now: datetime) -> dict[str, Any]:
+        today = utc_day(now)
+        daily = DailyGatewayStatistics.date > today - timedelta(days=1)
+        weekly = DailyGatewayStatistics.date > today - timedelta(days=8)
+        monthly = DailyGatewayStatistics.date > today - timedelta(days=31)
+
+        gateways_query = (
+            select(
+                DailyGatewayStatistics.gateway_type,
+                self._sum(DailyGatewayStatistics.revenue).label("total"),
+                self._sum(DailyGatewayStatistics.revenue, daily).label("daily"),
+                self._sum(DailyGatewayStatistics.revenue, weekly).label("weekly"),
+                self._sum(DailyGatewayStatistics.revenue, monthly).label("monthly"),
+                self._sum(DailyGatewayStatistics.completed_count).label("completed"),
+                self._sum(DailyGatewayStatistics.discount).label("discount"),
+                self._sum(DailyGatewayStatistics.paid_count).label("paid_count"),
+            )
+            .group_by(DailyGatewayStatistics.gateway_type)
+            .having(func.sum(DailyGatewayStatistics.completed_count) > 0)
+        )
+        gateways = [dict(row) for row in (await self.session.execute(gateways_query)).mappings()]
+
+        completed_transactions = sum(row["completed"] for row in gateways)
+        paid_transactions = sum(row["paid_count"] for row in gateways)
+
+        return {
+            "total_transactions": await self._count(Transaction),
+            "completed_transactions": completed_transactions,
+            "free_transactions": completed_transactions - paid_transactions,
+            "gateways": gateways,
+        }
+
+    async def get_subscriptions_statistics(self, now: datetime) -> dict[str, Any]:
+        is_active = Subscription.status == SubscriptionStatus.ACTIVE
+        query = select(
+            func.count().filter(is_active).label("total_active_subscriptions"),
+            func.count()
+            .filter(Subscription.status == SubscriptionStatus.EXPIRED)
+            .label("total_expire_subscriptions"),
+            func.count()
+            .filter(is_active, Subscription.is_trial.is_(True))
+            .label("active_trial_subscriptions"),
+            func.count()
+            .filter(
+                is_active,
+                Subscription.expire_at >= now,
+                Subscription.expire_at < now + timedelta(days=8),
+            )
+            .label("expiring_subscriptions"),
+            func.count()
+            .filter(
+                is_active,
+                or_(
+                    Subscription.device_limit <= 0,
+                    Subscription.traffic_limit <= 0,
+                    extract("year", Subscription.expire_at) == 2099,
+                ),
+            )
+            .label("total_unlimited"),
+            func.count().filter(is_active, Subscription.traffic_limit != -1).label("total_traffic"),
+            func.count().filter(is_active, Subscription.device_limit != -1).label("total_devices"),
+        ).select_from(Subscription)
+
+        return dict((await self.session.execute(query)).mappings().one())
+
+    async def get_plans_statistics(self) -> dict[str, Any]:
+        subscriptions_query = select(
+            SUBSCRIPTION_PLAN_ID.label("plan_id"),
+            func.count().label("total_subscriptions"),
+            func.count()
+            .filter(Subscription.status == SubscriptionStatus.ACTIVE)
+            .label("active_subscriptions"),
+        ).group_by(SUBSCRIPTION_PLAN_ID)
+
+        durations_query = select(
+            SUBSCRIPTION_PLAN_ID.label("plan_id"),
+            SUBSCRIPTION_PLAN_DURATION.label("duration"),
+            func.count().label("count"),
+        ).group_by(SUBSCRIPTION_PLAN_ID, SUBSCRIPTION_PLAN_DURATION)
+
+        income_query = (
+            select(
+                TRANSACTION_PLAN_ID.label("plan_id"),
+                Transaction.currency,
+                func.sum(FINAL_AMOUNT).label("income"),
+            )
+            .where(
+                Transaction.status == TransactionStatus.COMPLETED,
+                TRANSACTION_PLAN_ID.is_not(None),
+                TRANSACTION_PLAN_ID != 0,
+            )
+            .group_by(TRANSACTION_PLAN_ID, Transaction.currency)
+        )
+
+        subscriptions = (await self.session.execute(subscriptions_query)).mappings().all()
+        durations = (await self.session.execute(durations_query)).mappings().all()
+        income = (await self.session.execute(income_query)).mappings().all()
+
+        return {
+            "subscriptions": [dict(row) for row in subscriptions],
+            "durations": [dict(row) for row in durations],
+            "income": [dict(row) for row in income],
+        }
+
+    async def get_promocodes_statistics(self) -> list[dict[str, Any]]:
+        query = (
+            select(
+                Promocode.code,
+                Promocode.reward_type,
+                Promocode.reward,
+                func.count(PromocodeActivation.id).label("activations"),
+            )
+            .outerjoin(PromocodeActivation, PromocodeActivation.promocode_id == Promocode.id)
+            .group_by(Promocode.id)
+            .order_by(Promocode.id)
+        )
+        return [dict(row) for row in (await self.session.execute(query)).mappings().all()]
+
+    async def record_registration(self, created_at: datetime, count: int = 1) -> None:
+        await self._increment(DailyStatistics, date=utc_day(created_at), registrations=count)
+
+    async def record_subscription(
+        self,
+        telegram_id: int,
+        subscription_id: int,
+        is_trial: bool,
+        created_at: datetime,
+    ) -> None:
+        query = select(
+            func.coalesce(func.bool_or(Subscription.is_trial), False),
+            func.coalesce(func.bool_or(not_(Subscription.is_trial)), False),
+        ).where(
+            Subscription.user_telegram_id == telegram_id,
+            Subscription.id != subscription_id,
+        )
+        had_trial, had_paid = (await self.session.execute(query)).one()
+
+        if is_trial and not had_trial:
+            await self._increment(DailyStatistics, date=utc_day(created_at), trial_starts=1)
+        elif not is_trial and had_trial and not had_paid:
+            await self._increment(DailyStatistics, date=utc_day(created_at), trial_conversions=1)
+
+    async def record_transaction(
+        self,
+        telegram_id: int,
+        transaction_id: int,
+        gateway_type: PaymentGatewayType,
+        final_amount: Decimal,
+        original_amount: Decimal,
+        created_at: datetime,
+        sign: int = 1,
+    ) -> None:
+        day = utc_day(created_at)
+        is_paid = final_amount != 0
+
+        await self._increment(
+            DailyGatewayStatistics,
+            date=day,
+            gateway_type=gateway_type,
+            completed_count=sign,
+            paid_count=sign if is_paid else 0,
+            revenue=final_amount * sign,
+            discount=(original_amount - final_amount) * sign,
+        )
+
+        if not is_paid:
+            return
+
+        has_other_payments = await self.session.scalar(
+            select(
+                exists().where(
+                    Transaction.user_telegram_id == telegram_id,
+                    Transaction.id != transaction_id,
+                    Transaction.status == TransactionStatus.COMPLETED,
+                    FINAL_AMOUNT != 0,
+                )
+            )
+        )
+
+        if not has_other_payments:
+            await self._increment(DailyStatistics, date=day, first_payments=sign)
+
+    async def rebuild(self, since: Optional[date] = None) -> None:
+        await self.session.execute(
+            delete(DailyStatistics).where(*self._since(DailyStatistics.date, since))
+        )
+        await self.session.execute(
+            delete(DailyGatewayStatistics).where(*self._since(DailyGatewayStatistics.date, since))
+        )
+
+        registration_date = utc_date(User.created_at)
+        await self._merge(
+            DailyStatistics,
+            select(
+                registration_date.label("date"),
+                func.count().label("registrations"),
+            )
+            .where(*self._since(registration_date, since))
+            .group_by(registration_date),
+        )
+
+        subscriptions = (
+            select(
+                func.min(Subscription.created_at)
+                .filter(Subscription.is_trial.is_(True))
+                .label("trial_at"),
+                func.min(Subscription.created_at)
+                .filter(Subscription.is_trial.is_(False))
+                .label("paid_at"),
+            )
+            .group_by(Subscription.user_telegram_id)
+            .subquery()
+        )
+
+        trial_date = utc_date(subscriptions.c.trial_at)
+        await self._merge(
+            DailyStatistics,
+            select(
+                trial_date.label("date"),
+                func.count().label("trial_starts"),
+            )
+            .where(subscriptions.c.trial_at.is_not(None), *self._since(trial_date, since))
+            .group_by(trial_date),
+        )
+
+        conversion_date = utc_date(subscriptions.c.paid_at)
+        await self._merge(
+            DailyStatistics,
+            select(
+                conversion_date.label("date"),
+                func.count().label("trial_conversions"),
+            )
+            .where(
+                subscriptions.c.paid_at > subscriptions.c.trial_at,
+                *self._since(conversion_date, since),
+            )
+            .group_by(conversion_date),
+        )
+
+        payments = (
+            select(func.min(Transaction.created_at).label("paid_at"))
+            .where(Transaction.status == TransactionStatus.COMPLETED, FINAL_AMOUNT != 0)
+            .group_by(Transaction.user_telegram_id)
+            .subquery()
+        )
+        payment_date = utc_date(payments.c.paid_at)
+        await self._merge(
+            DailyStatistics,
+            select(
+                payment_date.label("date"),
+                func.count().label("first_payments"),
+            )
+            .where(*self._since(payment_date, since))
+            .group_by(payment_date),
+        )
+
+        transaction_date = utc_date(Transaction.created_at)
+        await self._merge(
+            DailyGatewayStatistics,
+            select(
+                transaction_date.label("date"),
+                Transaction.gateway_type.label("gateway_type"),
+                func.count().label("completed_count"),
+                func.count().filter(FINAL_AMOUNT != 0).label("paid_count"),
+                func.sum(FINAL_AMOUNT).label("revenue"),
+                func.sum(ORIGINAL_AMOUNT - FINAL_AMOUNT).label("discount"),
+            )
+            .where(
+                Transaction.status == TransactionStatus.COMPLETED,
+                *self._since(transaction_date, since),
+            )
+            .group_by(transaction_date, Transaction.gateway_type),
+        )
+
+    #
+
+    async def _increment(self, model: ModelType[T], **values: Any) -> None:
+        await self._upsert(model, insert(model).values(**values), list(values))
+
+    async def _merge(self, model: ModelType[T], query: Select[tuple[Any, ...]]) -> None:
+        columns = list(query.selected_columns.keys())
+        await self._upsert(model, insert(model).from_select(columns, query), columns)
+
+    async def _upsert(self, model: ModelType[T], statement: Insert, columns: list[str]) -> None:
+        keys = [column.name for column in model.__table__.primary_key]
+        statement = statement.on_conflict_do_update(
+            index_elements=keys,
+            set_={
+                column: getattr(model, column) + statement.excluded[column]
+                for column in columns
+                if column not in keys
+            },
+        )
+        await self.session.execute(statement)
+
+    @staticmethod
+    def _sum(column: Any, *conditions: ColumnElement[bool]) -> ColumnElement[Any]:
+        aggregate = func.sum(column)
+        filtered: ColumnElement[Any] = aggregate.filter(*conditions) if conditions else aggregate
+        return func.coalesce(filtered, 0)
+
+    @staticmethod
+    def _since(
+        column: SQLColumnExpression[date],
+        since: Optional[date],
+    ) -> list[ColumnElement[bool]]:
+        return [column >= since] if since else []
@@ -1,6 +1,8 @@
 from typing import Any, Optional
 
-from src.infrastructure.database.models.sql import Subscription
+from sqlalchemy import insert, select, update
+
+from src.infrastructure.database.models.sql import Subscription, User
 
 from .base import BaseRepository
 
@@ -9,17 +11,39 @@ class SubscriptionRepository(BaseRepository):
     async def create(self, subscription: Subscription) -> Subscription:
         return await self.create_instance(subscription)
 
+    async def create_many(self, subscriptions: list[dict[str, Any]]) -> list[Subscription]:
+        if not subscriptions:
+            return []
+
+        result = await self.session.scalars(
+            insert(Subscription).returning(Subscription),
+            subscriptions,
+        )
+        return list(result.all())
+
     async def get(self, subscription_id: int) -> Optional[Subscription]:
         return await self._get_one(Subscription, Subscription.id == subscription_id)
 
     async def get_all_by_user(self, telegram_id: int) -> list[Subscription]:
         return await self._get_many(Subscription, Subscription.user_telegram_id == telegram_id)
 
-    async def get_all(self) -> list[Subscription]:
-        return await self._get_many(Subscription)
+    async def get_current_by_users(self, telegram_ids: list[int]) -> list[Subscription]:
+        query = (
+            select(Subscription)
+            .join(User, User.current_subscription_id == Subscription.id)
+            .where(User.telegram_id.in_(telegram_ids))
+        )
+        result = await self.session.execute(query)
+        return list(result.unique().scalars().all())
 
     async def update(self, subscription_id: int, **data: Any) -> Optional[Subscription]:
         return await self._update(Subscription, Subscription.id == subscription_id, **data)
 
+    async def update_many(self, subscriptions: list[dict[str, Any]]) -> None:
+        if not subscriptions:
+            return
+
+        await self.session.execute(update(Subscription), subscriptions)
+
     async def filter_by_plan_id(self, plan_id: int) -> list[Subscription]:
         return await self._get_many(Subscription, Subscription.plan["id"].as_integer() == plan_id)
@@ -0,0 +1,51 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.database.models.sql import User
+from src.infrastructure.database.repositories.base import BaseRepository
+
+
+def make_result(rows):
+    result = MagicMock()
+    result.unique.return_value.scalars.return_value.all.return_value = rows
+    return result
+
+
+@pytest.mark.asyncio
+async def test_iter_batches_uses_keyset_pages():
+    # Arrange
+    first_page = [MagicMock(telegram_id=1), MagicMock(telegram_id=2)]
+    second_page = [MagicMock(telegram_id=5)]
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=[make_result(first_page), make_result(second_page)])
+    repository = BaseRepository(session)
+
+    # Act
+    pages = [
+        page
+        async for page in repository.iter_batches(User, order_by=User.telegram_id, batch_size=2)
+    ]
+
+    # Assert
+    assert pages == [first_page, second_page]
+    first_query, second_query = (call.args[0] for call in session.execute.await_args_list)
+    assert "users.telegram_id >" not in str(first_query)
+    # Вторая страница начинается после последнего telegram_id первой
+    assert "users.telegram_id >" in str(second_query)
+    assert second_query.compile().params["telegram_id_1"] == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_batches_stops_on_empty_page():
+    # Arrange
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=[make_result([])])
+    repository = BaseRepository(session)
+
+    # Act
+    pages = [page async for page in repository.iter_batches(User, order_by=User.telegram_id)]
+
+    # Assert
+    assert pages == []
+    session.execute.assert_awaited_once()
@@ -1,6 +1,9 @@
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 from uuid import UUID
 
+from sqlalchemy import select
+
+from src.core.constants import DATABASE_BATCH_SIZE
 from src.core.enums import TransactionStatus
 from src.infrastructure.database.models.sql import Transaction
 
@@ -14,14 +17,25 @@ class TransactionRepository(BaseRepository):
     async def get(self, payment_id: UUID) -> Optional[Transaction]:
         return await self._get_one(Transaction, Transaction.payment_id == payment_id)
 
+    async def get_status(self, payment_id: UUID) -> Optional[TransactionStatus]:
+        query = select(Transaction.status).where(Transaction.payment_id == payment_id)
+        status: Optional[TransactionStatus] = await self.session.scalar(query)
+        return status
+
     async def get_by_user(self, telegram_id: int) -> list[Transaction]:
         return await self._get_many(Transaction, Transaction.user_telegram_id == telegram_id)
 
-    async def get_all(self) -> list[Transaction]:
-        return await self._get_many(Transaction)
-
-    async def get_by_status(self, status: TransactionStatus) -> list[Transaction]:
-        return await self._get_many(Transaction, Transaction.status == status)
+    def iter_by_status(
+        self,
+        status: TransactionStatus,
+        batch_size: int = DATABASE_BATCH_SIZE,
+    ) -> AsyncIterator[list[Transaction]]:
+        return self.iter_batches(
+            Transaction,
+            Transaction.status == status,
+            order_by=Transaction.id,
+            batch_size=batch_size,
+        )
 
     async def update(self, payment_id: UUID, **data: Any) -> Optional[Transaction]:
         return await self._update(Transaction, Transaction.payment_id == payment_id, **data)
@@ -1,7 +1,9 @@
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
-from sqlalchemy import func, or_
+from sqlalchemy import BigInteger, Integer, column, func, or_, update, values
+from sqlalchemy.dialects.postgresql import insert
 
+from src.core.constants import DATABASE_BATCH_SIZE
 from src.core.enums import UserRole
 from src.infrastructure.database.models.sql import User
 
@@ -12,6 +14,16 @@ class UserRepository(BaseRepository):
     async def create(self, user: User) -> User:
         return await self.create_instance(user)
 
+    async def create_many(self, users: list[dict[str, Any]]) -> list[User]:
+        if not users:
+            return []
+
+        result = await self.session.scalars(
+            insert(User).on_conflict_do_nothing(index_elements=[User.telegram_id]).returning(User),
+            users,
+        )
+        return list(result.all())
+
     async def get(self, telegram_id: int) -> Optional[User]:
         return await self._get_one(User, User.telegram_id == telegram_id)
 
@@ -26,20 +38,51 @@ class UserRepository(BaseRepository):
         ]
         return await self._get_many(User, or_(*conditions))
 
-    async def get_all(self) -> list[User]:
-        return await self._get_many(User)
-
     async def update(self, telegram_id: int, **data: Any) -> Optional[User]:
         return await self._update(User, User.telegram_id == telegram_id, **data)
 
+    async def set_current_subscriptions(self, subscriptions: list[tuple[int, int]]) -> None:
+        if not subscriptions:
+            return
+
+        data = values(
+            column("telegram_id", BigInteger),
+            column("subscription_id", Integer),
+            name="data",
+        ).data(subscriptions)
+
+        await self.session.execute(
+            update(User)
+            .where(User.telegram_id == data.c.telegram_id)
+            .values(current_subscription_id=data.c.subscription_id)
+        )
+
     async def delete(self, telegram_id: int) -> bool:
         return bool(await self._delete(User, User.telegram_id == telegram_id))
 
     async def count(self) -> int:
         return await self._count(User)
 
-    async def filter_by_role(self, role: UserRole) -> list[User]:
-        return await self._get_many(User, User.role == role)
+    async def count_blocked(self) -> int:
+        return await self._count(User, User.is_blocked.is_(True))
+
+    def iter_by_role(
+        self,
+        role: UserRole,
+        batch_size: int = DATABASE_BATCH_SIZE,
+    ) -> AsyncIterator[list[User]]:
+        return self.iter_batches(
+            User,
+            User.role == role,
+            order_by=User.telegram_id,
+            batch_size=batch_size,
+        )
 
-    async def filter_by_blocked(self, blocked: bool) -> list[User]:
-        return await self._get_many(User, User.is_blocked == blocked)
+    def iter_blocked(self, batch_size: int = DATABASE_BATCH_SIZE) -> AsyncIterator[list[User]]:
+        return self.iter_batches(
+            User,
+            User.is_blocked.is_(True),
+            order_by=User.telegram_id,
+            batch_size=batch_size,
+            descending=True,
+        )
@@ -5,6 +5,7 @@ from .bot import BotProvider
 from .config import ConfigProvider
 from .database import DatabaseProvider
 from .i18n import I18nProvider
+from .importers import ImportersProvider
 from .payment_gateways import PaymentGatewaysProvider
 from .redis import RedisProvider
 from .remnawave import RemnawaveProvider
@@ -18,6 +19,7 @@ def get_providers() -> list[Provider]:
         ConfigProvider(),
         DatabaseProvider(),
         I18nProvider(),
+        ImportersProvider(),
         RedisProvider(),
         RemnawaveProvider(),
         ServicesProvider(),
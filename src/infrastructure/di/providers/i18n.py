@@ -8,6 +8,7 @@ from loguru import logger
 
 from src.core.config import AppConfig
 from src.core.constants import USER_KEY
+from src.core.i18n.translator import CachedTranslatorHub
 from src.infrastructure.database.models.dto import UserDto
 
 
@@ -36,7 +37,13 @@ class I18nProvider(Provider):
             f"default={config.default_locale.value}"
         )
 
-        return TranslatorHub(locales_map, root_locale=config.default_locale, storage=storage)
+        hub = CachedTranslatorHub(
+            locales_map,
+            root_locale=config.default_locale,
+            storage=storage,
+        )
+        hub.prerender(locales_map.keys())
+        return hub
 
     @provide(scope=Scope.REQUEST)
     def get_translator(
@@ -0,0 +1,26 @@
+import multiprocessing
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from dishka import Provider, Scope, provide
+from loguru import logger
+
+from src.core.constants import IMPORT_TRANSFORM_WORKERS
+
+
+class ImportersProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    def get_import_executor(self) -> Iterable[Executor]:
+        logger.debug(f"Creating import executor with '{IMPORT_TRANSFORM_WORKERS}' workers")
+        # Spawned workers don't inherit the event loop and open connections of the bot
+        executor = ProcessPoolExecutor(
+            max_workers=IMPORT_TRANSFORM_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+        yield executor
+
+        logger.debug("Shutting down import executor")
+        executor.shutdown(wait=False, cancel_futures=True)
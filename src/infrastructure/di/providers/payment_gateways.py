@@ -1,16 +1,18 @@
 from __future__ import annotations
 
+from collections.abc import AsyncGenerator
 from typing import Type
 
 from aiogram import Bot
 from dishka import Provider, Scope, provide
-from loguru import logger
 
+from src.core.config import AppConfig
 from src.core.enums import PaymentGatewayType
-from src.infrastructure.database.models.dto import PaymentGatewayDto
+from src.core.security.ip_allowlist import IpAllowlist
 from src.infrastructure.payment_gateways import (
     BasePaymentGateway,
     PaymentGatewayFactory,
+    PaymentGatewayRegistry,
     TelegramStarsGateway,
     YookassaGateway,
 )
@@ -27,31 +29,21 @@ GATEWAY_MAP: dict[PaymentGatewayType, Type[BasePaymentGateway]] = {
 
 class PaymentGatewaysProvider(Provider):
     scope = Scope.APP
-    _cached_gateways: dict[PaymentGatewayType, BasePaymentGateway] = {}
 
-    @provide()
-    def get_gateway_factory(self, bot: Bot) -> PaymentGatewayFactory:
-        def create_gateway(gateway: PaymentGatewayDto) -> BasePaymentGateway:
-            gateway_type = gateway.type
-
-            if gateway_type in self._cached_gateways:
-                cached_gateway = self._cached_gateways[gateway_type]
-
-                if cached_gateway.gateway != gateway:
-                    logger.warning(
-                        f"Gateway '{gateway_type}' data changed. Re-initializing instance"
-                    )
-                    del self._cached_gateways[gateway_type]
-
-            if gateway_type not in self._cached_gateways:
-                gateway_instance = GATEWAY_MAP.get(gateway_type)
-
-                if not gateway_instance:
-                    raise ValueError(f"Unknown gateway type '{gateway_type}'")
-
-                self._cached_gateways[gateway_type] = gateway_instance(gateway=gateway, bot=bot)
-                logger.debug(f"Initialized new gateway '{gateway_type}' instance")
-
-            return self._cached_gateways[gateway_type]
-
-        return create_gateway
+    @provide
+    async def get_gateway_registry(
+        self,
+        config: AppConfig,
+        bot: Bot,
+    ) -> AsyncGenerator[PaymentGatewayRegistry, None]:
+        registry = PaymentGatewayRegistry(
+            bot=bot,
+            gateway_map=GATEWAY_MAP,
+            trusted_proxies=IpAllowlist(config.trusted_proxies),
+        )
+        yield registry
+        await registry.close()
+
+    @provide
+    def get_gateway_factory(self, registry: PaymentGatewayRegistry) -> PaymentGatewayFactory:
+        return registry.get
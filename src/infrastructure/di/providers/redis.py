@@ -1,11 +1,18 @@
+import asyncio
 from collections.abc import AsyncGenerator
+from contextlib import suppress
 
 from dishka import Provider, Scope, provide
 from loguru import logger
 from redis.asyncio import ConnectionPool, Redis
 
 from src.core.config import AppConfig
-from src.infrastructure.redis import RedisRepository
+from src.infrastructure.redis import (
+    MessageDeletionQueue,
+    RedisRepository,
+    SubscriptionUpdateQueue,
+)
+from src.infrastructure.redis.local_cache import listen_cache_invalidations
 
 
 class RedisProvider(Provider):
@@ -24,10 +31,18 @@ class RedisProvider(Provider):
             logger.error(f"Failed to connect to Redis: {exception}")
             raise
 
+        listener = asyncio.create_task(listen_cache_invalidations(client))
+
         yield client
 
+        listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await listener
+
         logger.debug("Closing Redis client and disconnecting pool")
         await client.close()
         await connection_pool.disconnect()
 
+    message_deletion_queue = provide(source=MessageDeletionQueue)
+    subscription_update_queue = provide(source=SubscriptionUpdateQueue)
     redis_repository = provide(source=RedisRepository)
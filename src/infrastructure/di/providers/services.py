@@ -1,7 +1,9 @@
 from dishka import Provider, Scope, provide
 
+from src.core.utils.identity_map import IdentityMap
 from src.services.access import AccessService
 from src.services.broadcast import BroadcastService
+from src.services.channel import ChannelService
 from src.services.command import CommandService
 from src.services.importer import ImporterService
 from src.services.notification import NotificationService
@@ -11,6 +13,7 @@ from src.services.pricing import PricingService
 from src.services.promocode import PromocodeService
 from src.services.remnawave import RemnawaveService
 from src.services.settings import SettingsService
+from src.services.statistics import StatisticsService
 from src.services.subscription import SubscriptionService
 from src.services.transaction import TransactionService
 from src.services.user import UserService
@@ -20,6 +23,7 @@ from src.services.webhook import WebhookService
 class ServicesProvider(Provider):
     scope = Scope.APP
 
+    identity_map = provide(source=IdentityMap, scope=Scope.REQUEST)
     command_service = provide(source=CommandService)
     access_service = provide(source=AccessService, scope=Scope.REQUEST)
     notification_service = provide(source=NotificationService, scope=Scope.REQUEST)
@@ -32,6 +36,8 @@ class ServicesProvider(Provider):
     user_service = provide(source=UserService, scope=Scope.REQUEST)
     webhook_service = provide(source=WebhookService)
     settings_service = provide(source=SettingsService, scope=Scope.REQUEST)
+    statistics_service = provide(source=StatisticsService, scope=Scope.REQUEST)
     broadcast_service = provide(source=BroadcastService, scope=Scope.REQUEST)
+    channel_service = provide(source=ChannelService, scope=Scope.REQUEST)
     pricing_service = provide(source=PricingService)
     importer_service = provide(source=ImporterService)
@@ -0,0 +1,44 @@
+from pathlib import Path
+from typing import Any, Optional, Type
+
+from src.core.enums import ImportSourceType
+
+from .base import BaseImportSource, FlatImportSource
+from .csv_file import CsvImportSource
+from .jsonl_file import JsonlImportSource
+from .xui import XuiImportSource
+
+IMPORT_SOURCE_MAP: dict[ImportSourceType, Type[BaseImportSource]] = {
+    ImportSourceType.XUI: XuiImportSource,
+    ImportSourceType.CSV: CsvImportSource,
+    ImportSourceType.JSONL: JsonlImportSource,
+}
+
+
+def get_import_source_type(path: Path) -> Optional[ImportSourceType]:
+    suffix = path.suffix.lower()
+
+    for source_type, source in IMPORT_SOURCE_MAP.items():
+        if suffix in source.EXTENSIONS:
+            return source_type
+
+    return None
+
+
+def transform_records(
+    source_type: ImportSourceType,
+    records: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    return IMPORT_SOURCE_MAP[source_type]().transform_many(records)
+
+
+__all__ = [
+    "IMPORT_SOURCE_MAP",
+    "BaseImportSource",
+    "CsvImportSource",
+    "FlatImportSource",
+    "JsonlImportSource",
+    "XuiImportSource",
+    "get_import_source_type",
+    "transform_records",
+]
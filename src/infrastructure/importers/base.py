@@ -0,0 +1,69 @@
+import re
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Final, Generator, Optional
+
+from src.core.constants import IMPORTED_TAG, waveshop_PREFIX
+from src.core.enums import SubscriptionStatus
+
+DEFAULT_EXPIRE_AT: Final[datetime] = datetime(2099, 1, 1, tzinfo=timezone.utc)
+TELEGRAM_ID_PATTERN: Final[re.Pattern[str]] = re.compile(r"\d+")
+
+
+class BaseImportSource(ABC):
+    EXTENSIONS: tuple[str, ...] = ()
+
+    @abstractmethod
+    def iter_records(self, path: Path) -> Generator[dict[str, Any], None, None]: ...
+
+    @abstractmethod
+    def transform(self, record: dict[str, Any]) -> Optional[dict[str, Any]]: ...
+
+    def transform_many(self, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return [user for user in map(self.transform, records) if user]
+
+    def _build_user(
+        self,
+        telegram_id: str,
+        expire_at: datetime,
+        traffic_limit_bytes: int,
+        hwid_device_limit: int,
+    ) -> dict[str, Any]:
+        return {
+            "username": f"{waveshop_PREFIX}{telegram_id}",
+            "telegram_id": telegram_id,
+            "status": SubscriptionStatus.ACTIVE,
+            "expire_at": expire_at,
+            "traffic_limit_bytes": traffic_limit_bytes,
+            "hwid_device_limit": hwid_device_limit,
+            "tag": IMPORTED_TAG,
+        }
+
+
+class FlatImportSource(BaseImportSource, ABC):
+    def transform(self, record: dict[str, Any]) -> Optional[dict[str, Any]]:
+        match = TELEGRAM_ID_PATTERN.search(str(record.get("telegram_id") or ""))
+
+        if not match:
+            return None
+
+        try:
+            return self._build_user(
+                telegram_id=match.group(0),
+                expire_at=self._parse_expire_at(record.get("expire_at")),
+                traffic_limit_bytes=int(record.get("traffic_limit_bytes") or 0),
+                hwid_device_limit=int(record.get("hwid_device_limit") or 1),
+            )
+        except (TypeError, ValueError):
+            return None
+
+    def _parse_expire_at(self, value: Any) -> datetime:
+        if value in (None, ""):
+            return DEFAULT_EXPIRE_AT
+
+        if isinstance(value, (int, float)) or str(value).isdigit():
+            return datetime.fromtimestamp(int(value), tz=timezone.utc)
+
+        expire_at = datetime.fromisoformat(str(value))
+        return expire_at if expire_at.tzinfo else expire_at.replace(tzinfo=timezone.utc)
@@ -0,0 +1,13 @@
+import csv
+from pathlib import Path
+from typing import Any, Generator
+
+from .base import FlatImportSource
+
+
+class CsvImportSource(FlatImportSource):
+    EXTENSIONS = (".csv",)
+
+    def iter_records(self, path: Path) -> Generator[dict[str, Any], None, None]:
+        with path.open(newline="", encoding="utf-8-sig") as file:
+            yield from csv.DictReader(file)
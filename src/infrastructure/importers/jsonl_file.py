@@ -0,0 +1,23 @@
+import json
+from pathlib import Path
+from typing import Any, Generator
+
+from .base import FlatImportSource
+
+
+class JsonlImportSource(FlatImportSource):
+    EXTENSIONS = (".jsonl", ".ndjson")
+
+    def iter_records(self, path: Path) -> Generator[dict[str, Any], None, None]:
+        with path.open(encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                if isinstance(record, dict):
+                    yield record
@@ -0,0 +1,61 @@
+from datetime import datetime, timezone
+
+from src.core.enums import ImportSourceType
+from src.infrastructure.importers import (
+    CsvImportSource,
+    JsonlImportSource,
+    XuiImportSource,
+    get_import_source_type,
+    transform_records,
+)
+
+
+def test_csv_source_reads_and_transforms_rows(tmp_path):
+    # Arrange
+    path = tmp_path / "users.csv"
+    path.write_text(
+        "telegram_id,expire_at,traffic_limit_bytes,hwid_device_limit\n"
+        "111,2030-01-01T00:00:00,1024,3\n"
+        "222,,,\n"
+        "not-an-id,,,\n"
+        "333,bad-date,,\n",
+        encoding="utf-8",
+    )
+    source = CsvImportSource()
+
+    # Act
+    users = source.transform_many(list(source.iter_records(path)))
+
+    # Assert
+    # Строки без telegram_id и с битыми значениями пропускаются, а не роняют весь батч
+    assert [user["telegram_id"] for user in users] == ["111", "222"]
+    assert users[0]["expire_at"] == datetime(2030, 1, 1, tzinfo=timezone.utc)
+    assert users[0]["traffic_limit_bytes"] == 1024
+    assert users[0]["hwid_device_limit"] == 3
+    assert users[1]["expire_at"] == datetime(2099, 1, 1, tzinfo=timezone.utc)
+
+
+def test_jsonl_source_skips_invalid_lines(tmp_path):
+    # Arrange
+    path = tmp_path / "users.jsonl"
+    path.write_text(
+        '{"telegram_id": 111, "expire_at": 1893456000}\n\nnot json\n[1, 2]\n',
+        encoding="utf-8",
+    )
+
+    # Act
+    records = list(JsonlImportSource().iter_records(path))
+    users = transform_records(ImportSourceType.JSONL, records)
+
+    # Assert
+    assert len(records) == 1
+    assert users[0]["expire_at"] == datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+def test_get_import_source_type_by_extension(tmp_path):
+    # Assert
+    assert get_import_source_type(tmp_path / "x-ui.DB") == ImportSourceType.XUI
+    assert get_import_source_type(tmp_path / "users.csv") == ImportSourceType.CSV
+    assert get_import_source_type(tmp_path / "users.ndjson") == ImportSourceType.JSONL
+    assert get_import_source_type(tmp_path / "users.xlsx") is None
+    assert XuiImportSource.EXTENSIONS
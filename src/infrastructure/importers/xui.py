@@ -0,0 +1,60 @@
+import json
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Generator, Optional
+
+from .base import DEFAULT_EXPIRE_AT, TELEGRAM_ID_PATTERN, BaseImportSource
+
+
+class XuiImportSource(BaseImportSource):
+    EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+    def iter_records(self, path: Path) -> Generator[dict[str, Any], None, None]:
+        try:
+            # NOTE: Records are pulled from a worker thread in batches
+            with closing(sqlite3.connect(path, check_same_thread=False)) as conn:
+                # Clients are counted and unpacked by SQLite JSON1 to avoid
+                # loading every inbound settings blob into Python
+                row = conn.execute(
+                    "SELECT id FROM inbounds WHERE json_valid(settings) "
+                    "ORDER BY json_array_length(settings, '$.clients') DESC LIMIT 1"
+                ).fetchone()
+
+                if not row:
+                    raise ValueError("No valid inbounds containing clients found")
+
+                cursor = conn.execute(
+                    "SELECT clients.value FROM inbounds, json_each(inbounds.settings, '$.clients') "
+                    "AS clients WHERE inbounds.id = ?",
+                    (row[0],),
+                )
+
+                for (client_raw,) in cursor:
+                    client = json.loads(client_raw)
+                    if isinstance(client, dict):
+                        yield client
+        except sqlite3.Error as exception:
+            raise ValueError("Invalid or inaccessible 3X-UI database") from exception
+
+    def transform(self, record: dict[str, Any]) -> Optional[dict[str, Any]]:
+        if not record.get("enable"):
+            return None
+
+        match = TELEGRAM_ID_PATTERN.search(record.get("email", ""))
+        if not match:
+            return None
+
+        expire_at = (
+            datetime.fromtimestamp(record["expiryTime"] / 1000, tz=timezone.utc)
+            if record.get("expiryTime")
+            else DEFAULT_EXPIRE_AT
+        )
+
+        return self._build_user(
+            telegram_id=match.group(0),
+            expire_at=expire_at,
+            traffic_limit_bytes=record.get("totalGB", 0),
+            hwid_device_limit=record.get("limitIp", 1),
+        )
@@ -1,10 +1,12 @@
 from .base import BasePaymentGateway, PaymentGatewayFactory
+from .registry import PaymentGatewayRegistry
 from .telegram_stars import TelegramStarsGateway
 from .yookassa import YookassaGateway
 
 __all__ = [
     "BasePaymentGateway",
     "PaymentGatewayFactory",
+    "PaymentGatewayRegistry",
     "TelegramStarsGateway",
     "YookassaGateway",
 ]
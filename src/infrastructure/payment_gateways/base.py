@@ -1,17 +1,26 @@
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from ipaddress import ip_address, ip_network
-from typing import Optional, Protocol
+from importlib.util import find_spec
+from typing import Any, ClassVar, Final, Optional, Protocol
 from uuid import UUID
 
 from aiogram import Bot
 from fastapi import Request
-from httpx import AsyncClient, Timeout
+from httpx import AsyncClient, Limits, Timeout
 from loguru import logger
 
+from src.core.constants import (
+    GATEWAY_HTTP_KEEPALIVE_EXPIRY,
+    GATEWAY_HTTP_MAX_CONNECTIONS,
+    GATEWAY_HTTP_MAX_KEEPALIVE,
+)
 from src.core.enums import TransactionStatus
+from src.core.security.ip_allowlist import IpAllowlist, get_client_ip
 from src.infrastructure.database.models.dto import PaymentGatewayDto, PaymentResult
 
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2_ENABLED: Final[bool] = find_spec("h2") is not None
+
 
 class PaymentGatewayFactory(Protocol):
     def __call__(self, gateway: "PaymentGatewayDto") -> "BasePaymentGateway": ...
@@ -21,18 +30,30 @@ class BasePaymentGateway(ABC):
     gateway: PaymentGatewayDto
     bot: Bot
 
+    trusted_proxies: IpAllowlist
+
     _bot_username: Optional[str]
+    _clients: list[AsyncClient]
 
     NETWORKS: list[str] = []
+    _allowlist: ClassVar[IpAllowlist] = IpAllowlist([])
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Compiled once per gateway class instead of re-parsing NETWORKS on every webhook
+        cls._allowlist = IpAllowlist(cls.NETWORKS)
 
     def __init__(
         self,
         gateway: PaymentGatewayDto,
         bot: Bot,
+        trusted_proxies: Optional[IpAllowlist] = None,
     ) -> None:
         self.gateway = gateway
         self.bot = bot
+        self.trusted_proxies = trusted_proxies or IpAllowlist([])
         self._bot_username: Optional[str] = None
+        self._clients = []
 
         logger.debug(f"{self.__class__.__name__} Initialized")
 
@@ -46,6 +67,13 @@ class BasePaymentGateway(ABC):
     @abstractmethod
     async def handle_webhook(self, request: Request) -> tuple[UUID, TransactionStatus]: ...
 
+    async def close(self) -> None:
+        for client in self._clients:
+            await client.aclose()
+
+        self._clients.clear()
+        logger.debug(f"{self.__class__.__name__} closed")
+
     async def _get_bot_redirect_url(self) -> str:
         if self._bot_username is None:
             self._bot_username = (await self.bot.get_me()).username
@@ -58,17 +86,30 @@ class BasePaymentGateway(ABC):
         headers: Optional[dict[str, str]] = None,
         timeout: float = 30.0,
     ) -> AsyncClient:
-        return AsyncClient(base_url=base_url, auth=auth, headers=headers, timeout=Timeout(timeout))
+        client = AsyncClient(
+            base_url=base_url,
+            auth=auth,
+            headers=headers,
+            timeout=Timeout(timeout),
+            limits=Limits(
+                max_connections=GATEWAY_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=GATEWAY_HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=GATEWAY_HTTP_KEEPALIVE_EXPIRY,
+            ),
+            http2=HTTP2_ENABLED,
+        )
+        self._clients.append(client)
+        return client
 
     def _is_test_payment(self, payment_id: str) -> bool:
         return payment_id.startswith("test:")
 
-    def _is_ip_in_network(self, ip: str, network: str) -> bool:
-        try:
-            return ip_address(ip) in ip_network(network, strict=False)
-        except Exception as exception:
-            logger.error(f"Failed to check IP '{ip}' in network '{network}': {exception}")
-            return False
+    def _get_client_ip(self, request: Request) -> Optional[str]:
+        return get_client_ip(
+            peer=request.client.host if request.client else None,
+            forwarded_for=request.headers.getlist("X-Forwarded-For"),
+            trusted_proxies=self.trusted_proxies,
+        )
 
-    def _is_ip_trusted(self, ip: str) -> bool:
-        return any(self._is_ip_in_network(ip, net) for net in self.NETWORKS)
+    def _is_ip_trusted(self, ip: Optional[str]) -> bool:
+        return ip in self._allowlist
@@ -0,0 +1,105 @@
+import asyncio
+import hashlib
+from typing import Mapping
+
+from aiogram import Bot
+from loguru import logger
+from pydantic import SecretStr
+
+from src.core.constants import GATEWAY_RETIRE_DELAY
+from src.core.enums import PaymentGatewayType
+from src.core.security.ip_allowlist import IpAllowlist
+from src.core.utils import json_utils
+from src.infrastructure.database.models.dto import PaymentGatewayDto
+
+from .base import BasePaymentGateway
+
+
+def get_settings_version(gateway: PaymentGatewayDto) -> str:
+    settings = gateway.settings.model_dump() if gateway.settings else {}
+    data = [
+        gateway.type,
+        gateway.currency,
+        {
+            key: value.get_secret_value() if isinstance(value, SecretStr) else value
+            for key, value in settings.items()
+        },
+    ]
+    return hashlib.blake2b(json_utils.bytes_encode(data), digest_size=16).hexdigest()
+
+
+class PaymentGatewayRegistry:
+    bot: Bot
+    gateway_map: Mapping[PaymentGatewayType, type[BasePaymentGateway]]
+    trusted_proxies: IpAllowlist
+
+    _instances: dict[int, tuple[str, BasePaymentGateway]]
+    _retiring: set[asyncio.Task[None]]
+
+    def __init__(
+        self,
+        bot: Bot,
+        gateway_map: Mapping[PaymentGatewayType, type[BasePaymentGateway]],
+        trusted_proxies: IpAllowlist,
+    ) -> None:
+        self.bot = bot
+        self.gateway_map = gateway_map
+        self.trusted_proxies = trusted_proxies
+        self._instances = {}
+        self._retiring = set()
+
+    def get(self, gateway: PaymentGatewayDto) -> BasePaymentGateway:
+        if gateway.id is None:
+            raise ValueError(f"Gateway '{gateway.type}' has no id")
+
+        version = get_settings_version(gateway)
+        cached = self._instances.get(gateway.id)
+
+        if cached:
+            cached_version, instance = cached
+
+            if cached_version == version:
+                # Keep the freshest non-instance fields (is_active, order_index)
+                instance.gateway = gateway
+                return instance
+
+            logger.warning(f"Gateway '{gateway.type}' settings changed. Re-initializing instance")
+            self._retire(instance)
+
+        gateway_class = self.gateway_map.get(gateway.type)
+
+        if not gateway_class:
+            raise ValueError(f"Unknown gateway type '{gateway.type}'")
+
+        instance = gateway_class(
+            gateway=gateway,
+            bot=self.bot,
+            trusted_proxies=self.trusted_proxies,
+        )
+        self._instances[gateway.id] = (version, instance)
+        logger.debug(f"Initialized new gateway '{gateway.type}' instance (version '{version}')")
+        return instance
+
+    async def close(self) -> None:
+        for task in self._retiring:
+            task.cancel()
+
+        instances = [instance for _, instance in self._instances.values()]
+        self._instances.clear()
+
+        for instance in instances:
+            await instance.close()
+
+        logger.debug(f"Closed '{len(instances)}' payment gateway instances")
+
+    def _retire(self, instance: BasePaymentGateway) -> None:
+        # Requests already running on the old instance get a grace period before its pool closes
+        async def close_later() -> None:
+            try:
+                await asyncio.sleep(GATEWAY_RETIRE_DELAY)
+            finally:
+                await instance.close()
+
+        task = asyncio.get_running_loop().create_task(close_later())
+        self._retiring.add(task)
+        task.add_done_callback(self._retiring.discard)
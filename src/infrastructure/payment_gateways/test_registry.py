@@ -0,0 +1,84 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import SecretStr
+
+from src.core.enums import Currency, PaymentGatewayType
+from src.core.security.ip_allowlist import IpAllowlist
+from src.infrastructure.database.models.dto import (
+    PaymentGatewayDto,
+    YookassaGatewaySettingsDto,
+)
+from src.infrastructure.payment_gateways import PaymentGatewayRegistry, YookassaGateway
+from src.infrastructure.payment_gateways.registry import get_settings_version
+
+
+def make_gateway(api_key="secret", is_active=True):
+    return PaymentGatewayDto(
+        id=1,
+        order_index=1,
+        type=PaymentGatewayType.YOOKASSA,
+        currency=Currency.RUB,
+        is_active=is_active,
+        settings=YookassaGatewaySettingsDto(shop_id="1", api_key=SecretStr(api_key)),
+    )
+
+
+@pytest.fixture
+def registry():
+    return PaymentGatewayRegistry(
+        bot=MagicMock(),
+        gateway_map={PaymentGatewayType.YOOKASSA: YookassaGateway},
+        trusted_proxies=IpAllowlist([]),
+    )
+
+
+def test_settings_version_tracks_secret_values():
+    # Assert
+    # SecretStr сериализуется маской, поэтому версия считается по реальному значению
+    assert get_settings_version(make_gateway("a")) != get_settings_version(make_gateway("b"))
+    assert get_settings_version(make_gateway(is_active=False)) == get_settings_version(
+        make_gateway()
+    )
+
+
+@pytest.mark.asyncio
+async def test_registry_reuses_instance_and_http_client(registry):
+    # Act
+    first = registry.get(make_gateway())
+    second = registry.get(make_gateway(is_active=False))
+
+    # Assert
+    assert first is second
+    assert second.gateway.is_active is False
+    await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_registry_recreates_instance_on_settings_change(registry, monkeypatch):
+    # Arrange
+    monkeypatch.setattr("src.infrastructure.payment_gateways.registry.GATEWAY_RETIRE_DELAY", 0)
+    first = registry.get(make_gateway("a"))
+    first.close = AsyncMock()
+
+    # Act
+    second = registry.get(make_gateway("b"))
+    await registry._retiring.copy().pop()
+
+    # Assert
+    assert first is not second
+    first.close.assert_awaited_once()
+    await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_registry_close_closes_pooled_clients(registry):
+    # Arrange
+    instance = registry.get(make_gateway())
+    client = instance._client
+
+    # Act
+    await registry.close()
+
+    # Assert
+    assert client.is_closed
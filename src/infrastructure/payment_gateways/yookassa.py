@@ -1,6 +1,6 @@
 import uuid
 from decimal import Decimal
-from typing import Any, Final
+from typing import Any, Final, Optional
 from uuid import UUID
 
 import orjson
@@ -10,6 +10,7 @@ from httpx import AsyncClient, HTTPStatusError
 from loguru import logger
 
 from src.core.enums import TransactionStatus, YookassaVatCode
+from src.core.security.ip_allowlist import IpAllowlist
 from src.infrastructure.database.models.dto import (
     PaymentGatewayDto,
     PaymentResult,
@@ -42,8 +43,13 @@ class YookassaGateway(BasePaymentGateway):
         "2a02:5180:0:2669::/64",
     ]
 
-    def __init__(self, gateway: PaymentGatewayDto, bot: Bot) -> None:
-        super().__init__(gateway, bot)
+    def __init__(
+        self,
+        gateway: PaymentGatewayDto,
+        bot: Bot,
+        trusted_proxies: Optional[IpAllowlist] = None,
+    ) -> None:
+        super().__init__(gateway, bot, trusted_proxies)
 
         if not isinstance(self.gateway.settings, YookassaGatewaySettingsDto):
             raise TypeError("YookassaGateway requires YookassaGatewaySettingsDto")
@@ -82,7 +88,7 @@ class YookassaGateway(BasePaymentGateway):
             raise
 
     async def handle_webhook(self, request: Request) -> tuple[UUID, TransactionStatus]:
-        client_ip = request.headers.get("X-Forwarded-For", "")
+        client_ip = self._get_client_ip(request)
         logger.critical(request.headers)
 
         if not self._is_ip_trusted(client_ip):
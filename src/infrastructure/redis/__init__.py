@@ -1,7 +1,14 @@
 from .cache import redis_cache
+from .local_cache import invalidate_cache, local_cache
+from .message_deletion import MessageDeletionQueue
 from .repository import RedisRepository
+from .subscription_update import SubscriptionUpdateQueue
 
 __all__ = [
+    "invalidate_cache",
+    "local_cache",
+    "MessageDeletionQueue",
     "redis_cache",
     "RedisRepository",
+    "SubscriptionUpdateQueue",
 ]
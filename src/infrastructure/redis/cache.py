@@ -1,5 +1,6 @@
+import asyncio
 from functools import wraps
-from typing import Any, Awaitable, Callable, Optional, ParamSpec, TypeVar, get_type_hints
+from typing import Any, Awaitable, Callable, Optional, ParamSpec, TypeVar, cast, get_type_hints
 
 from loguru import logger
 from pydantic import SecretStr, TypeAdapter
@@ -7,11 +8,16 @@ from redis.asyncio import Redis
 from redis.typing import ExpiryT
 
 from src.core.constants import TIME_1M
+from src.core.storage.key_builder import build_key
 from src.core.utils import json_utils
 
+from .local_cache import local_cache
+
 T = TypeVar("T", bound=Any)
 P = ParamSpec("P")
 
+_background_refreshes: set[asyncio.Task[None]] = set()
+
 
 def prepare_for_cache(obj: Any) -> Any:
     if isinstance(obj, SecretStr):
@@ -23,43 +29,101 @@ def prepare_for_cache(obj: Any) -> Any:
     return obj
 
 
+async def _get_cached(
+    redis: Redis,
+    key: str,
+    with_ttl: bool,
+) -> tuple[Optional[bytes], Optional[int]]:
+    if not with_ttl:
+        return await redis.get(key), None
+
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.get(key)
+        pipe.ttl(key)
+        cached_value, remaining_ttl = await pipe.execute()
+
+    return cached_value, remaining_ttl
+
+
+async def _claim_refresh(
+    redis: Redis,
+    key: str,
+    remaining_ttl: Optional[int],
+    stale_ttl: Optional[int],
+) -> bool:
+    if stale_ttl is None or remaining_ttl is None or not 0 <= remaining_ttl <= stale_ttl:
+        return False
+
+    # Only one caller refreshes a stale key, the others keep serving the stale value
+    return bool(await redis.set(f"{key}:refresh", 1, nx=True, ex=stale_ttl))
+
+
+def _set_local(local: bool, key: str, value: bytes) -> None:
+    if local:
+        local_cache.set(key, value)
+
+
 def redis_cache(
     prefix: Optional[str] = None,
     ttl: ExpiryT = TIME_1M,
+    local: bool = False,
+    stale_ttl: Optional[int] = None,
 ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
     def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
         return_type: Any = get_type_hints(func)["return"]
         type_adapter: TypeAdapter[T] = TypeAdapter(return_type)
+        cache_prefix = prefix or func.__name__
+        # With stale_ttl the value outlives ttl and is served stale while being refreshed
+        expire: ExpiryT = ttl if stale_ttl is None else cast(int, ttl) + stale_ttl
+
+        async def store(redis: Redis, key: str, result: T) -> None:
+            # Aliases keep third-party models without populate_by_name round-trippable
+            safe_result = prepare_for_cache(type_adapter.dump_python(result, by_alias=True))
+            encoded_result = json_utils.bytes_encode(safe_result)
+            await redis.setex(key, expire, encoded_result)
+            _set_local(local, key, encoded_result)
+            logger.debug(f"Result cached: '{key}' (ttl={expire})")
+
+        async def refresh(redis: Redis, key: str, *args: P.args, **kwargs: P.kwargs) -> None:
+            try:
+                await store(redis, key, await func(*args, **kwargs))
+            except Exception as exception:
+                logger.warning(f"Background refresh failed for key '{key}': {exception}")
+            finally:
+                await redis.delete(f"{key}:refresh")
 
         @wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             self: Any = args[0]
             redis: Redis = self.redis_client
-
-            # Build cache key
-            key_parts = [
-                "cache",
-                prefix or func.__name__,
-                *map(str, args[1:]),
-                *map(str, kwargs.values()),
-            ]
-            key: str = ":".join(key_parts)
+            key: str = build_key("cache", cache_prefix, *args[1:], **kwargs)
 
             try:
-                cached_value: Optional[bytes] = await redis.get(key)
+                local_value = local_cache.get(cache_prefix, key) if local else None
+                if local_value is not None:
+                    logger.debug(f"Local cache hit: '{key}'")
+                    return type_adapter.validate_python(json_utils.decode_any(local_value))
+
+                cached_value, remaining_ttl = await _get_cached(
+                    redis, key, with_ttl=stale_ttl is not None
+                )
+
                 if cached_value is not None:
                     logger.debug(f"Cache hit: '{key}'")
-                    parsed = json_utils.decode(cached_value.decode())
+                    _set_local(local, key, cached_value)
+                    parsed = json_utils.decode_any(cached_value)
+
+                    if await _claim_refresh(redis, key, remaining_ttl, stale_ttl):
+                        logger.debug(f"Cache stale: '{key}'. Refreshing in background")
+                        task = asyncio.create_task(refresh(redis, key, *args, **kwargs))
+                        _background_refreshes.add(task)
+                        task.add_done_callback(_background_refreshes.discard)
+
                     return type_adapter.validate_python(parsed)
 
                 logger.debug(f"Cache miss: '{key}'. Executing function")
                 result: T = await func(*args, **kwargs)
-
-                # Serialize and store result
-                safe_result = prepare_for_cache(type_adapter.dump_python(result))
-                await redis.setex(key, ttl, json_utils.encode(safe_result))
-                logger.debug(f"Result cached: '{key}' (ttl={ttl})")
-
+                await store(redis, key, result)
                 return result
 
             except Exception as exception:
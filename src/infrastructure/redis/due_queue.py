@@ -0,0 +1,58 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Final, cast
+
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.storage.key_builder import StorageKey
+
+# Pops due members atomically, so several processes can poll the same queue safely
+POP_DUE_SCRIPT: Final[str] = """
+local items = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+if #items > 0 then
+    redis.call('ZREM', KEYS[1], unpack(items))
+end
+return items
+"""
+
+
+class DueQueue:
+    client: Redis
+    key: str
+
+    def __init__(self, client: Redis, key: StorageKey) -> None:
+        self.client = client
+        self.key = key.pack()
+        self._pop_due = client.register_script(POP_DUE_SCRIPT)
+
+    async def push(self, member: str, delay: float = 0, nx: bool = False) -> bool:
+        due_at = time.time() + delay
+        added = await cast(Awaitable[int], self.client.zadd(self.key, {member: due_at}, nx=nx))
+        return bool(added)
+
+    async def pop_due_members(self, limit: int) -> list[str]:
+        items = await self._pop_due(keys=[self.key], args=[time.time(), limit])
+        return [item.decode() for item in items]
+
+    async def poll(
+        self,
+        process_due: Callable[[], Awaitable[int]],
+        batch_size: int,
+        interval: float,
+    ) -> None:
+        while True:
+            try:
+                processed = await process_due()
+
+                if processed:
+                    logger.debug(f"Processed '{processed}' due items from '{self.key}'")
+                # A full batch means there is a backlog, keep draining without sleeping
+                if processed < batch_size:
+                    await asyncio.sleep(interval)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as exception:
+                logger.warning(f"Poller of '{self.key}' failed: {exception}")
+                await asyncio.sleep(interval)
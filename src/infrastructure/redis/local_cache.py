@@ -0,0 +1,94 @@
+import asyncio
+from collections import Counter
+from typing import Final, Optional, cast
+
+from cachetools import TTLCache
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.constants import LOCAL_CACHE_MAXSIZE, LOCAL_CACHE_TTL
+
+CACHE_INVALIDATION_CHANNEL: Final[str] = "cache:invalidate"
+RECONNECT_DELAY: Final[int] = 5
+
+
+class LocalCache:
+    _store: TTLCache[str, bytes]
+    _hits: Counter[str]
+    _misses: Counter[str]
+
+    def __init__(self, maxsize: int = LOCAL_CACHE_MAXSIZE, ttl: float = LOCAL_CACHE_TTL) -> None:
+        self._store = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._hits = Counter()
+        self._misses = Counter()
+
+    def get(self, prefix: str, key: str) -> Optional[bytes]:
+        value = cast(Optional[bytes], self._store.get(key))
+
+        if value is None:
+            self._misses[prefix] += 1
+        else:
+            self._hits[prefix] += 1
+
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        self._store[key] = value
+
+    def evict(self, *keys: str) -> None:
+        for key in keys:
+            self._store.pop(key, None)
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {
+            prefix: {"hits": self._hits[prefix], "misses": self._misses[prefix]}
+            for prefix in self._hits.keys() | self._misses.keys()
+        }
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+
+local_cache = LocalCache()
+
+
+async def invalidate_cache(redis: Redis, *keys: str) -> None:
+    if not keys:
+        return
+
+    local_cache.evict(*keys)
+
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.delete(*keys)
+        pipe.publish(CACHE_INVALIDATION_CHANNEL, "\n".join(keys))
+        await pipe.execute()
+
+
+async def listen_cache_invalidations(redis: Redis) -> None:
+    while True:
+        pubsub = redis.pubsub(ignore_subscribe_messages=True)
+
+        try:
+            await pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+            # Messages published while we were disconnected are lost
+            local_cache.clear()
+            logger.debug(f"Subscribed to '{CACHE_INVALIDATION_CHANNEL}'")
+
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+
+                keys = message["data"].decode().split("\n")
+                local_cache.evict(*keys)
+                logger.debug(f"Local cache evicted by broadcast: {keys}")
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            logger.warning(f"Cache invalidation listener failed: {exception}")
+            await asyncio.sleep(RECONNECT_DELAY)
+        finally:
+            await pubsub.aclose()  # type: ignore[no-untyped-call]
@@ -0,0 +1,58 @@
+from collections import defaultdict
+from functools import partial
+
+from aiogram import Bot
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.constants import (
+    MESSAGE_DELETION_BATCH_SIZE,
+    MESSAGE_DELETION_POLL_INTERVAL,
+    TELEGRAM_DELETE_MESSAGES_LIMIT,
+)
+from src.core.storage.keys import MessageDeletionQueueKey
+from src.core.utils.iterables import chunked
+
+from .due_queue import DueQueue
+
+
+class MessageDeletionQueue(DueQueue):
+    def __init__(self, client: Redis) -> None:
+        super().__init__(client, MessageDeletionQueueKey())
+
+    async def schedule(self, chat_id: int, message_id: int, delay: float = 0) -> None:
+        await self.push(f"{chat_id}:{message_id}", delay=delay)
+        logger.debug(
+            f"Scheduled message '{message_id}' in chat '{chat_id}' "
+            f"for auto-deletion in '{delay}' seconds"
+        )
+
+    async def pop_due(self, limit: int = MESSAGE_DELETION_BATCH_SIZE) -> dict[int, list[int]]:
+        messages: dict[int, list[int]] = defaultdict(list)
+
+        for item in await self.pop_due_members(limit):
+            chat_id, message_id = item.split(":", 1)
+            messages[int(chat_id)].append(int(message_id))
+
+        return messages
+
+    async def delete_due(self, bot: Bot) -> int:
+        messages = await self.pop_due()
+
+        for chat_id, message_ids in messages.items():
+            for batch in chunked(sorted(message_ids), TELEGRAM_DELETE_MESSAGES_LIMIT):
+                try:
+                    await bot.delete_messages(chat_id=chat_id, message_ids=batch)
+                except Exception as exception:
+                    logger.error(
+                        f"Failed to delete '{len(batch)}' messages in chat '{chat_id}': {exception}"
+                    )
+
+        return sum(len(message_ids) for message_ids in messages.values())
+
+    async def run_poller(self, bot: Bot) -> None:
+        await self.poll(
+            partial(self.delete_due, bot),
+            batch_size=MESSAGE_DELETION_BATCH_SIZE,
+            interval=MESSAGE_DELETION_POLL_INTERVAL,
+        )
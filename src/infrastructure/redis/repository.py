@@ -2,7 +2,7 @@ from typing import Any, Awaitable, Final, Optional, Set, TypeVar, cast
 
 from pydantic import BaseModel, TypeAdapter
 from redis.asyncio import Redis
-from redis.typing import ExpiryT
+from redis.typing import EncodableT, ExpiryT, FieldT
 
 from src.core.config import AppConfig
 from src.core.storage.key_builder import StorageKey
@@ -70,6 +70,13 @@ class RedisRepository:
         str_values = [str(v) for v in values]
         return await cast(Awaitable[int], self.client.lpush(key.pack(), *str_values))
 
+    async def list_append(self, key: StorageKey, *values: Any) -> int:
+        str_values = [str(v) for v in values]
+        return await cast(Awaitable[int], self.client.rpush(key.pack(), *str_values))
+
+    async def list_length(self, key: StorageKey) -> int:
+        return await cast(Awaitable[int], self.client.llen(key.pack()))
+
     async def list_remove(self, key: StorageKey, value: Any, count: int = 0) -> int:
         return await cast(Awaitable[int], self.client.lrem(key.pack(), count, str(value)))
 
@@ -82,6 +89,22 @@ class RedisRepository:
 
     #
 
+    async def hash_set(self, key: StorageKey, mapping: dict[Any, Any]) -> int:
+        str_mapping = {
+            str(field): json_utils.encode(
+                value.model_dump(exclude_defaults=True) if isinstance(value, BaseModel) else value
+            )
+            for field, value in mapping.items()
+        }
+        return await cast(Awaitable[int], self.client.hset(key.pack(), mapping=str_mapping))
+
+    async def hash_values(self, key: StorageKey, validator: type[T]) -> list[T]:
+        values = await cast(Awaitable[list[bytes]], self.client.hvals(key.pack()))
+        adapter = TypeAdapter[T](validator)
+        return [adapter.validate_python(json_utils.decode(value)) for value in values]
+
+    #
+
     async def sorted_collection_add(self, key: StorageKey, mapping: dict[Any, float]) -> int:
         str_mapping = {str(k): v for k, v in mapping.items()}
         return await cast(Awaitable[int], self.client.zadd(key.pack(), str_mapping))
@@ -95,3 +118,27 @@ class RedisRepository:
     async def sorted_collection_remove(self, key: StorageKey, *values: Any) -> int:
         str_values = [str(v) for v in values]
         return await cast(Awaitable[int], self.client.zrem(key.pack(), *str_values))
+
+    #
+
+    async def stream_add(
+        self,
+        key: StorageKey,
+        fields: dict[str, Any],
+        maxlen: Optional[int] = None,
+    ) -> str:
+        str_fields: dict[FieldT, EncodableT] = {
+            field: str(value) for field, value in fields.items()
+        }
+        entry_id = await self.client.xadd(key.pack(), str_fields, maxlen=maxlen, approximate=True)
+        return cast(bytes, entry_id).decode()
+
+    async def stream_range(self, key: StorageKey, count: int) -> list[tuple[str, dict[str, str]]]:
+        entries = await self.client.xrange(key.pack(), count=count)
+        return [
+            (entry_id.decode(), {field.decode(): value.decode() for field, value in data.items()})
+            for entry_id, data in entries
+        ]
+
+    async def stream_delete(self, key: StorageKey, *entry_ids: str) -> int:
+        return await cast(Awaitable[int], self.client.xdel(key.pack(), *entry_ids))
@@ -0,0 +1,45 @@
+from functools import partial
+from typing import Any, Awaitable, Callable
+
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.constants import (
+    SUBSCRIPTION_UPDATE_BATCH_SIZE,
+    SUBSCRIPTION_UPDATE_DEBOUNCE,
+    SUBSCRIPTION_UPDATE_POLL_INTERVAL,
+)
+from src.core.storage.keys import SubscriptionUpdateQueueKey
+
+from .due_queue import DueQueue
+
+
+class SubscriptionUpdateQueue(DueQueue):
+    def __init__(self, client: Redis) -> None:
+        super().__init__(client, SubscriptionUpdateQueueKey())
+
+    async def schedule(self, telegram_id: int, delay: float = SUBSCRIPTION_UPDATE_DEBOUNCE) -> bool:
+        # NX keeps the first due time, so a burst of panel events is applied once
+        return await self.push(str(telegram_id), delay=delay, nx=True)
+
+    async def pop_due(self, limit: int = SUBSCRIPTION_UPDATE_BATCH_SIZE) -> list[int]:
+        return [int(member) for member in await self.pop_due_members(limit)]
+
+    async def kick_due(self, kick: Callable[[int], Awaitable[Any]]) -> int:
+        telegram_ids = await self.pop_due()
+
+        for telegram_id in telegram_ids:
+            try:
+                await kick(telegram_id)
+            except Exception as exception:
+                logger.error(f"Failed to kick subscription update for '{telegram_id}': {exception}")
+                await self.schedule(telegram_id, delay=SUBSCRIPTION_UPDATE_POLL_INTERVAL)
+
+        return len(telegram_ids)
+
+    async def run_poller(self, kick: Callable[[int], Awaitable[Any]]) -> None:
+        await self.poll(
+            partial(self.kick_due, kick),
+            batch_size=SUBSCRIPTION_UPDATE_BATCH_SIZE,
+            interval=SUBSCRIPTION_UPDATE_POLL_INTERVAL,
+        )
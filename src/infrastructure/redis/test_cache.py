@@ -0,0 +1,85 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import BaseModel, Field
+
+from src.core.utils import json_utils
+from src.infrastructure.redis.cache import redis_cache
+
+
+class PanelResponse(BaseModel):
+    # Как в SDK Remnawave: алиасы без populate_by_name
+    total_users: int = Field(alias="totalUsers")
+
+
+class PanelClient:
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self.calls = 0
+
+    @redis_cache(prefix="panel_stats", ttl=30, stale_ttl=300)
+    async def get_stats(self) -> PanelResponse:
+        self.calls += 1
+        return PanelResponse(totalUsers=self.calls)
+
+
+def make_redis(cached_value, remaining_ttl):
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[cached_value, remaining_ttl])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    redis = AsyncMock()
+    redis.pipeline = MagicMock(return_value=pipe)
+    return redis
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_stores_miss_for_ttl_plus_stale_ttl():
+    # Arrange
+    redis = make_redis(None, -2)
+    client = PanelClient(redis)
+
+    # Act
+    result = await client.get_stats()
+
+    # Assert
+    assert result.total_users == 1
+    key, expire, value = redis.setex.await_args.args
+    assert key == "cache:panel_stats"
+    assert expire == 330
+    assert json_utils.decode(value) == {"totalUsers": 1}
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_serves_fresh_value_without_refresh():
+    # Arrange
+    redis = make_redis(b'{"totalUsers": 7}', 320)
+    client = PanelClient(redis)
+
+    # Act
+    result = await client.get_stats()
+
+    # Assert
+    assert result.total_users == 7
+    assert client.calls == 0
+    redis.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_serves_stale_value_and_refreshes_in_background():
+    # Arrange
+    redis = make_redis(b'{"totalUsers": 7}', 120)
+    redis.set.return_value = True
+    client = PanelClient(redis)
+
+    # Act
+    result = await client.get_stats()
+    await asyncio.sleep(0)
+
+    # Assert
+    # Устаревшее значение отдаётся сразу, обновление идёт в фоне
+    assert result.total_users == 7
+    assert client.calls == 1
+    redis.setex.assert_awaited_once()
+    redis.delete.assert_awaited_once_with("cache:panel_stats:refresh")
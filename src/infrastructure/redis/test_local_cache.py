@@ -0,0 +1,64 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.redis.local_cache import (
+    CACHE_INVALIDATION_CHANNEL,
+    LocalCache,
+    invalidate_cache,
+    local_cache,
+)
+
+
+def test_local_cache_counts_hits_and_misses():
+    cache = LocalCache(maxsize=10, ttl=60)
+
+    assert cache.get("get_user", "cache:get_user:1") is None
+    cache.set("cache:get_user:1", b"{}")
+    assert cache.get("get_user", "cache:get_user:1") == b"{}"
+    assert cache.get("get_user", "cache:get_user:1") == b"{}"
+
+    assert cache.stats() == {"get_user": {"hits": 2, "misses": 1}}
+
+
+def test_local_cache_evicts_keys():
+    cache = LocalCache(maxsize=10, ttl=60)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+
+    cache.evict("a", "missing")
+
+    assert cache.get("p", "a") is None
+    assert cache.get("p", "b") == b"2"
+    assert len(cache) == 1
+
+
+def test_local_cache_is_bounded():
+    cache = LocalCache(maxsize=2, ttl=60)
+
+    for key in ("a", "b", "c"):
+        cache.set(key, b"1")
+
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_cache_evicts_locally_and_publishes():
+    local_cache.set("cache:get_settings", b"{}")
+
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    redis = MagicMock()
+    redis.pipeline.return_value = pipe
+
+    await invalidate_cache(redis, "cache:get_settings", "cache:get_user:1")
+
+    # Локальная копия удалена сразу, остальные процессы узнают через pub/sub
+    assert local_cache.get("get_settings", "cache:get_settings") is None
+    pipe.delete.assert_called_once_with("cache:get_settings", "cache:get_user:1")
+    pipe.publish.assert_called_once_with(
+        CACHE_INVALIDATION_CHANNEL, "cache:get_settings\ncache:get_user:1"
+    )
+    pipe.execute.assert_awaited_once()
@@ -0,0 +1,59 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.constants import TELEGRAM_DELETE_MESSAGES_LIMIT
+from src.core.storage.keys import MessageDeletionQueueKey
+from src.infrastructure.redis.message_deletion import MessageDeletionQueue
+
+
+@pytest.fixture
+def queue():
+    client = MagicMock()
+    client.zadd = AsyncMock()
+    client.register_script.return_value = AsyncMock(return_value=[])
+    return MessageDeletionQueue(client)
+
+
+@pytest.mark.asyncio
+async def test_schedule_scores_member_by_due_time(queue):
+    # Act
+    await queue.schedule(chat_id=1, message_id=10, delay=60)
+
+    # Assert
+    key, mapping = queue.client.zadd.await_args.args
+    assert key == MessageDeletionQueueKey().pack()
+    assert list(mapping) == ["1:10"]
+
+
+@pytest.mark.asyncio
+async def test_pop_due_groups_messages_by_chat(queue):
+    # Arrange
+    queue._pop_due.return_value = [b"1:10", b"2:20", b"1:11"]
+
+    # Act
+    messages = await queue.pop_due(limit=3)
+
+    # Assert
+    assert messages == {1: [10, 11], 2: [20]}
+    assert queue._pop_due.await_args.kwargs["args"][1] == 3
+
+
+@pytest.mark.asyncio
+async def test_delete_due_batches_per_chat(queue):
+    # Arrange
+    count = TELEGRAM_DELETE_MESSAGES_LIMIT + 1
+    queue._pop_due.return_value = [f"1:{i}".encode() for i in range(count)] + [b"2:5"]
+    bot = MagicMock()
+    bot.delete_messages = AsyncMock(side_effect=[True, Exception("boom"), True])
+
+    # Act
+    processed = await queue.delete_due(bot)
+
+    # Assert
+    # Ошибка одного пакета не мешает удалению остальных
+    assert processed == count + 1
+    calls = [call.kwargs for call in bot.delete_messages.await_args_list]
+    assert [call["chat_id"] for call in calls] == [1, 1, 2]
+    assert len(calls[0]["message_ids"]) == TELEGRAM_DELETE_MESSAGES_LIMIT
+    assert calls[2]["message_ids"] == [5]
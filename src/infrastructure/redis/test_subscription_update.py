@@ -0,0 +1,44 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.storage.keys import SubscriptionUpdateQueueKey
+from src.infrastructure.redis.subscription_update import SubscriptionUpdateQueue
+
+
+@pytest.fixture
+def queue():
+    client = MagicMock()
+    client.zadd = AsyncMock(return_value=1)
+    client.register_script.return_value = AsyncMock(return_value=[])
+    return SubscriptionUpdateQueue(client)
+
+
+@pytest.mark.asyncio
+async def test_schedule_keeps_first_due_time(queue):
+    # Act
+    scheduled = await queue.schedule(telegram_id=1)
+
+    # Assert
+    assert scheduled
+    key, mapping = queue.client.zadd.await_args.args
+    assert key == SubscriptionUpdateQueueKey().pack()
+    assert list(mapping) == ["1"]
+    assert queue.client.zadd.await_args.kwargs["nx"] is True
+
+
+@pytest.mark.asyncio
+async def test_kick_due_reschedules_failed_kicks(queue):
+    # Arrange
+    queue._pop_due.return_value = [b"1", b"2"]
+    kick = AsyncMock(side_effect=[None, Exception("broker is down")])
+
+    # Act
+    processed = await queue.kick_due(kick)
+
+    # Assert
+    # Неудачная постановка задачи не теряет обновление, а возвращает его в очередь
+    assert processed == 2
+    assert [call.args for call in kick.await_args_list] == [(1,), (2,)]
+    _, mapping = queue.client.zadd.await_args.args
+    assert list(mapping) == ["2"]
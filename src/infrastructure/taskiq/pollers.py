@@ -0,0 +1,43 @@
+import asyncio
+from typing import Any
+
+from aiogram import Bot
+from dishka import AsyncContainer
+from loguru import logger
+from taskiq import AsyncBroker, TaskiqEvents, TaskiqState
+
+from src.infrastructure.redis import MessageDeletionQueue, SubscriptionUpdateQueue
+
+
+def setup_pollers(container: AsyncContainer, broker: AsyncBroker) -> None:
+    pollers: set[asyncio.Task[Any]] = set()
+
+    # Pollers start with the worker instead of on first use of their queue,
+    # so due items are drained even if nothing in this process touched it yet
+    async def start_pollers(state: TaskiqState) -> None:
+        from src.infrastructure.taskiq.tasks.subscriptions import (  # noqa: PLC0415
+            apply_subscription_update_task,
+        )
+
+        bot = await container.get(Bot)
+        message_deletion_queue = await container.get(MessageDeletionQueue)
+        subscription_update_queue = await container.get(SubscriptionUpdateQueue)
+
+        pollers.add(asyncio.create_task(message_deletion_queue.run_poller(bot)))
+        pollers.add(
+            asyncio.create_task(
+                subscription_update_queue.run_poller(apply_subscription_update_task.kiq)
+            )
+        )
+        logger.debug(f"Started '{len(pollers)}' background pollers")
+
+    async def stop_pollers(state: TaskiqState) -> None:
+        for poller in pollers:
+            poller.cancel()
+
+        await asyncio.gather(*pollers, return_exceptions=True)
+        pollers.clear()
+        logger.debug("Stopped background pollers")
+
+    broker.add_event_handler(TaskiqEvents.WORKER_STARTUP, start_pollers)
+    broker.add_event_handler(TaskiqEvents.WORKER_SHUTDOWN, stop_pollers)
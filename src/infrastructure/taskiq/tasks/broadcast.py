@@ -1,15 +1,31 @@
 import asyncio
-from typing import cast
+import time
+from typing import Iterable, Optional, cast
 
 from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
 from dishka.integrations.taskiq import FromDishka, inject
 from loguru import logger
 
-from src.core.constants import BATCH_DELAY, BATCH_SIZE
-from src.core.enums import BroadcastMessageStatus, BroadcastStatus
+from src.core.constants import (
+    BROADCAST_CANCEL_CHECK_INTERVAL,
+    BROADCAST_CHAT_RATE_LIMIT,
+    BROADCAST_CONCURRENCY,
+    BROADCAST_FLUSH_INTERVAL,
+    BROADCAST_FLUSH_SIZE,
+    BROADCAST_MAX_RETRIES,
+    BROADCAST_RATE_LIMIT,
+)
+from src.core.enums import BroadcastAudience, BroadcastMessageStatus, BroadcastStatus
 from src.core.utils.iterables import chunked
 from src.core.utils.message_payload import MessagePayload
-from src.infrastructure.database.models.dto import BroadcastDto, BroadcastMessageDto, UserDto
+from src.core.utils.rate_limiter import RateLimiter
+from src.infrastructure.database.models.dto import (
+    BroadcastDeletionDto,
+    BroadcastDto,
+    BroadcastMessageDto,
+    UserDto,
+)
 from src.infrastructure.taskiq.broker import broker
 from src.services.broadcast import BroadcastService
 from src.services.notification import NotificationService
@@ -19,103 +35,88 @@ from src.services.notification import NotificationService
 @inject
 async def send_broadcast_task(
     broadcast: BroadcastDto,
-    users: list[UserDto],
+    audience: BroadcastAudience,
+    plan_id: Optional[int],
     payload: MessagePayload,
     notification_service: FromDishka[NotificationService],
     broadcast_service: FromDishka[BroadcastService],
 ) -> None:
     broadcast_id = cast(int, broadcast.id)
-    total_users = len(users)
+    total_users = broadcast.total_count
 
     logger.info(f"Started sending broadcast '{broadcast_id}', total users: '{total_users}'")
 
-    try:
-        broadcast_messages = await broadcast_service.create_messages(
-            broadcast_id,
-            [
-                BroadcastMessageDto(user_id=user.telegram_id, status=BroadcastMessageStatus.PENDING)
-                for user in users
-            ],
-        )
-        logger.debug(
-            f"Created '{len(broadcast_messages)}' message DTOs for broadcast '{broadcast_id}'"
-        )
-    except Exception:
-        logger.error(
-            f"Failed to create message DTOs for broadcast '{broadcast_id}'",
-            exc_info=True,
-        )
-        broadcast.status = BroadcastStatus.ERROR
-        await broadcast_service.update(broadcast)
-        return
-
-    user_message_pairs = zip(users, broadcast_messages)
+    limiter = RateLimiter(
+        global_rate=BROADCAST_RATE_LIMIT,
+        chat_rate=BROADCAST_CHAT_RATE_LIMIT,
+    )
+    semaphore = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+    buffer = _MessageStatusBuffer(broadcast_service, broadcast)
 
     try:
-        total_batches = (total_users + BATCH_SIZE - 1) // BATCH_SIZE
-
-        for batch_index, batch in enumerate(chunked(user_message_pairs, BATCH_SIZE)):
-            batch_number = batch_index + 1
-            batch_size = len(batch)
-
-            logger.info(
-                f"Processing broadcast '{broadcast_id}' batch "
-                f"{batch_number}/{total_batches}, size: '{batch_size}'"
-            )
-
-            for user, message in batch:
-                user_id = user.telegram_id
+        async for users in broadcast_service.iter_audience_users(audience, plan_id):
+            try:
+                broadcast_messages = await broadcast_service.create_messages(
+                    broadcast_id,
+                    [
+                        BroadcastMessageDto(
+                            user_id=user.telegram_id,
+                            status=BroadcastMessageStatus.PENDING,
+                        )
+                        for user in users
+                    ],
+                )
+                logger.debug(
+                    f"Created '{len(broadcast_messages)}' message DTOs "
+                    f"for broadcast '{broadcast_id}'"
+                )
+            except Exception:
+                logger.error(
+                    f"Failed to create message DTOs for broadcast '{broadcast_id}'",
+                    exc_info=True,
+                )
+                broadcast.status = BroadcastStatus.ERROR
+                await broadcast_service.update(broadcast)
+                return
 
-                status = await broadcast_service.get_status(broadcast.task_id)
+            user_message_pairs = _pair_messages(users, broadcast_messages)
 
-                if status == BroadcastStatus.CANCELED:
+            for batch in chunked(user_message_pairs, BROADCAST_CANCEL_CHECK_INTERVAL):
+                if await broadcast_service.is_canceled(broadcast.task_id):
                     logger.warning(f"Broadcast '{broadcast_id}' canceled, terminating task")
                     broadcast.status = BroadcastStatus.CANCELED
-                    await broadcast_service.update(broadcast)
+                    await buffer.flush(final=True)
                     return
 
-                try:
-                    tg_message = await notification_service.notify_user(user=user, payload=payload)
+                await asyncio.gather(
+                    *(
+                        _send_broadcast_message(
+                            notification_service=notification_service,
+                            limiter=limiter,
+                            semaphore=semaphore,
+                            user=user,
+                            message=message,
+                            payload=payload,
+                            broadcast_id=broadcast_id,
+                        )
+                        for user, message in batch
+                    )
+                )
 
-                    if tg_message:
-                        message.message_id = tg_message.message_id
-                        message.status = BroadcastMessageStatus.SENT
+                for _, message in batch:
+                    if message.status == BroadcastMessageStatus.SENT:
                         broadcast.success_count += 1
-                        logger.debug(
-                            f"Msg SENT to user '{user_id}' "
-                            f"(ID: '{tg_message.message_id}') for broadcast '{broadcast_id}'"
-                        )
                     else:
-                        message.status = BroadcastMessageStatus.FAILED
                         broadcast.failed_count += 1
-                        logger.debug(
-                            f"Msg FAILED for user '{user_id}' on broadcast '{broadcast_id}'"
-                        )
-                except Exception:
-                    message.status = BroadcastMessageStatus.FAILED
-                    broadcast.failed_count += 1
-                    logger.error(
-                        f"Exception notifying user '{user_id}' for broadcast '{broadcast_id}'",
-                        exc_info=True,
-                    )
-
-                try:
-                    await broadcast_service.update_message(broadcast_id, message)
-                except Exception:
-                    logger.error(
-                        f"Failed to update message status for user '{user_id}', "
-                        f"broadcast '{broadcast_id}'",
-                        exc_info=True,
-                    )
 
-            await asyncio.sleep(BATCH_DELAY)
-            await broadcast_service.update(broadcast)
+                buffer.add(message for _, message in batch)
+                await buffer.flush_if_due()
 
         broadcast.status = BroadcastStatus.COMPLETED
-        await broadcast_service.update(broadcast)
+        await buffer.flush(final=True)
         logger.info(
             f"Broadcast '{broadcast_id}' COMPLETED. "
-            f"Success: '{broadcast.success_count}', Failed: ''{broadcast.failed_count}"
+            f"Success: '{broadcast.success_count}', Failed: '{broadcast.failed_count}'"
         )
 
     except Exception:
@@ -124,89 +125,280 @@ async def send_broadcast_task(
             exc_info=True,
         )
         broadcast.status = BroadcastStatus.ERROR
-        await broadcast_service.update(broadcast)
+        await buffer.flush(final=True)
+
+
+async def _delete_broadcast_message(
+    bot: Bot,
+    limiter: RateLimiter,
+    semaphore: asyncio.Semaphore,
+    message: BroadcastMessageDto,
+    broadcast_id: int,
+) -> bool:
+    user_id = message.user_id
+    message_id = message.message_id
+
+    if not message_id:
+        logger.warning(f"Skipping deletion for user '{user_id}'. No message_id found")
+        return False
+
+    async with semaphore:
+        for attempt in range(1, BROADCAST_MAX_RETRIES + 1):
+            await limiter.acquire(user_id)
+
+            try:
+                deleted = await bot.delete_message(chat_id=user_id, message_id=message_id)
+            except TelegramRetryAfter as exception:
+                limiter.pause(exception.retry_after)
+                logger.warning(
+                    f"Flood control on deleting broadcast '{broadcast_id}' for user '{user_id}', "
+                    f"retry after '{exception.retry_after}' seconds "
+                    f"(attempt {attempt}/{BROADCAST_MAX_RETRIES})"
+                )
+                continue
+            except Exception:
+                logger.error(
+                    f"Exception during message deletion for user '{user_id}'. "
+                    f"ID: '{message_id}', broadcast '{broadcast_id}'",
+                    exc_info=True,
+                )
+                return False
+
+            if deleted:
+                message.status = BroadcastMessageStatus.DELETED
+                logger.debug(
+                    f"Message DELETED for user '{user_id}'. "
+                    f"ID: '{message_id}', broadcast '{broadcast_id}'"
+                )
+                return True
+
+            logger.debug(
+                f"Deletion FAILED for user '{user_id}'. "
+                f"ID: '{message_id}', broadcast '{broadcast_id}'"
+            )
+            return False
+
+    return False
+
+
+def _pair_messages(
+    users: list[UserDto],
+    messages: list[BroadcastMessageDto],
+) -> list[tuple[UserDto, BroadcastMessageDto]]:
+    # Paired by recipient, so a reordered insert result can't swap users' messages
+    messages_by_user = {message.user_id: message for message in messages}
+    return [
+        (user, messages_by_user[user.telegram_id])
+        for user in users
+        if user.telegram_id in messages_by_user
+    ]
+
+
+class _MessageStatusBuffer:
+    def __init__(self, broadcast_service: BroadcastService, broadcast: BroadcastDto) -> None:
+        self.broadcast_service = broadcast_service
+        self.broadcast = broadcast
+        self.messages: list[BroadcastMessageDto] = []
+        self.flushed_at = time.monotonic()
+        self.failures = 0
+
+    def add(self, messages: Iterable[BroadcastMessageDto]) -> None:
+        self.messages.extend(messages)
+
+    async def flush_if_due(self) -> None:
+        if (
+            len(self.messages) >= BROADCAST_FLUSH_SIZE
+            or time.monotonic() - self.flushed_at >= BROADCAST_FLUSH_INTERVAL
+        ):
+            await self.flush()
+
+    async def flush(self, final: bool = False) -> None:
+        self.flushed_at = time.monotonic()
+
+        try:
+            await self.broadcast_service.update(self.broadcast)
+            await self.broadcast_service.update_messages(self.messages)
+        except Exception:
+            # The aborted transaction must be cleared before the session can be reused
+            await self.broadcast_service.uow.rollback()
+            self.failures += 1
+            logger.error(
+                f"Failed to update '{len(self.messages)}' message statuses "
+                f"for broadcast '{self.broadcast.id}' (attempt {self.failures})",
+                exc_info=True,
+            )
+
+            # Statuses are kept and retried on the next flush, the last flush has no next one
+            if final or self.failures >= BROADCAST_MAX_RETRIES:
+                raise
+            return
+
+        self.messages = []
+        self.failures = 0
+        logger.info(
+            f"Broadcast '{self.broadcast.id}' progress: "
+            f"'{self.broadcast.success_count + self.broadcast.failed_count}"
+            f"/{self.broadcast.total_count}'"
+        )
+
+
+async def _send_broadcast_message(
+    notification_service: NotificationService,
+    limiter: RateLimiter,
+    semaphore: asyncio.Semaphore,
+    user: UserDto,
+    message: BroadcastMessageDto,
+    payload: MessagePayload,
+    broadcast_id: int,
+) -> None:
+    user_id = user.telegram_id
+
+    async with semaphore:
+        for attempt in range(1, BROADCAST_MAX_RETRIES + 1):
+            await limiter.acquire(user_id)
+
+            try:
+                tg_message = await notification_service.notify_user(
+                    user=user,
+                    payload=payload,
+                    raise_on_flood=True,
+                )
+            except TelegramRetryAfter as exception:
+                limiter.pause(exception.retry_after)
+                logger.warning(
+                    f"Flood control on broadcast '{broadcast_id}' for user '{user_id}', "
+                    f"retry after '{exception.retry_after}' seconds "
+                    f"(attempt {attempt}/{BROADCAST_MAX_RETRIES})"
+                )
+                continue
+            except Exception:
+                logger.error(
+                    f"Exception notifying user '{user_id}' for broadcast '{broadcast_id}'",
+                    exc_info=True,
+                )
+                break
+
+            if tg_message:
+                message.message_id = tg_message.message_id
+                message.status = BroadcastMessageStatus.SENT
+                logger.debug(
+                    f"Msg SENT to user '{user_id}' "
+                    f"(ID: '{tg_message.message_id}') for broadcast '{broadcast_id}'"
+                )
+                return
+
+            logger.debug(f"Msg FAILED for user '{user_id}' on broadcast '{broadcast_id}'")
+            break
+
+    message.status = BroadcastMessageStatus.FAILED
 
 
 @broker.task
 @inject
 async def delete_broadcast_task(
     broadcast: BroadcastDto,
+    user: UserDto,
     bot: FromDishka[Bot],
     broadcast_service: FromDishka[BroadcastService],
+    notification_service: FromDishka[NotificationService],
 ) -> tuple[int, int, int]:
     broadcast_id = cast(int, broadcast.id)
     logger.info(f"Started deleting messages for broadcast '{broadcast_id}'")
 
-    deleted_count = 0
-    failed_count = 0
-
-    if not broadcast.messages:
-        logger.error(f"Messages list is empty for broadcast '{broadcast_id}', aborting deletion")
-        raise ValueError(f"Broadcast '{broadcast_id}' messages is empty")
-
-    total_messages = len(broadcast.messages)
-
-    for message in broadcast.messages:
-        user_id = message.user_id
-        message_id = message.message_id
-        current_status = message.status.value
+    # Already deleted messages are persisted, so a restarted task resumes from them
+    deleted_count = await broadcast_service.count_messages(
+        broadcast_id,
+        BroadcastMessageStatus.DELETED,
+    )
+    pending_count = await broadcast_service.count_messages(
+        broadcast_id,
+        BroadcastMessageStatus.SENT,
+        BroadcastMessageStatus.EDITED,
+    )
+    progress = BroadcastDeletionDto(
+        total_count=deleted_count + pending_count,
+        deleted_count=deleted_count,
+    )
+    await broadcast_service.set_deletion_progress(broadcast.task_id, progress)
 
-        if message.status not in (BroadcastMessageStatus.SENT, BroadcastMessageStatus.EDITED):
-            logger.debug(f"Skipping deletion for user '{user_id}'. Status: '{current_status}'")
-            continue
+    if deleted_count:
+        logger.info(
+            f"Resuming deletion for broadcast '{broadcast_id}', "
+            f"already deleted: '{deleted_count}', pending: '{pending_count}'"
+        )
 
-        if not message_id:
-            logger.warning(f"Skipping deletion for user '{user_id}'. No message_id found")
-            continue
+    limiter = RateLimiter(
+        global_rate=BROADCAST_RATE_LIMIT,
+        chat_rate=BROADCAST_CHAT_RATE_LIMIT,
+    )
+    semaphore = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+
+    async for messages in broadcast_service.iter_deletable_messages(broadcast_id):
+        for batch in chunked(messages, BROADCAST_FLUSH_SIZE):
+            results = await asyncio.gather(
+                *(
+                    _delete_broadcast_message(
+                        bot=bot,
+                        limiter=limiter,
+                        semaphore=semaphore,
+                        message=message,
+                        broadcast_id=broadcast_id,
+                    )
+                    for message in batch
+                )
+            )
+            deleted_messages = [message for message, deleted in zip(batch, results) if deleted]
 
-        try:
-            deleted = await bot.delete_message(chat_id=user_id, message_id=message_id)
+            progress.deleted_count += len(deleted_messages)
+            progress.failed_count += len(batch) - len(deleted_messages)
 
-            if deleted:
-                message.status = BroadcastMessageStatus.DELETED
-                await broadcast_service.update_message(
-                    broadcast_id=broadcast_id,
-                    message=message,
-                )
-                deleted_count += 1
-                logger.debug(
-                    f"Message DELETED for user '{user_id}'. "
-                    f"ID: '{message_id}', broadcast '{broadcast_id}'"
-                )
-            else:
-                failed_count += 1
-                logger.debug(
-                    f"Deletion FAILED for user '{user_id}'. "
-                    f"ID: '{message_id}', broadcast '{broadcast_id}'"
-                )
-        except Exception:
-            failed_count += 1
-            logger.error(
-                f"Exception during message deletion for user '{user_id}'. "
-                f"ID: '{message_id}', broadcast '{broadcast_id}'",
-                exc_info=True,
+            await broadcast_service.update_messages(deleted_messages)
+            await broadcast_service.set_deletion_progress(broadcast.task_id, progress)
+            logger.info(
+                f"Broadcast '{broadcast_id}' deletion progress: "
+                f"'{progress.deleted_count + progress.failed_count}/{progress.total_count}'"
             )
 
+    progress.is_finished = True
+    await broadcast_service.set_deletion_progress(broadcast.task_id, progress)
+
     logger.info(
         f"Deletion finished for broadcast '{broadcast_id}'. "
-        f"Total: '{total_messages}', Deleted: '{deleted_count}', Failed: '{failed_count}'"
+        f"Total: '{progress.total_count}', Deleted: '{progress.deleted_count}', "
+        f"Failed: '{progress.failed_count}'"
+    )
+
+    await notification_service.notify_user(
+        user=user,
+        payload=MessagePayload(
+            i18n_key="ntf-broadcast-deleted-success",
+            i18n_kwargs={
+                "task_id": str(broadcast.task_id),
+                "total_count": progress.total_count,
+                "deleted_count": progress.deleted_count,
+                "failed_count": progress.failed_count,
+            },
+            auto_delete_after=None,
+            add_close_button=True,
+        ),
     )
 
-    return total_messages, deleted_count, failed_count
+    return progress.total_count, progress.deleted_count, progress.failed_count
 
 
 @broker.task(schedule=[{"cron": "0 0 */7 * *"}])
 @inject
 async def delete_broadcasts_task(broadcast_service: FromDishka[BroadcastService]) -> None:
-    broadcasts = await broadcast_service.get_all()
+    deleted = 0
+
+    async for broadcasts in broadcast_service.iter_old():
+        for broadcast in broadcasts:
+            await broadcast_service.delete_broadcast(broadcast.id)  # type: ignore[arg-type]
+            logger.debug(f"Broadcast '{broadcast.id}' deleted")
+            deleted += 1
 
-    if not broadcasts:
+    if not deleted:
         logger.debug("No broadcasts found to delete")
         return
 
-    old_broadcasts = [bc for bc in broadcasts if bc.has_old]
-    logger.debug(f"Found '{len(old_broadcasts)}' old broadcasts to delete")
-
-    for broadcast in old_broadcasts:
-        await broadcast_service.delete_broadcast(broadcast.id)  # type: ignore[arg-type]
-        logger.debug(f"Broadcast '{broadcast.id}' deleted")
+    logger.debug(f"Deleted '{deleted}' old broadcasts")
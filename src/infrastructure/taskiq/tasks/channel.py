@@ -0,0 +1,10 @@
+from dishka.integrations.taskiq import FromDishka, inject
+
+from src.infrastructure.taskiq.broker import broker
+from src.services.channel import ChannelService
+
+
+@broker.task(schedule=[{"cron": "0 */6 * * *"}])
+@inject
+async def reverify_channel_members_task(channel_service: FromDishka[ChannelService]) -> None:
+    await channel_service.reverify_members()
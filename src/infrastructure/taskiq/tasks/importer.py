@@ -1,21 +1,23 @@
+import asyncio
 from uuid import UUID
 
 from dishka.integrations.taskiq import FromDishka, inject
 from loguru import logger
 from remnawave import RemnawaveSDK
 from remnawave.exceptions import BadRequestError
-from remnawave.models import CreateUserRequestDto, UserResponseDto, UsersResponseDto
+from remnawave.models import CreateUserRequestDto
 
-from src.core.constants import IMPORTED_TAG
-from src.core.utils.formatters import format_limits_to_plan_type
+from src.core.constants import IMPORT_CONCURRENCY, IMPORTED_TAG
+from src.core.utils.message_payload import MessagePayload
 from src.core.utils.types import RemnaUserDto
 from src.infrastructure.database.models.dto import (
-    PlanSnapshotDto,
+    ImportChunkResultDto,
     RemnaSubscriptionDto,
-    SubscriptionDto,
+    UserDto,
 )
 from src.infrastructure.taskiq.broker import broker
-from src.infrastructure.taskiq.tasks.subscriptions import sync_current_subscription_task
+from src.services.importer import ImporterService
+from src.services.notification import NotificationService
 from src.services.remnawave import RemnawaveService
 from src.services.subscription import SubscriptionService
 from src.services.user import UserService
@@ -24,32 +26,109 @@ from src.services.user import UserService
 @broker.task
 @inject
 async def import_exported_users_task(
-    imported_users: list[dict],
-    active_internal_squads: list[UUID],
+    import_id: UUID,
+    user: UserDto,
     remnawave: FromDishka[RemnawaveSDK],
-) -> tuple[int, int]:
-    logger.info(f"Starting import of '{len(imported_users)}' users")
+    importer_service: FromDishka[ImporterService],
+    notification_service: FromDishka[NotificationService],
+) -> None:
+    job = await importer_service.get_import(import_id)
+
+    if not job:
+        logger.warning(f"Import '{import_id}' not found or expired, skipping")
+        return
+
+    if not await importer_service.acquire_import_lock(import_id):
+        logger.warning(f"Import '{import_id}' is already running, skipping")
+        return
+
+    try:
+        # Finished chunks are checkpointed, so a restarted task resumes from the rest
+        checkpoints = await importer_service.get_checkpoints(import_id)
+
+        if checkpoints:
+            logger.info(
+                f"Resuming import '{import_id}', "
+                f"finished chunks: '{len(checkpoints)}/{job.chunks_count}'"
+            )
+        else:
+            logger.info(f"Starting import '{import_id}' of '{job.total_count}' users")
+
+        semaphore = asyncio.Semaphore(IMPORT_CONCURRENCY)
+
+        for chunk in range(job.chunks_count):
+            if chunk in checkpoints:
+                continue
+
+            users = await importer_service.get_import_chunk(job, chunk)
+            results = await asyncio.gather(
+                *(
+                    _create_panel_user(
+                        remnawave=remnawave,
+                        semaphore=semaphore,
+                        user=imported_user,
+                        active_internal_squads=job.active_internal_squads,
+                    )
+                    for imported_user in users
+                )
+            )
+            success_count = sum(results)
+            result = ImportChunkResultDto(
+                chunk=chunk,
+                success_count=success_count,
+                failed_count=len(results) - success_count,
+            )
+            await importer_service.save_checkpoint(import_id, result)
+            await importer_service.refresh_import_lock(import_id)
+            logger.info(f"Import '{import_id}' progress: chunk '{chunk + 1}/{job.chunks_count}'")
+    finally:
+        await importer_service.release_import_lock(import_id)
+
+    progress = await importer_service.get_progress(import_id)
+
+    if not progress:
+        return
+
+    logger.info(
+        f"Import '{import_id}' completed: '{progress.success_count}' successful, "
+        f"'{progress.failed_count}' failed"
+    )
+
+    await notification_service.notify_user(
+        user=user,
+        payload=MessagePayload(
+            i18n_key="ntf-importer-import-completed",
+            i18n_kwargs={
+                "total_count": progress.total_count,
+                "success_count": progress.success_count,
+                "failed_count": progress.failed_count,
+            },
+            auto_delete_after=None,
+            add_close_button=True,
+        ),
+    )
+
 
-    success_count = 0
-    failed_count = 0
+async def _create_panel_user(
+    remnawave: RemnawaveSDK,
+    semaphore: asyncio.Semaphore,
+    user: dict,
+    active_internal_squads: list[UUID],
+) -> bool:
+    username = user.get("username")
 
-    for user in imported_users:
+    async with semaphore:
         try:
-            username = user["username"]
             created_user = CreateUserRequestDto.model_validate(user)
             created_user.active_internal_squads = active_internal_squads
             await remnawave.users.create_user(created_user)
-            success_count += 1
+            return True
         except BadRequestError as error:
             logger.warning(f"User '{username}' already exists, skipping. Error: {error}")
-            failed_count += 1
-
         except Exception as exception:
             logger.exception(f"Failed to create user '{username}' exception: {exception}")
-            failed_count += 1
 
-    logger.info(f"Import completed: '{success_count}' successful, '{failed_count}' failed")
-    return success_count, failed_count
+    return False
 
 
 @broker.task
@@ -73,73 +152,35 @@ async def sync_imported_user_task(remna_user: RemnaUserDto) -> None:
 @broker.task
 @inject
 async def sync_all_users_from_panel_task(
-    remnawave: FromDishka[RemnawaveSDK],
+    remnawave_service: FromDishka[RemnawaveService],
     user_service: FromDishka[UserService],
     subscription_service: FromDishka[SubscriptionService],
 ) -> dict[str, int]:
-    all_remna_users: list[UserResponseDto] = []
-    start = 0
-    size = 50
-
-    while True:
-        response = await remnawave.users.get_all_users_v2(start=start, size=size)
-        logger.success(response)
-        if not isinstance(response, UsersResponseDto) or not response.users:
-            break
-
-        all_remna_users.extend(response.users)
-        start += len(response.users)
-
-        if len(response.users) < size:
-            break
-
-    bot_users = await user_service.get_all()
-    bot_users_map = {user.telegram_id: user for user in bot_users}
-
-    logger.info(f"Total users in panel: '{len(all_remna_users)}'")
-    logger.info(f"Total users in bot: '{len(bot_users)}'")
-
+    total_panel_users = 0
     added = 0
     updated = 0
     errors = 0
     missing_telegram = 0
 
-    for remna_user in all_remna_users:
-        try:
-            if not remna_user.telegram_id:
-                missing_telegram += 1
-                continue
-
-            user = bot_users_map.get(remna_user.telegram_id)
-
-            if not user:
-                await create_user_from_panel_task.kiq(remna_user)
-                added += 1
-            else:
-                current_subscription = await subscription_service.get_current(user.telegram_id)
-                if not current_subscription:
-                    await create_user_from_panel_task.kiq(remna_user)
-                    added += 1
-                else:
-                    logger.success(remna_user.hwid_device_limit)
-                    remna_subscription = RemnaSubscriptionDto.from_remna_user(
-                        remna_user.model_dump()
-                    )
-                    logger.success(remna_subscription.device_limit)
-                    await sync_current_subscription_task.kiq(
-                        remna_user.telegram_id, remna_subscription
-                    )
-                    updated += 1
+    async for remna_users in remnawave_service.iter_users():
+        total_panel_users += len(remna_users)
+        users = [remna_user for remna_user in remna_users if remna_user.telegram_id]
+        missing_telegram += len(remna_users) - len(users)
 
+        try:
+            page_updated, page_added = await subscription_service.sync_from_panel(users)
+            updated += page_updated
+            added += page_added
         except Exception as exception:
+            await subscription_service.uow.rollback()
             logger.exception(
-                f"Error syncing RemnaUser '{remna_user.telegram_id}' exception: {exception}"
+                f"Error syncing page of '{len(users)}' RemnaUsers exception: {exception}"
             )
-            errors += 1
+            errors += len(users)
 
     result = {
-        "total_panel_users": len(all_remna_users),
-        "total_bot_users": len(bot_users),
+        "total_panel_users": total_panel_users,
+        "total_bot_users": await user_service.count(),
         "added": added,
         "updated": updated,
         "errors": errors,
@@ -174,27 +215,6 @@ async def create_user_from_panel_task(
         subscription_url = await remnawave_service.get_subscription_url(remna_user.uuid)
         remna_subscription.url = subscription_url  # type: ignore[assignment]
 
-    temp_plan = PlanSnapshotDto(
-        id=-1,
-        name=IMPORTED_TAG,
-        type=format_limits_to_plan_type(
-            remna_subscription.traffic_limit,
-            remna_subscription.device_limit,
-        ),
-        traffic_limit=remna_subscription.traffic_limit,
-        device_limit=remna_subscription.device_limit,
-        duration=-1,
-        internal_squads=remna_subscription.internal_squads,
-    )
-    subscription = SubscriptionDto(
-        user_remna_id=remna_user.uuid,
-        status=remna_user.status,
-        traffic_limit=temp_plan.traffic_limit,
-        device_limit=temp_plan.device_limit,
-        internal_squads=remna_subscription.internal_squads,
-        expire_at=remna_user.expire_at,
-        url=remna_subscription.url,
-        plan=temp_plan,
-    )
+    subscription = subscription_service.build_imported(remna_user, remna_subscription)
     await subscription_service.create(user, subscription)
     logger.info(f"User and subscription successfully created for '{remna_user.telegram_id}'")
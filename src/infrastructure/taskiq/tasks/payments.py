@@ -26,16 +26,16 @@ async def handle_payment_transaction_task(
 @broker.task(schedule=[{"cron": "*/30 * * * *"}])
 @inject
 async def cancel_transaction_task(transaction_service: FromDishka[TransactionService]) -> None:
-    transactions = await transaction_service.get_by_status(TransactionStatus.PENDING)
+    canceled = 0
 
-    if not transactions:
-        logger.debug("No pending transactions found")
-        return
+    async for transactions in transaction_service.iter_by_status(TransactionStatus.PENDING):
+        for transaction in transactions:
+            if not transaction.has_old:
+                continue
 
-    old_transactions = [tx for tx in transactions if tx.has_old]
-    logger.debug(f"Found '{len(old_transactions)}' old transactions to cancel")
+            transaction.status = TransactionStatus.CANCELED
+            await transaction_service.update(transaction)
+            logger.debug(f"Transaction '{transaction.id}' canceled")
+            canceled += 1
 
-    for transaction in old_transactions:
-        transaction.status = TransactionStatus.CANCELED
-        await transaction_service.update(transaction)
-        logger.debug(f"Transaction '{transaction.id}' canceled")
+    logger.debug(f"Canceled '{canceled}' old pending transactions")
@@ -0,0 +1,12 @@
+from dishka.integrations.taskiq import FromDishka, inject
+
+from src.infrastructure.taskiq.broker import broker
+from src.services.remnawave import RemnawaveService
+
+
+@broker.task(schedule=[{"cron": "* * * * *"}])
+@inject
+async def process_remnawave_events_task(
+    remnawave_service: FromDishka[RemnawaveService],
+) -> None:
+    await remnawave_service.process_events()
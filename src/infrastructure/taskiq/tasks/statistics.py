@@ -0,0 +1,28 @@
+from datetime import timedelta
+from typing import Optional
+
+from dishka.integrations.taskiq import FromDishka, inject
+
+from src.core.constants import STATISTICS_RECONCILE_DAYS
+from src.core.utils.time import datetime_now
+from src.infrastructure.taskiq.broker import broker
+from src.services.statistics import StatisticsService
+
+
+@broker.task(schedule=[{"cron": "0 3 * * *"}])
+@inject
+async def reconcile_statistics_task(statistics_service: FromDishka[StatisticsService]) -> None:
+    # Rollups are maintained incrementally, only the last days are recomputed as a safety net
+    since = (datetime_now() - timedelta(days=STATISTICS_RECONCILE_DAYS)).date()
+    await statistics_service.rebuild(since)
+
+
+@broker.task
+@inject
+async def rebuild_statistics_task(
+    statistics_service: FromDishka[StatisticsService],
+    days: Optional[int] = None,
+) -> None:
+    # One-off backfill, without days it recomputes the whole history
+    since = (datetime_now() - timedelta(days=days)).date() if days is not None else None
+    await statistics_service.rebuild(since)
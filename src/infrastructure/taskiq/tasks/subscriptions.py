@@ -21,7 +21,6 @@ from src.core.utils.formatters import (
 from src.core.utils.message_payload import MessagePayload
 from src.infrastructure.database.models.dto import (
     PlanSnapshotDto,
-    RemnaSubscriptionDto,
     SubscriptionDto,
     TransactionDto,
     UserDto,
@@ -252,41 +251,20 @@ async def delete_current_subscription_task(
 
 @broker.task
 @inject
-async def update_status_current_subscription_task(
-    user_telegram_id: int,
-    status: SubscriptionStatus,
+async def apply_subscription_update_task(
+    telegram_id: int,
+    remnawave_service: FromDishka[RemnawaveService],
     user_service: FromDishka[UserService],
     subscription_service: FromDishka[SubscriptionService],
 ) -> None:
-    logger.info(f"Update status current subscription started for user '{user_telegram_id}'")
+    # Kicked by the subscription update poller once the debounce window has passed
+    update = await remnawave_service.pop_subscription_update(telegram_id)
 
-    user = await user_service.get(user_telegram_id)
-
-    if not user:
-        logger.debug(f"User '{user_telegram_id}' not found, skipping status update")
+    if update.is_empty:
+        logger.debug(f"No pending subscription update for user '{telegram_id}'")
         return
 
-    subscription = await subscription_service.get_current(user.telegram_id)
-
-    if not subscription:
-        logger.debug(
-            f"No current subscription for user '{user.telegram_id}', skipping status update"
-        )
-        return
-
-    subscription.status = status
-    await subscription_service.update(subscription)
-
-
-@broker.task
-@inject
-async def sync_current_subscription_task(
-    telegram_id: int,
-    remna_subscription: RemnaSubscriptionDto,
-    user_service: FromDishka[UserService],
-    subscription_service: FromDishka[SubscriptionService],
-) -> None:
-    logger.info(f"Starting subscription sync for user '{telegram_id}'")
+    logger.info(f"Applying subscription update for user '{telegram_id}'")
 
     user = await user_service.get(telegram_id)
 
@@ -297,11 +275,18 @@ async def sync_current_subscription_task(
     subscription = await subscription_service.get_current(user.telegram_id)
 
     if not subscription:
-        logger.debug(f"No active subscription for user '{user.telegram_id}'")
+        logger.debug(f"No current subscription for user '{user.telegram_id}', skipping update")
+        return
+
+    if update.remna_subscription:
+        subscription = subscription.apply_sync(update.remna_subscription)
+
+    if update.status and subscription.status != update.status:
+        subscription.status = update.status
+
+    if not subscription.changed_data:
+        logger.debug(f"Subscription for '{telegram_id}' is unchanged, skipping update")
         return
 
-    logger.success(remna_subscription)
-    subscription = subscription.apply_sync(remna_subscription)
-    logger.success(subscription)
     await subscription_service.update(subscription)
-    logger.info(f"Subscription for '{telegram_id}' successfully synchronized")
+    logger.info(f"Subscription for '{telegram_id}' successfully updated")
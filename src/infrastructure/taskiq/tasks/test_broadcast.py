@@ -0,0 +1,64 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.taskiq.tasks.broadcast import _MessageStatusBuffer, _pair_messages
+
+
+@pytest.fixture
+def buffer():
+    broadcast_service = AsyncMock()
+    broadcast_service.uow = AsyncMock()
+    return _MessageStatusBuffer(broadcast_service, MagicMock(success_count=0, failed_count=0))
+
+
+@pytest.mark.asyncio
+async def test_flush_keeps_statuses_after_failure(buffer):
+    # Arrange
+    messages = [MagicMock(), MagicMock()]
+    buffer.add(messages)
+    buffer.broadcast_service.update_messages.side_effect = [Exception("aborted"), None]
+
+    # Act
+    await buffer.flush()
+
+    # Assert
+    # Сессия откатывается, статусы остаются для повторной записи
+    buffer.broadcast_service.uow.rollback.assert_awaited_once()
+    assert buffer.messages == messages
+
+    await buffer.flush()
+
+    buffer.broadcast_service.update_messages.assert_awaited_with(messages)
+    assert buffer.messages == []
+    assert buffer.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_final_flush_propagates_failure(buffer):
+    # Arrange
+    buffer.add([MagicMock()])
+    buffer.broadcast_service.update_messages.side_effect = Exception("aborted")
+
+    # Act & Assert
+    with pytest.raises(Exception, match="aborted"):
+        await buffer.flush(final=True)
+
+    buffer.broadcast_service.uow.rollback.assert_awaited_once()
+
+
+def test_pair_messages_matches_users_by_id():
+    # Arrange
+    users = [MagicMock(telegram_id=telegram_id) for telegram_id in (1, 2, 3)]
+    messages = [MagicMock(user_id=user_id) for user_id in (3, 1, 2)]
+
+    # Act
+    pairs = _pair_messages(users, messages)
+
+    # Assert
+    # Порядок строк из RETURNING не влияет на сопоставление получателей
+    assert [(user.telegram_id, message.user_id) for user, message in pairs] == [
+        (1, 1),
+        (2, 2),
+        (3, 3),
+    ]
@@ -0,0 +1,40 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from taskiq import InMemoryBroker
+
+from src.infrastructure.redis import MessageDeletionQueue, SubscriptionUpdateQueue
+from src.infrastructure.taskiq.pollers import setup_pollers
+
+
+@pytest.mark.asyncio
+async def test_pollers_start_with_worker_and_stop_on_shutdown():
+    # Arrange
+    started = asyncio.Event()
+
+    async def run_poller(bot):
+        started.set()
+        await asyncio.Event().wait()
+
+    queues: dict[type, MagicMock] = {}
+
+    def get(dependency):
+        queue = queues.setdefault(dependency, MagicMock())
+        queue.run_poller = MagicMock(side_effect=run_poller)
+        return queue
+
+    container = MagicMock()
+    container.get = AsyncMock(side_effect=get)
+    broker = InMemoryBroker()
+    setup_pollers(container=container, broker=broker)
+
+    # Act
+    await broker.startup()
+    await asyncio.wait_for(started.wait(), timeout=1)
+    await broker.shutdown()
+
+    # Assert
+    # Поллер запускается при старте воркера, без обращения к очереди из хендлеров
+    queues[MessageDeletionQueue].run_poller.assert_called_once()
+    queues[SubscriptionUpdateQueue].run_poller.assert_called_once()
@@ -8,6 +8,7 @@ from src.core.logger import setup_logger
 from src.infrastructure.di import create_container
 
 from .broker import broker
+from .pollers import setup_pollers
 
 
 def worker() -> RedisStreamBroker:
@@ -20,6 +21,7 @@ def worker() -> RedisStreamBroker:
     container = create_container(config=config, bg_manager_factory=bg_manager_factory)
 
     setup_taskiq_dishka(container=container, broker=broker)
+    setup_pollers(container=container, broker=broker)
     setup_aiogram_dishka(container=container, router=dispatcher, auto_inject=True)
 
     return broker
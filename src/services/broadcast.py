@@ -1,22 +1,32 @@
-from typing import Optional
+from datetime import timedelta
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
 from aiogram import Bot
 from fluentogram import TranslatorHub
 from loguru import logger
 from redis.asyncio import Redis
-from sqlalchemy import and_
+from sqlalchemy import ColumnElement, and_
 
 from src.core.config import AppConfig
+from src.core.constants import AUDIENCE_BATCH_SIZE, BROADCAST_LIST_MAX_COUNT, TIME_1D
 from src.core.enums import (
     BroadcastAudience,
+    BroadcastMessageStatus,
     BroadcastStatus,
     PlanAvailability,
     SubscriptionStatus,
 )
+from src.core.storage.keys import BroadcastCancelKey, BroadcastDeletionKey
+from src.core.utils.time import datetime_now
 from src.infrastructure.database import UnitOfWork
-from src.infrastructure.database.models.dto import BroadcastDto, BroadcastMessageDto, UserDto
-from src.infrastructure.database.models.sql import Broadcast, BroadcastMessage, Subscription, User
+from src.infrastructure.database.models.dto import (
+    BroadcastDeletionDto,
+    BroadcastDto,
+    BroadcastMessageDto,
+    UserDto,
+)
+from src.infrastructure.database.models.sql import Broadcast, Subscription, User
 from src.infrastructure.database.models.sql.plan import Plan
 from src.infrastructure.redis import RedisRepository
 
@@ -51,15 +61,12 @@ class BroadcastService(BaseService):
         broadcast_id: int,
         messages: list[BroadcastMessageDto],
     ) -> list[BroadcastMessageDto]:
-        db_messages = [
-            BroadcastMessage(
-                broadcast_id=broadcast_id,
-                user_id=m.user_id,
-                status=m.status,
-            )
-            for m in messages
-        ]
-        db_created_messages = await self.uow.repository.broadcasts.create_messages(db_messages)
+        db_created_messages = await self.uow.repository.broadcasts.create_messages(
+            [
+                {"broadcast_id": broadcast_id, "user_id": m.user_id, "status": m.status}
+                for m in messages
+            ]
+        )
         return BroadcastMessageDto.from_model_list(db_created_messages)
 
     async def get(self, task_id: UUID) -> Optional[BroadcastDto]:
@@ -72,9 +79,18 @@ class BroadcastService(BaseService):
 
         return BroadcastDto.from_model(db_broadcast)
 
-    async def get_all(self) -> list[BroadcastDto]:
-        db_broadcasts = await self.uow.repository.broadcasts.get_all()
-        return BroadcastDto.from_model_list(list(reversed(db_broadcasts)))
+    async def get_recent(self, limit: int = BROADCAST_LIST_MAX_COUNT) -> list[BroadcastDto]:
+        db_broadcasts = await self.uow.repository.broadcasts.get_recent(limit)
+        logger.debug(f"Retrieved '{len(db_broadcasts)}' recent broadcasts")
+        return BroadcastDto.from_model_list(db_broadcasts)
+
+    async def iter_old(self) -> AsyncIterator[list[BroadcastDto]]:
+        created_before = datetime_now() - timedelta(days=7)
+
+        async for db_broadcasts in self.uow.repository.broadcasts.iter_finished_before(
+            created_before
+        ):
+            yield BroadcastDto.from_model_list(db_broadcasts)
 
     async def update(self, broadcast: BroadcastDto) -> Optional[BroadcastDto]:
         db_updated_broadcast = await self.uow.repository.broadcasts.update(
@@ -99,13 +115,65 @@ class BroadcastService(BaseService):
             **message.changed_data,
         )
 
+    async def update_messages(self, messages: list[BroadcastMessageDto]) -> None:
+        await self.uow.repository.broadcasts.update_messages(
+            [(m.id, m.message_id, m.status) for m in messages if m.id is not None]
+        )
+        await self.uow.commit()
+        logger.debug(f"Bulk updated '{len(messages)}' broadcast messages")
+
+    async def iter_deletable_messages(
+        self,
+        broadcast_id: int,
+        batch_size: int = AUDIENCE_BATCH_SIZE,
+    ) -> AsyncIterator[list[BroadcastMessageDto]]:
+        async for db_messages in self.uow.repository.broadcasts.iter_messages_by_status(
+            broadcast_id,
+            statuses=[BroadcastMessageStatus.SENT, BroadcastMessageStatus.EDITED],
+            batch_size=batch_size,
+        ):
+            yield BroadcastMessageDto.from_model_list(db_messages)
+
+    async def count_messages(self, broadcast_id: int, *statuses: BroadcastMessageStatus) -> int:
+        return await self.uow.repository.broadcasts.count_messages_by_status(
+            broadcast_id,
+            statuses=list(statuses),
+        )
+
+    async def get_deletion_progress(self, task_id: UUID) -> Optional[BroadcastDeletionDto]:
+        return await self.redis_repository.get(
+            BroadcastDeletionKey(task_id=task_id),
+            validator=BroadcastDeletionDto,
+        )
+
+    async def set_deletion_progress(self, task_id: UUID, progress: BroadcastDeletionDto) -> None:
+        await self.redis_repository.set(
+            BroadcastDeletionKey(task_id=task_id),
+            value=progress,
+            ex=TIME_1D,
+        )
+
     async def delete_broadcast(self, broadcast_id: int) -> None:
+        await self.uow.repository.broadcasts.delete_messages(broadcast_id)
         await self.uow.repository.broadcasts._delete(Broadcast, Broadcast.id == broadcast_id)
 
     async def get_status(self, task_id: UUID) -> Optional[BroadcastStatus]:
         db_broadcast = await self.uow.repository.broadcasts.get(task_id)
         return db_broadcast.status if db_broadcast else None
 
+    async def cancel(self, broadcast: BroadcastDto) -> None:
+        broadcast.status = BroadcastStatus.CANCELED
+        await self.update(broadcast)
+        await self.redis_repository.set(
+            BroadcastCancelKey(task_id=broadcast.task_id),
+            value=True,
+            ex=TIME_1D,
+        )
+        logger.info(f"Broadcast '{broadcast.task_id}' marked as canceled")
+
+    async def is_canceled(self, task_id: UUID) -> bool:
+        return await self.redis_repository.exists(BroadcastCancelKey(task_id=task_id))
+
     #
 
     async def get_audience_count(
@@ -115,12 +183,7 @@ class BroadcastService(BaseService):
     ) -> int:
         logger.debug(f"Counting audience '{audience}' for plan '{plan_id}'")
 
-        if audience == BroadcastAudience.PLAN:
-            if plan_id:
-                db_subs = await self.uow.repository.subscriptions.filter_by_plan_id(plan_id)
-                active_subs = [s for s in db_subs if s.status == SubscriptionStatus.ACTIVE]
-                return len(active_subs)
-
+        if audience == BroadcastAudience.PLAN and not plan_id:
             count = await self.uow.repository.plans._count(
                 Plan,
                 Plan.availability != PlanAvailability.TRIAL,
@@ -128,79 +191,62 @@ class BroadcastService(BaseService):
             logger.debug(f"Audience count for '{audience}' (plan={plan_id}) is '{count}'")
             return count
 
-        if audience == BroadcastAudience.ALL:
-            conditions = and_(User.is_blocked.is_(False), User.is_bot_blocked.is_(False))
-            return await self.uow.repository.users._count(User, conditions)
-
-        if audience == BroadcastAudience.SUBSCRIBED:
-            conditions = User.current_subscription_id.is_not(None)
-            return await self.uow.repository.users._count(User, conditions)
-
-        if audience == BroadcastAudience.UNSUBSCRIBED:
-            conditions = User.current_subscription_id.is_(None)
-            return await self.uow.repository.users._count(User, conditions)
+        conditions = self._get_audience_conditions(audience, plan_id)
+        return await self.uow.repository.users._count(User, *conditions)
 
-        if audience == BroadcastAudience.EXPIRED:
-            conditions = and_(
-                User.current_subscription.has(Subscription.status == SubscriptionStatus.EXPIRED)
-            )
-            return await self.uow.repository.users._count(User, conditions)
-
-        if audience == BroadcastAudience.TRIAL:
-            conditions = and_(User.current_subscription.has(Subscription.is_trial.is_(True)))
-            return await self.uow.repository.users._count(User, conditions)
-
-        raise Exception(f"Unknown broadcast audience: {audience}")
-
-    async def get_audience_users(
+    async def iter_audience_users(
         self,
         audience: BroadcastAudience,
         plan_id: Optional[int] = None,
-    ) -> list[UserDto]:
-        logger.debug(f"Retrieving users for audience '{audience}', plan_id: {plan_id}")
+        batch_size: int = AUDIENCE_BATCH_SIZE,
+    ) -> AsyncIterator[list[UserDto]]:
+        logger.debug(f"Streaming users for audience '{audience}', plan_id: {plan_id}")
+        conditions = self._get_audience_conditions(audience, plan_id)
+
+        async for db_users in self.uow.repository.users.iter_batches(
+            User,
+            *conditions,
+            order_by=User.telegram_id,
+            batch_size=batch_size,
+        ):
+            yield UserDto.from_model_list(db_users)
+
+    def _get_audience_conditions(
+        self,
+        audience: BroadcastAudience,
+        plan_id: Optional[int] = None,
+    ) -> list[ColumnElement[bool]]:
         is_not_block = and_(
             User.is_blocked.is_(False),
             User.is_bot_blocked.is_(False),
         )
 
         if audience == BroadcastAudience.PLAN and plan_id:
-            db_subscriptions = await self.uow.repository.subscriptions.filter_by_plan_id(plan_id)
-            active_subs = [s for s in db_subscriptions if s.status == SubscriptionStatus.ACTIVE]
-            user_ids = [sub.user_telegram_id for sub in active_subs]
-            db_users = await self.uow.repository.users.get_by_ids(telegram_ids=user_ids)
-            logger.debug(
-                f"Retrieved '{len(db_users)}' users for audience '{audience}' (plan={plan_id})"
-            )
-            return UserDto.from_model_list(db_users)
+            return [
+                User.subscriptions.any(
+                    and_(
+                        Subscription.plan["id"].as_integer() == plan_id,
+                        Subscription.status == SubscriptionStatus.ACTIVE,
+                    )
+                )
+            ]
 
         if audience == BroadcastAudience.ALL:
-            conditions = is_not_block
-            db_users = await self.uow.repository.users._get_many(User, conditions)
-            return UserDto.from_model_list(db_users)
+            return [is_not_block]
 
         if audience == BroadcastAudience.SUBSCRIBED:
-            conditions = and_(User.current_subscription_id.is_not(None), is_not_block)
-            db_users = await self.uow.repository.users._get_many(User, conditions)
-            return UserDto.from_model_list(db_users)
+            return [User.current_subscription_id.is_not(None), is_not_block]
 
         if audience == BroadcastAudience.UNSUBSCRIBED:
-            conditions = and_(User.current_subscription_id.is_(None), is_not_block)
-            db_users = await self.uow.repository.users._get_many(User, conditions)
-            return UserDto.from_model_list(db_users)
+            return [User.current_subscription_id.is_(None), is_not_block]
 
         if audience == BroadcastAudience.EXPIRED:
-            conditions = and_(
+            return [
                 User.current_subscription.has(Subscription.status == SubscriptionStatus.EXPIRED),
                 is_not_block,
-            )
-            db_users = await self.uow.repository.users._get_many(User, conditions)
-            return UserDto.from_model_list(db_users)
+            ]
 
         if audience == BroadcastAudience.TRIAL:
-            conditions = and_(
-                User.current_subscription.has(Subscription.is_trial.is_(True)), is_not_block
-            )
-            db_users = await self.uow.repository.users._get_many(User, conditions)
-            return UserDto.from_model_list(db_users)
+            return [User.current_subscription.has(Subscription.is_trial.is_(True)), is_not_block]
 
         raise Exception(f"Unknown broadcast audience: {audience}")
@@ -0,0 +1,184 @@
+from typing import Awaitable, Optional, Union, cast
+
+from aiogram import Bot
+from aiogram.enums import ChatMemberStatus
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.types import Chat
+from fluentogram import TranslatorHub
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.config import AppConfig
+from src.core.constants import (
+    CHANNEL_MEMBER_TTL,
+    CHANNEL_NON_MEMBER_TTL,
+    CHANNEL_REVERIFY_BATCH_SIZE,
+    CHANNEL_REVERIFY_RATE,
+)
+from src.core.storage.keys import ChannelMemberKey, ChannelMembersKey
+from src.core.utils.iterables import chunked
+from src.core.utils.rate_limiter import TokenBucket
+from src.infrastructure.database.models.dto import SettingsDto
+from src.infrastructure.redis import RedisRepository
+from src.services.settings import SettingsService
+
+from .base import BaseService
+
+ALLOWED_STATUSES = (
+    ChatMemberStatus.CREATOR,
+    ChatMemberStatus.ADMINISTRATOR,
+    ChatMemberStatus.MEMBER,
+)
+
+
+class ChannelService(BaseService):
+    settings_service: SettingsService
+
+    def __init__(
+        self,
+        config: AppConfig,
+        bot: Bot,
+        redis_client: Redis,
+        redis_repository: RedisRepository,
+        translator_hub: TranslatorHub,
+        #
+        settings_service: SettingsService,
+    ) -> None:
+        super().__init__(config, bot, redis_client, redis_repository, translator_hub)
+        self.settings_service = settings_service
+
+    @staticmethod
+    def get_chat_id(settings: SettingsDto) -> Union[str, int, None]:
+        if settings.channel_has_username:
+            return settings.channel_link.get_secret_value()
+        elif settings.channel_id:
+            return settings.channel_id
+        return None
+
+    @staticmethod
+    def is_member(status: ChatMemberStatus) -> bool:
+        return status in ALLOWED_STATUSES
+
+    async def get_member_status(
+        self,
+        chat_id: Union[str, int],
+        telegram_id: int,
+        force: bool = False,
+    ) -> ChatMemberStatus:
+        key = ChannelMemberKey(chat_id=str(chat_id), telegram_id=telegram_id)
+
+        if not force:
+            cached: Optional[bytes] = await self.redis_client.get(key.pack())
+            if cached is not None:
+                logger.debug(f"Channel member status for '{telegram_id}' taken from cache")
+                return ChatMemberStatus(cached.decode())
+
+        member = await self.bot.get_chat_member(chat_id=chat_id, user_id=telegram_id)
+        await self.cache_member_status(chat_id, telegram_id, member.status)
+        return member.status
+
+    async def cache_member_status(
+        self,
+        chat_id: Union[str, int],
+        telegram_id: int,
+        status: ChatMemberStatus,
+    ) -> None:
+        key = ChannelMemberKey(chat_id=str(chat_id), telegram_id=telegram_id).pack()
+        members_key = ChannelMembersKey(chat_id=str(chat_id)).pack()
+
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            # Positive results are stable, negative ones are re-checked soon after joining
+            if self.is_member(status):
+                pipe.set(key, status.value, ex=CHANNEL_MEMBER_TTL)
+                pipe.sadd(members_key, telegram_id)
+            else:
+                pipe.set(key, status.value, ex=CHANNEL_NON_MEMBER_TTL)
+                pipe.srem(members_key, telegram_id)
+            await pipe.execute()
+
+    async def handle_member_updated(
+        self,
+        chat: Chat,
+        telegram_id: int,
+        status: ChatMemberStatus,
+    ) -> bool:
+        settings = await self.settings_service.get()
+        chat_id = self.get_chat_id(settings)
+
+        if chat_id is None or not self._is_same_chat(chat_id, chat):
+            return False
+
+        await self.cache_member_status(chat_id, telegram_id, status)
+        logger.debug(f"Channel member '{telegram_id}' status updated to '{status}'")
+        return True
+
+    async def reverify_members(self, batch_size: int = CHANNEL_REVERIFY_BATCH_SIZE) -> int:
+        settings = await self.settings_service.get()
+        chat_id = self.get_chat_id(settings)
+
+        if not settings.channel_required or chat_id is None:
+            logger.debug("Channel re-verification skipped: channel is not required")
+            return 0
+
+        members_key = ChannelMembersKey(chat_id=str(chat_id))
+        members = [
+            int(member) for member in await self.redis_repository.collection_members(members_key)
+        ]
+        bucket = TokenBucket(rate=CHANNEL_REVERIFY_RATE)
+        left = 0
+
+        for batch in chunked(members, batch_size):
+            keys = [
+                ChannelMemberKey(chat_id=str(chat_id), telegram_id=telegram_id).pack()
+                for telegram_id in batch
+            ]
+            cached = await cast(Awaitable[list[Optional[bytes]]], self.redis_client.mget(keys))
+            # Members whose cache entry already expired are re-checked on their next update
+            expired = [telegram_id for telegram_id, value in zip(batch, cached) if value is None]
+
+            if expired:
+                await self.redis_repository.collection_remove(members_key, *expired)
+
+            for telegram_id, value in zip(batch, cached):
+                if value is None:
+                    continue
+
+                status = await self._fetch_member_status(bucket, chat_id, telegram_id)
+                if status is None:
+                    continue
+
+                await self.cache_member_status(chat_id, telegram_id, status)
+                if not self.is_member(status):
+                    left += 1
+
+        logger.info(f"Re-verified '{len(members)}' channel members, '{left}' left the channel")
+        return left
+
+    async def _fetch_member_status(
+        self,
+        bucket: TokenBucket,
+        chat_id: Union[str, int],
+        telegram_id: int,
+    ) -> Optional[ChatMemberStatus]:
+        await bucket.acquire()
+
+        try:
+            member = await self.bot.get_chat_member(chat_id=chat_id, user_id=telegram_id)
+        except TelegramRetryAfter as exception:
+            bucket.pause(exception.retry_after)
+            logger.warning(
+                f"Flood control on re-verifying channel member '{telegram_id}', "
+                f"retry after '{exception.retry_after}' seconds"
+            )
+            return None
+        except Exception as exception:
+            logger.warning(f"Failed to re-verify channel member '{telegram_id}': {exception}")
+            return None
+
+        return member.status
+
+    @staticmethod
+    def _is_same_chat(chat_id: Union[str, int], chat: Chat) -> bool:
+        if isinstance(chat_id, str):
+            return chat.username is not None and chat.username.lower() == chat_id[1:].lower()
+        return chat.id == chat_id
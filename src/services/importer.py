@@ -1,142 +1,204 @@
-import json
-import re
-import sqlite3
-from datetime import datetime, timezone
+import asyncio
+from concurrent.futures import Executor
 from pathlib import Path
 from typing import Any, Optional
+from uuid import UUID, uuid4
 
+from aiogram import Bot
+from fluentogram import TranslatorHub
 from loguru import logger
-
-from src.core.constants import IMPORTED_TAG, waveshop_PREFIX
-from src.core.enums import SubscriptionStatus
+from redis.asyncio import Redis
+
+from src.core.config import AppConfig
+from src.core.constants import (
+    IMPORT_CHUNK_SIZE,
+    IMPORT_LOCK_TTL,
+    IMPORT_SEGMENT_ACTIVE,
+    IMPORT_SEGMENT_EXPIRED,
+    IMPORT_TTL,
+)
+from src.core.storage.keys import (
+    ExportedUsersKey,
+    ImportCheckpointKey,
+    ImportKey,
+    ImportLockKey,
+)
+from src.core.utils import json_utils
+from src.core.utils.iterables import take
 from src.core.utils.time import datetime_now
+from src.infrastructure.database.models.dto import (
+    ExportedUsersDto,
+    ImportChunkResultDto,
+    ImportDto,
+    ImportProgressDto,
+)
+from src.infrastructure.importers import (
+    IMPORT_SOURCE_MAP,
+    get_import_source_type,
+    transform_records,
+)
+from src.infrastructure.redis import RedisRepository
 
 from .base import BaseService
 
 
 class ImporterService(BaseService):
-    def get_users_from_xui(self, db_path: Path) -> list[dict[str, Any]]:
-        if not self._xui_validate_db(db_path):
-            raise ValueError("Invalid or inaccessible 3X-UI database")
-
-        inbound_id = self._xui_get_inbound_with_most_clients(db_path)
-        users = self._xui_get_users_from_inbound(db_path, inbound_id)
-
-        logger.info(f"Fetched '{len(users)}' clients from inbound '{inbound_id}'")
-        return self.transform_xui_users(users)
-
-    def split_active_and_expired(
-        self, users: list[dict[str, Any]]
-    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    import_executor: Executor
+
+    def __init__(
+        self,
+        config: AppConfig,
+        bot: Bot,
+        redis_client: Redis,
+        redis_repository: RedisRepository,
+        translator_hub: TranslatorHub,
+        #
+        import_executor: Executor,
+    ) -> None:
+        super().__init__(config, bot, redis_client, redis_repository, translator_hub)
+        self.import_executor = import_executor
+
+    async def export_users(self, path: Path) -> ExportedUsersDto:
+        source_type = get_import_source_type(path)
+
+        if not source_type:
+            raise ValueError(f"Unsupported import file '{path.name}'")
+
+        export_id = uuid4()
         now = datetime_now()
-        active, expired = [], []
+        loop = asyncio.get_running_loop()
+        records = IMPORT_SOURCE_MAP[source_type]().iter_records(path)
 
-        for user in users:
-            expire_at = user.get("expire_at")
-            if isinstance(expire_at, datetime) and expire_at > now:
-                active.append(user)
-            else:
-                expired.append(user)
+        counts: dict[str, int] = {IMPORT_SEGMENT_ACTIVE: 0, IMPORT_SEGMENT_EXPIRED: 0}
+        records_count = 0
 
-        logger.info(f"Split users: '{len(active)}' active, '{len(expired)}' expired")
-        return active, expired
+        try:
+            # NOTE: Reading happens in a thread and transforming in worker processes,
+            # so large files don't block the event loop
+            while batch := await asyncio.to_thread(take, records, IMPORT_CHUNK_SIZE):
+                records_count += len(batch)
+                users = await loop.run_in_executor(
+                    self.import_executor,
+                    transform_records,
+                    source_type,
+                    batch,
+                )
+                segments: dict[str, list[str]] = {segment: [] for segment in counts}
+
+                for user in users:
+                    is_active = user["expire_at"] > now
+                    segment = IMPORT_SEGMENT_ACTIVE if is_active else IMPORT_SEGMENT_EXPIRED
+                    segments[segment].append(json_utils.encode(user))
+
+                for segment, segment_users in segments.items():
+                    await self._push_exported_users(export_id, segment, segment_users)
+                    counts[segment] += len(segment_users)
+        finally:
+            await asyncio.to_thread(records.close)
+
+        exported = ExportedUsersDto(
+            export_id=export_id,
+            active_count=counts[IMPORT_SEGMENT_ACTIVE],
+            expired_count=counts[IMPORT_SEGMENT_EXPIRED],
+        )
+        logger.info(
+            f"Exported '{exported.total_count}' / '{records_count}' '{source_type}' users "
+            f"('{exported.active_count}' active) as '{export_id}'"
+        )
+        return exported
+
+    async def create_import(
+        self,
+        export_id: UUID,
+        segments: list[str],
+        active_internal_squads: list[UUID],
+    ) -> ImportDto:
+        chunks: list[tuple[str, int, int]] = []
+        total_count = 0
+
+        for segment in segments:
+            key = ExportedUsersKey(export_id=export_id, segment=segment)
+            count = await self.redis_repository.list_length(key)
+            chunks.extend(
+                (segment, start, min(start + IMPORT_CHUNK_SIZE, count) - 1)
+                for start in range(0, count, IMPORT_CHUNK_SIZE)
+            )
+            total_count += count
+
+        job = ImportDto(
+            import_id=uuid4(),
+            export_id=export_id,
+            total_count=total_count,
+            chunks=chunks,
+            active_internal_squads=active_internal_squads,
+        )
+        await self.redis_repository.set(
+            ImportKey(import_id=job.import_id),
+            value=job,
+            ex=IMPORT_TTL,
+        )
 
-    def transform_xui_user(self, user: dict[str, Any]) -> Optional[dict[str, Any]]:
-        if not user.get("enable"):
-            return None
+        logger.info(
+            f"Created import '{job.import_id}' of '{total_count}' users "
+            f"in '{job.chunks_count}' chunks"
+        )
+        return job
 
-        match = re.search(r"\d+", user.get("email", ""))
-        if not match:
-            return None
+    async def get_import(self, import_id: UUID) -> Optional[ImportDto]:
+        return await self.redis_repository.get(ImportKey(import_id=import_id), validator=ImportDto)
 
-        telegram_id = match.group(0)
-        expire_at = (
-            datetime.fromtimestamp(user.get("expiryTime", 0) / 1000, tz=timezone.utc)
-            if user.get("expiryTime")
-            else datetime(2099, 1, 1, tzinfo=timezone.utc)
+    async def get_import_chunk(self, job: ImportDto, chunk: int) -> list[dict[str, Any]]:
+        segment, start, end = job.chunks[chunk]
+        users = await self.redis_repository.list_range(
+            ExportedUsersKey(export_id=job.export_id, segment=segment),
+            start,
+            end,
         )
+        return [json_utils.decode(user) for user in users]
 
-        return {
-            "username": f"{waveshop_PREFIX}{telegram_id}",
-            "telegram_id": telegram_id,
-            "status": SubscriptionStatus.ACTIVE,
-            "expire_at": expire_at,
-            "traffic_limit_bytes": user.get("totalGB", 0),
-            "hwid_device_limit": user.get("limitIp", 1),
-            "tag": IMPORTED_TAG,
-        }
-
-    def transform_xui_users(
-        self, users: list[dict[str, Any]]
-    ) -> list[dict[str, Any]]:
-        transformed = [u for u in (self.transform_xui_user(u) for u in users) if u]
-        logger.info(f"Transformed '{len(transformed)}' / '{len(users)}' 3X-UI users")
-        return transformed
+    async def get_checkpoints(self, import_id: UUID) -> dict[int, ImportChunkResultDto]:
+        results = await self.redis_repository.hash_values(
+            ImportCheckpointKey(import_id=import_id),
+            validator=ImportChunkResultDto,
+        )
+        return {result.chunk: result for result in results}
 
-    #
+    async def save_checkpoint(self, import_id: UUID, result: ImportChunkResultDto) -> None:
+        key = ImportCheckpointKey(import_id=import_id)
+        await self.redis_repository.hash_set(key, {result.chunk: result})
+        await self.redis_client.expire(key.pack(), IMPORT_TTL)
 
-    def _xui_connect_db(self, db_path: Path) -> sqlite3.Connection:
-        return sqlite3.connect(db_path)
+    async def get_progress(self, import_id: UUID) -> Optional[ImportProgressDto]:
+        job = await self.get_import(import_id)
 
-    def _xui_fetch_inbounds(self, conn: sqlite3.Connection) -> list[tuple[int, str]]:
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, settings FROM inbounds")
-        return cursor.fetchall()
+        if not job:
+            return None
 
-    def _xui_validate_db(self, db_path: Path) -> bool:
-        try:
-            with self._xui_connect_db(db_path) as conn:
-                return bool(self._xui_fetch_inbounds(conn))
-        except sqlite3.Error as exception:
-            logger.warning(f"Database validation failed: {exception}")
-            return False
-
-    def _xui_get_inbound_with_most_clients(self, db_path: Path) -> int:
-        max_clients = -1
-        best_inbound_id = 0
-
-        with self._xui_connect_db(db_path) as conn:
-            for inbound_id, settings_raw in self._xui_fetch_inbounds(conn):
-                try:
-                    settings = json.loads(settings_raw)
-                except json.JSONDecodeError:
-                    logger.debug(f"Skipping inbound '{inbound_id}': invalid JSON")
-                    continue
-
-                clients = settings.get("clients")
-                if isinstance(clients, list) and len(clients) > max_clients:
-                    max_clients, best_inbound_id = len(clients), inbound_id
-
-        if not best_inbound_id:
-            raise ValueError("No valid inbounds containing clients found")
-
-        logger.debug(
-            f"Selected inbound '{best_inbound_id}' with '{max_clients}' clients"
+        checkpoints = (await self.get_checkpoints(import_id)).values()
+        return ImportProgressDto(
+            total_count=job.total_count,
+            success_count=sum(result.success_count for result in checkpoints),
+            failed_count=sum(result.failed_count for result in checkpoints),
+            is_running=await self.redis_repository.exists(ImportLockKey(import_id=import_id)),
+            is_finished=len(checkpoints) >= job.chunks_count,
         )
-        return best_inbound_id
-
-    def _xui_get_users_from_inbound(
-        self, db_path: Path, inbound_id: int
-    ) -> list[dict[str, Any]]:
-        with self._xui_connect_db(db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT settings FROM inbounds WHERE id = ?", (inbound_id,)
-            )
-            row = cursor.fetchone()
 
-        if not row:
-            raise ValueError(f"Inbound '{inbound_id}' not found in database")
+    async def acquire_import_lock(self, import_id: UUID) -> bool:
+        key = ImportLockKey(import_id=import_id)
+        return bool(await self.redis_client.set(key.pack(), 1, nx=True, ex=IMPORT_LOCK_TTL))
 
-        try:
-            settings = json.loads(row[0])
-        except json.JSONDecodeError as exception:
-            raise ValueError(
-                f"Invalid JSON for inbound '{inbound_id}'"
-            ) from exception
+    async def refresh_import_lock(self, import_id: UUID) -> None:
+        await self.redis_client.expire(ImportLockKey(import_id=import_id).pack(), IMPORT_LOCK_TTL)
+
+    async def release_import_lock(self, import_id: UUID) -> None:
+        await self.redis_repository.delete(ImportLockKey(import_id=import_id))
+
+    #
 
-        clients = settings.get("clients")
-        if not isinstance(clients, list):
-            raise TypeError(f"Invalid clients format in inbound '{inbound_id}'")
+    async def _push_exported_users(self, export_id: UUID, segment: str, users: list[str]) -> None:
+        if not users:
+            return
 
-        return clients
+        key = ExportedUsersKey(export_id=export_id, segment=segment)
+        await self.redis_repository.list_append(key, *users)
+        await self.redis_client.expire(key.pack(), IMPORT_TTL)
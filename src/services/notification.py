@@ -2,6 +2,7 @@ import asyncio
 from typing import Any, Optional, cast
 
 from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
 from aiogram.types import (
     InlineKeyboardButton,
     InlineKeyboardMarkup,
@@ -29,6 +30,7 @@ from src.core.utils.formatters import i18n_postprocess_text
 from src.core.utils.message_payload import MessagePayload
 from src.core.utils.types import AnyKeyboard
 from src.infrastructure.database.models.dto import UserDto
+from src.infrastructure.redis import MessageDeletionQueue
 from src.infrastructure.redis.repository import RedisRepository
 from src.services.settings import SettingsService
 
@@ -39,6 +41,7 @@ from .user import UserService
 class NotificationService(BaseService):
     user_service: UserService
     settings_service: SettingsService
+    message_deletion_queue: MessageDeletionQueue
 
     def __init__(
         self,
@@ -50,16 +53,19 @@ class NotificationService(BaseService):
         #
         user_service: UserService,
         settings_service: SettingsService,
+        message_deletion_queue: MessageDeletionQueue,
     ) -> None:
         super().__init__(config, bot, redis_client, redis_repository, translator_hub)
         self.user_service = user_service
         self.settings_service = settings_service
+        self.message_deletion_queue = message_deletion_queue
 
     async def notify_user(
         self,
         user: Optional[UserDto],
         payload: MessagePayload,
         ntf_type: Optional[UserNotificationType] = None,
+        raise_on_flood: bool = False,
     ) -> Optional[Message]:
         if not user:
             logger.warning("Skipping user notification: user object is empty")
@@ -78,7 +84,7 @@ class NotificationService(BaseService):
             f"Attempting to send user notification '{payload.i18n_key}' to '{user.telegram_id}'"
         )
 
-        return await self._send_message(user, payload)
+        return await self._send_message(user, payload, raise_on_flood=raise_on_flood)
 
     async def system_notify(
         self,
@@ -138,7 +144,10 @@ class NotificationService(BaseService):
     #
 
     async def _send_message(
-        self, user: UserDto, payload: MessagePayload
+        self,
+        user: UserDto,
+        payload: MessagePayload,
+        raise_on_flood: bool = False,
     ) -> Optional[Message]:
         try:
             reply_markup = self._prepare_reply_markup(
@@ -164,17 +173,17 @@ class NotificationService(BaseService):
                 )
 
             if payload.auto_delete_after is not None and sent_message:
-                asyncio.create_task(
-                    self._schedule_message_deletion(
-                        chat_id=user.telegram_id,
-                        message_id=sent_message.message_id,
-                        delay=payload.auto_delete_after,
-                    )
+                await self.message_deletion_queue.schedule(
+                    chat_id=user.telegram_id,
+                    message_id=sent_message.message_id,
+                    delay=payload.auto_delete_after,
                 )
 
             return sent_message
 
         except Exception as exception:
+            if raise_on_flood and isinstance(exception, TelegramRetryAfter):
+                raise
             logger.error(
                 f"Failed to send notification '{payload.i18n_key}' "
                 f"to '{user.telegram_id}': {exception}",
@@ -281,23 +290,6 @@ class NotificationService(BaseService):
         builder.row(button)
         return builder.as_markup()
 
-    async def _schedule_message_deletion(
-        self, chat_id: int, message_id: int, delay: int
-    ) -> None:
-        logger.debug(
-            f"Scheduling message '{message_id}' for auto-deletion in '{delay}' (chat '{chat_id}')"
-        )
-        try:
-            await asyncio.sleep(delay)
-            await self.bot.delete_message(chat_id=chat_id, message_id=message_id)
-            logger.debug(
-                f"Message '{message_id}' in chat '{chat_id}' deleted after '{delay}' seconds"
-            )
-        except Exception as exception:
-            logger.error(
-                f"Failed to delete message '{message_id}' in chat '{chat_id}': {exception}"
-            )
-
     def _get_translated_text(
         self,
         locale: Locale,
@@ -1,29 +1,48 @@
+import asyncio
+import traceback
 from datetime import timedelta
-from typing import Optional
-from uuid import UUID
+from typing import AsyncIterator, Optional, cast
+from uuid import UUID, uuid4
 
 from aiogram import Bot
+from aiogram.utils.formatting import Text
 from fluentogram import TranslatorHub
 from loguru import logger
 from redis.asyncio import Redis
 from remnawave import RemnawaveSDK
+from remnawave.controllers import WebhookUtility
 from remnawave.models import (
     CreateUserRequestDto,
     DeleteUserHwidDeviceResponseDto,
     DeleteUserResponseDto,
+    GetAllInternalSquadsResponseDto,
+    GetAllNodesResponseDto,
     GetStatsResponseDto,
     GetUserHwidDevicesResponseDto,
     HWIDDeleteRequest,
     HwidUserDeviceDto,
     UpdateUserRequestDto,
     UserResponseDto,
+    UsersResponseDto,
 )
 from remnawave.models.hwid import HwidDeviceDto
-from remnawave.models.webhook import NodeDto
+from remnawave.models.webhook import NodeDto, UserHwidDeviceEventDto, WebhookPayloadDto
+from remnawave.models.webhook import UserDto as UserWebhookDto
 
 from src.bot.keyboards import get_user_keyboard
 from src.core.config import AppConfig
-from src.core.constants import DATETIME_FORMAT
+from src.core.constants import (
+    DATETIME_FORMAT,
+    PANEL_SYNC_CONCURRENCY,
+    PANEL_SYNC_PAGE_SIZE,
+    REMNAWAVE_CACHE_STALE_TTL,
+    REMNAWAVE_CACHE_TTL,
+    REMNAWAVE_EVENT_DEDUP_TTL,
+    REMNAWAVE_EVENTS_BATCH_SIZE,
+    REMNAWAVE_EVENTS_LOCK_TTL,
+    REMNAWAVE_EVENTS_MAXLEN,
+    SUBSCRIPTION_UPDATE_TTL,
+)
 from src.core.enums import (
     RemnaNodeEvent,
     RemnaUserEvent,
@@ -33,6 +52,15 @@ from src.core.enums import (
     UserNotificationType,
 )
 from src.core.i18n.keys import ByteUnitKey
+from src.core.storage.key_builder import build_key
+from src.core.storage.keys import (
+    RemnawaveEventKey,
+    RemnawaveEventsKey,
+    RemnawaveEventsLockKey,
+    RemnawaveEventsScheduledKey,
+    SubscriptionUpdateKey,
+)
+from src.core.utils import json_utils
 from src.core.utils.formatters import (
     format_country_code,
     format_days_to_datetime,
@@ -43,6 +71,7 @@ from src.core.utils.formatters import (
     i18n_format_expire_time,
     i18n_format_traffic_limit,
 )
+from src.core.utils.iterables import chunked
 from src.core.utils.message_payload import MessagePayload
 from src.core.utils.time import datetime_now
 from src.core.utils.types import RemnaUserDto
@@ -50,10 +79,17 @@ from src.infrastructure.database.models.dto import (
     PlanSnapshotDto,
     RemnaSubscriptionDto,
     SubscriptionDto,
+    SubscriptionUpdateDto,
     UserDto,
 )
-from src.infrastructure.redis import RedisRepository
+from src.infrastructure.redis import (
+    RedisRepository,
+    SubscriptionUpdateQueue,
+    invalidate_cache,
+    redis_cache,
+)
 from src.infrastructure.taskiq.tasks.notifications import (
+    send_error_notification_task,
     send_subscription_expire_notification_task,
     send_subscription_limited_notification_task,
     send_system_notification_task,
@@ -66,6 +102,7 @@ from .base import BaseService
 class RemnawaveService(BaseService):
     remnawave: RemnawaveSDK
     user_service: UserService
+    subscription_update_queue: SubscriptionUpdateQueue
 
     def __init__(
         self,
@@ -77,10 +114,12 @@ class RemnawaveService(BaseService):
         #
         remnawave: RemnawaveSDK,
         user_service: UserService,
+        subscription_update_queue: SubscriptionUpdateQueue,
     ) -> None:
         super().__init__(config, bot, redis_client, redis_repository, translator_hub)
         self.remnawave = remnawave
         self.user_service = user_service
+        self.subscription_update_queue = subscription_update_queue
 
     async def try_connection(self) -> None:
         response = await self.remnawave.system.get_stats()
@@ -168,6 +207,7 @@ class RemnawaveService(BaseService):
         if not isinstance(updated_user, UserResponseDto):
             raise ValueError("Failed to update RemnaUser: unexpected response")
 
+        await self.clear_user_cache(uuid)
         logger.info(f"RemnaUser '{user.telegram_id}' updated successfully")
         return updated_user
 
@@ -185,6 +225,8 @@ class RemnawaveService(BaseService):
         if not isinstance(result, DeleteUserResponseDto):
             raise ValueError("Failed to delete RemnaUser: unexpected response")
 
+        await self.clear_user_cache(user.current_subscription.user_remna_id)
+
         if result.is_deleted:
             logger.info(f"RemnaUser '{user.telegram_id}' deleted successfully")
         else:
@@ -233,6 +275,7 @@ class RemnawaveService(BaseService):
         logger.info(f"Deleted device '{hwid}' for RemnaUser '{user.telegram_id}'")
         return result.total
 
+    @redis_cache(prefix="remna_user", ttl=REMNAWAVE_CACHE_TTL, stale_ttl=REMNAWAVE_CACHE_STALE_TTL)
     async def get_user(self, uuid: UUID) -> Optional[UserResponseDto]:
         logger.info(f"Fetching RemnaUser '{uuid}'")
         remna_user = await self.remnawave.users.get_user_by_uuid(str(uuid))
@@ -244,6 +287,31 @@ class RemnawaveService(BaseService):
         logger.info(f"RemnaUser '{remna_user.telegram_id}' fetched successfully")
         return remna_user
 
+    async def iter_users(
+        self,
+        page_size: int = PANEL_SYNC_PAGE_SIZE,
+        concurrency: int = PANEL_SYNC_CONCURRENCY,
+    ) -> AsyncIterator[list[UserResponseDto]]:
+        response = await self.remnawave.users.get_all_users_v2(start=0, size=page_size)
+
+        if not isinstance(response, UsersResponseDto) or not response.users:
+            return
+
+        logger.info(f"Fetching '{response.total}' RemnaUsers from panel")
+        yield response.users
+
+        # NOTE: Panel may cap the page size, so step by what it actually returned
+        size = len(response.users)
+
+        for starts in chunked(range(size, response.total, size), concurrency):
+            responses = await asyncio.gather(
+                *(self.remnawave.users.get_all_users_v2(start=start, size=size) for start in starts)
+            )
+
+            for page in responses:
+                if isinstance(page, UsersResponseDto) and page.users:
+                    yield page.users
+
     async def get_subscription_url(self, uuid: UUID) -> Optional[str]:
         remna_user = await self.get_user(uuid)
 
@@ -252,16 +320,237 @@ class RemnawaveService(BaseService):
 
         return remna_user.subscription_url
 
+    @redis_cache(
+        prefix="remna_internal_squads",
+        ttl=REMNAWAVE_CACHE_TTL,
+        stale_ttl=REMNAWAVE_CACHE_STALE_TTL,
+    )
+    async def get_internal_squads(self) -> GetAllInternalSquadsResponseDto:
+        response = await self.remnawave.internal_squads.get_internal_squads()
+
+        if not isinstance(response, GetAllInternalSquadsResponseDto):
+            raise ValueError("Wrong response from Remnawave")
+
+        return response
+
+    @redis_cache(prefix="remna_nodes", ttl=REMNAWAVE_CACHE_TTL, stale_ttl=REMNAWAVE_CACHE_STALE_TTL)
+    async def get_nodes(self) -> GetAllNodesResponseDto:
+        response = await self.remnawave.nodes.get_all_nodes()
+
+        if not isinstance(response, GetAllNodesResponseDto):
+            raise ValueError("Wrong response from Remnawave")
+
+        return response
+
+    @redis_cache(prefix="remna_stats", ttl=REMNAWAVE_CACHE_TTL, stale_ttl=REMNAWAVE_CACHE_STALE_TTL)
+    async def get_system_stats(self) -> GetStatsResponseDto:
+        response = await self.remnawave.system.get_stats()
+
+        if not isinstance(response, GetStatsResponseDto):
+            raise ValueError("Wrong response from Remnawave")
+
+        return response
+
+    async def clear_user_cache(self, uuid: UUID) -> None:
+        await invalidate_cache(self.redis_client, build_key("cache", "remna_user", uuid))
+
+    async def clear_nodes_cache(self) -> None:
+        await invalidate_cache(
+            self.redis_client,
+            build_key("cache", "remna_nodes"),
+            build_key("cache", "remna_stats"),
+        )
+
     #
 
+    async def ingest_event(self, payload: WebhookPayloadDto, raw_body: str) -> bool:
+        from src.infrastructure.taskiq.tasks.remnawave import (  # noqa: PLC0415
+            process_remnawave_events_task,
+        )
+
+        key = RemnawaveEventKey(
+            event=payload.event,
+            uuid=self.get_event_subject(payload),
+            timestamp=int(payload.timestamp.timestamp() * 1000),
+        )
+
+        # The panel retries slow or failed deliveries, only the first copy gets queued
+        if not await self.redis_client.set(key.pack(), 1, nx=True, ex=REMNAWAVE_EVENT_DEDUP_TTL):
+            logger.debug(f"Skipping duplicate event '{payload.event}' for '{key.uuid}'")
+            return False
+
+        try:
+            await self.redis_repository.stream_add(
+                RemnawaveEventsKey(),
+                {"payload": raw_body},
+                maxlen=REMNAWAVE_EVENTS_MAXLEN,
+            )
+        except Exception:
+            # Release the dedup key, otherwise the panel's retry is dropped as a duplicate
+            await self.redis_client.delete(key.pack())
+            raise
+
+        scheduled_key = RemnawaveEventsScheduledKey().pack()
+        if await self.redis_client.set(scheduled_key, 1, nx=True, ex=REMNAWAVE_EVENTS_LOCK_TTL):
+            await process_remnawave_events_task.kiq()
+
+        return True
+
+    async def process_events(self) -> int:
+        lock_key = RemnawaveEventsLockKey().pack()
+
+        if not await self.redis_client.set(lock_key, 1, nx=True, ex=REMNAWAVE_EVENTS_LOCK_TTL):
+            logger.debug("Remnawave events are already being processed")
+            return 0
+
+        processed = 0
+
+        try:
+            while True:
+                # Events queued from now on need a new kick, the current loop may already be done
+                await self.redis_repository.delete(RemnawaveEventsScheduledKey())
+                entries = await self.redis_repository.stream_range(
+                    RemnawaveEventsKey(),
+                    REMNAWAVE_EVENTS_BATCH_SIZE,
+                )
+
+                if not entries:
+                    break
+
+                for payload in self.coalesce_events(entries):
+                    await self._handle_event_safely(payload)
+
+                await self.redis_repository.stream_delete(
+                    RemnawaveEventsKey(),
+                    *(entry_id for entry_id, _ in entries),
+                )
+                await self.redis_client.expire(lock_key, REMNAWAVE_EVENTS_LOCK_TTL)
+                processed += len(entries)
+        finally:
+            await self.redis_client.delete(lock_key)
+
+        if processed:
+            logger.info(f"Processed '{processed}' queued Remnawave events")
+
+        return processed
+
+    async def handle_event(self, payload: WebhookPayloadDto) -> None:
+        if WebhookUtility.is_user_event(payload.event):
+            remna_user = cast(UserWebhookDto, WebhookUtility.get_typed_data(payload))
+            await self.clear_user_cache(remna_user.uuid)
+            await self.handle_user_event(payload.event, remna_user)
+
+        elif WebhookUtility.is_user_hwid_devices_event(payload.event):
+            event = cast(UserHwidDeviceEventDto, WebhookUtility.get_typed_data(payload))
+            await self.clear_user_cache(event.user.uuid)
+            await self.handle_device_event(payload.event, event.user, event.hwid_user_device)
+
+        elif WebhookUtility.is_node_event(payload.event):
+            node = cast(NodeDto, WebhookUtility.get_typed_data(payload))
+            await self.clear_nodes_cache()
+            await self.handle_node_event(payload.event, node)
+
+        else:
+            logger.warning(f"Unhandled Remnawave event type: '{payload.event}'")
+
+    @staticmethod
+    def get_event_subject(payload: WebhookPayloadDto) -> str:
+        data = payload.data
+
+        if isinstance(data, UserHwidDeviceEventDto):
+            return data.user.uuid.hex
+        if isinstance(data, (UserWebhookDto, NodeDto)):
+            return data.uuid.hex
+
+        return "none"
+
+    @classmethod
+    def coalesce_events(cls, entries: list[tuple[str, dict[str, str]]]) -> list[WebhookPayloadDto]:
+        payloads: list[WebhookPayloadDto] = []
+
+        for entry_id, data in entries:
+            try:
+                payloads.append(WebhookPayloadDto.from_dict(json_utils.decode(data["payload"])))
+            except Exception as exception:
+                logger.error(f"Dropping malformed Remnawave event '{entry_id}': {exception}")
+
+        # Every MODIFIED event carries the full user state, so only the latest one matters
+        latest_modified = {
+            cls.get_event_subject(payload): index
+            for index, payload in enumerate(payloads)
+            if payload.event == RemnaUserEvent.MODIFIED
+        }
+
+        return [
+            payload
+            for index, payload in enumerate(payloads)
+            if payload.event != RemnaUserEvent.MODIFIED
+            or latest_modified[cls.get_event_subject(payload)] == index
+        ]
+
+    async def _handle_event_safely(self, payload: WebhookPayloadDto) -> None:
+        try:
+            await self.handle_event(payload)
+        except Exception as exception:
+            logger.exception(f"Error processing Remnawave event '{payload.event}': {exception}")
+            traceback_str = traceback.format_exc()
+            error_type_name = type(exception).__name__
+            error_message = Text(str(exception)[:512])
+
+            await send_error_notification_task.kiq(
+                error_id=str(uuid4()),
+                traceback_str=traceback_str,
+                i18n_kwargs={
+                    "user": False,
+                    "error": f"{error_type_name}: {error_message.as_html()}",
+                },
+            )
+
+    async def queue_subscription_update(
+        self,
+        telegram_id: int,
+        remna_subscription: Optional[RemnaSubscriptionDto] = None,
+        status: Optional[SubscriptionStatus] = None,
+    ) -> None:
+        key = SubscriptionUpdateKey(telegram_id=telegram_id).pack()
+
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            if remna_subscription:
+                # A full snapshot already carries the status, an older pending one is stale
+                pipe.hset(key, "remna_subscription", remna_subscription.model_dump_json())
+                pipe.hdel(key, "status")
+            if status:
+                pipe.hset(key, "status", status.value)
+            pipe.expire(key, SUBSCRIPTION_UPDATE_TTL)
+            await pipe.execute()
+
+        if not await self.subscription_update_queue.schedule(telegram_id):
+            logger.debug(f"Merged subscription update for user '{telegram_id}' into pending one")
+
+    async def pop_subscription_update(self, telegram_id: int) -> SubscriptionUpdateDto:
+        key = SubscriptionUpdateKey(telegram_id=telegram_id).pack()
+
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.hgetall(key)
+            pipe.delete(key)
+            fields, _ = await pipe.execute()
+
+        fields = {field.decode(): value.decode() for field, value in fields.items()}
+        return SubscriptionUpdateDto(
+            remna_subscription=(
+                RemnaSubscriptionDto.model_validate_json(fields["remna_subscription"])
+                if "remna_subscription" in fields
+                else None
+            ),
+            status=fields.get("status"),
+        )
+
     async def handle_user_event(self, event: str, remna_user: RemnaUserDto) -> None:  # noqa: C901
         from src.infrastructure.taskiq.tasks.importer import (  # noqa: PLC0415
             sync_imported_user_task,
         )
         from src.infrastructure.taskiq.tasks.subscriptions import (  # noqa: PLC0415
             delete_current_subscription_task,
-            sync_current_subscription_task,
-            update_status_current_subscription_task,
         )
 
         logger.info(f"Received event '{event}' for RemnaUser '{remna_user.telegram_id}'")
@@ -314,7 +603,7 @@ class RemnawaveService(BaseService):
 
             remna_subscription = RemnaSubscriptionDto.from_remna_user(remna_user.model_dump())
             remna_subscription.url = subscription_url
-            await sync_current_subscription_task.kiq(user.telegram_id, remna_subscription)
+            await self.queue_subscription_update(user.telegram_id, remna_subscription)
 
         elif event == RemnaUserEvent.DELETED:
             logger.debug(f"RemnaUser '{remna_user.telegram_id}' deleted")
@@ -337,8 +626,8 @@ class RemnawaveService(BaseService):
             logger.debug(
                 f"RemnaUser '{remna_user.telegram_id}' status changed to '{remna_user.status}'"
             )
-            await update_status_current_subscription_task.kiq(
-                user_telegram_id=remna_user.telegram_id,
+            await self.queue_subscription_update(
+                user.telegram_id,
                 status=SubscriptionStatus(remna_user.status),  # type: ignore[arg-type]
             )
             if event == RemnaUserEvent.LIMITED:
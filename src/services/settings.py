@@ -9,11 +9,12 @@ from src.core.config import AppConfig
 from src.core.constants import TIME_10M
 from src.core.enums import AccessMode, Currency, SystemNotificationType, UserNotificationType
 from src.core.storage.key_builder import build_key
+from src.core.utils.identity_map import IdentityMap
 from src.core.utils.types import AnyNotification
 from src.infrastructure.database import UnitOfWork
 from src.infrastructure.database.models.dto import SettingsDto
 from src.infrastructure.database.models.sql import Settings
-from src.infrastructure.redis import RedisRepository
+from src.infrastructure.redis import RedisRepository, invalidate_cache
 from src.infrastructure.redis.cache import redis_cache
 
 from .base import BaseService
@@ -21,6 +22,7 @@ from .base import BaseService
 
 class SettingsService(BaseService):
     uow: UnitOfWork
+    identity_map: IdentityMap
 
     def __init__(
         self,
@@ -31,9 +33,11 @@ class SettingsService(BaseService):
         translator_hub: TranslatorHub,
         #
         uow: UnitOfWork,
+        identity_map: IdentityMap,
     ) -> None:
         super().__init__(config, bot, redis_client, redis_repository, translator_hub)
         self.uow = uow
+        self.identity_map = identity_map
 
     async def create(self) -> SettingsDto:
         settings = SettingsDto()
@@ -44,8 +48,16 @@ class SettingsService(BaseService):
         logger.info("Default settings created in DB")
         return SettingsDto.from_model(db_settings)  # type: ignore[return-value]
 
-    @redis_cache(prefix="get_settings", ttl=TIME_10M)
     async def get(self) -> SettingsDto:
+        key = ("settings", None)
+
+        if key not in self.identity_map:
+            self.identity_map[key] = await self._get()
+
+        return self.identity_map[key]  # type: ignore[no-any-return]
+
+    @redis_cache(prefix="get_settings", ttl=TIME_10M, local=True)
+    async def _get(self) -> SettingsDto:
         db_settings = await self.uow.repository.settings.get()
         if not db_settings:
             return await self.create()
@@ -165,6 +177,7 @@ class SettingsService(BaseService):
     #
 
     async def _clear_cache(self) -> None:
+        self.identity_map.evict(("settings", None))
         settings_cache_key: str = build_key("cache", "get_settings")
         logger.debug(f"Cache '{settings_cache_key}' cleared")
-        await self.redis_client.delete(settings_cache_key)
+        await invalidate_cache(self.redis_client, settings_cache_key)
@@ -0,0 +1,65 @@
+from datetime import date
+from typing import Any, Optional
+
+from aiogram import Bot
+from fluentogram import TranslatorHub
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.config import AppConfig
+from src.core.utils.time import datetime_now
+from src.infrastructure.database import UnitOfWork
+from src.infrastructure.redis import RedisRepository
+
+from .base import BaseService
+
+
+class StatisticsService(BaseService):
+    uow: UnitOfWork
+
+    def __init__(
+        self,
+        config: AppConfig,
+        bot: Bot,
+        redis_client: Redis,
+        redis_repository: RedisRepository,
+        translator_hub: TranslatorHub,
+        #
+        uow: UnitOfWork,
+    ) -> None:
+        super().__init__(config, bot, redis_client, redis_repository, translator_hub)
+        self.uow = uow
+
+    async def get_users_statistics(self) -> dict[str, Any]:
+        statistics = await self.uow.repository.statistics.get_users_statistics(datetime_now())
+        logger.debug("Retrieved users statistics")
+        return statistics
+
+    async def get_transactions_statistics(self) -> dict[str, Any]:
+        statistics = await self.uow.repository.statistics.get_transactions_statistics(
+            datetime_now()
+        )
+        logger.debug("Retrieved transactions statistics")
+        return statistics
+
+    async def get_subscriptions_statistics(self) -> dict[str, Any]:
+        statistics = await self.uow.repository.statistics.get_subscriptions_statistics(
+            datetime_now()
+        )
+        logger.debug("Retrieved subscriptions statistics")
+        return statistics
+
+    async def get_plans_statistics(self) -> dict[str, Any]:
+        statistics = await self.uow.repository.statistics.get_plans_statistics()
+        logger.debug("Retrieved plans statistics")
+        return statistics
+
+    async def get_promocodes_statistics(self) -> list[dict[str, Any]]:
+        statistics = await self.uow.repository.statistics.get_promocodes_statistics()
+        logger.debug("Retrieved promocodes statistics")
+        return statistics
+
+    async def rebuild(self, since: Optional[date] = None) -> None:
+        await self.uow.repository.statistics.rebuild(since)
+        await self.uow.commit()
+        logger.info(f"Rebuilt statistics rollups since '{since or 'the beginning'}'")
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Sequence
 
 from aiogram import Bot
 from fluentogram import TranslatorHub
@@ -7,10 +7,19 @@ from redis.asyncio import Redis
 from sqlalchemy import and_
 
 from src.core.config import AppConfig
+from src.core.constants import IMPORTED_TAG
 from src.core.enums import SubscriptionStatus
+from src.core.utils.formatters import format_limits_to_plan_type
+from src.core.utils.identity_map import IdentityMap
+from src.core.utils.types import RemnaUserDto
 from src.infrastructure.database import UnitOfWork
-from src.infrastructure.database.models.dto import SubscriptionDto, UserDto
-from src.infrastructure.database.models.sql import Subscription, User
+from src.infrastructure.database.models.dto import (
+    PlanSnapshotDto,
+    RemnaSubscriptionDto,
+    SubscriptionDto,
+    UserDto,
+)
+from src.infrastructure.database.models.sql import Subscription
 from src.infrastructure.redis import RedisRepository
 from src.services.user import UserService
 
@@ -20,6 +29,7 @@ from .base import BaseService
 class SubscriptionService(BaseService):
     uow: UnitOfWork
     user_service: UserService
+    identity_map: IdentityMap
 
     def __init__(
         self,
@@ -31,10 +41,12 @@ class SubscriptionService(BaseService):
         #
         uow: UnitOfWork,
         user_service: UserService,
+        identity_map: IdentityMap,
     ) -> None:
         super().__init__(config, bot, redis_client, redis_repository, translator_hub)
         self.uow = uow
         self.user_service = user_service
+        self.identity_map = identity_map
 
     async def create(self, user: UserDto, subscription: SubscriptionDto) -> SubscriptionDto:
         data = subscription.model_dump(exclude={"user"})
@@ -42,6 +54,12 @@ class SubscriptionService(BaseService):
 
         db_subscription = Subscription(**data, user_telegram_id=user.telegram_id)
         db_created_subscription = await self.uow.repository.subscriptions.create(db_subscription)
+        await self.uow.repository.statistics.record_subscription(
+            telegram_id=user.telegram_id,
+            subscription_id=db_created_subscription.id,
+            is_trial=db_created_subscription.is_trial,
+            created_at=db_created_subscription.created_at,
+        )
 
         await self.user_service.set_current_subscription(
             telegram_id=user.telegram_id,
@@ -65,6 +83,14 @@ class SubscriptionService(BaseService):
         return SubscriptionDto.from_model(db_subscription)
 
     async def get_current(self, telegram_id: int) -> Optional[SubscriptionDto]:
+        key = ("current_subscription", telegram_id)
+
+        if key not in self.identity_map:
+            self.identity_map[key] = await self._get_current(telegram_id)
+
+        return self.identity_map[key]  # type: ignore[no-any-return]
+
+    async def _get_current(self, telegram_id: int) -> Optional[SubscriptionDto]:
         db_user = await self.uow.repository.users.get(telegram_id)
 
         if not db_user or not db_user.current_subscription_id:
@@ -94,17 +120,20 @@ class SubscriptionService(BaseService):
         logger.debug(f"Retrieved '{len(db_subscriptions)}' subscriptions for user '{telegram_id}'")
         return SubscriptionDto.from_model_list(db_subscriptions)
 
-    async def get_all(self) -> list[SubscriptionDto]:
-        db_subscriptions = await self.uow.repository.subscriptions.get_all()
-        logger.debug(f"Retrieved '{len(db_subscriptions)}' total subscriptions")
-        return SubscriptionDto.from_model_list(db_subscriptions)
-
     async def update(self, subscription: SubscriptionDto) -> Optional[SubscriptionDto]:
         data = subscription.changed_data.copy()
 
         if subscription.plan.changed_data or "plan" in data:
             data["plan"] = subscription.plan.model_dump(mode="json")
 
+        if not data:
+            logger.debug(f"Subscription '{subscription.id}' has no changes, skipping update")
+            return subscription
+
+        # NOTE: Local edits of synced fields make the stored panel fingerprint stale
+        if "sync_hash" not in data and RemnaSubscriptionDto.SYNC_FIELDS & data.keys():
+            data["sync_hash"] = None
+
         db_updated_subscription = await self.uow.repository.subscriptions.update(
             subscription_id=subscription.id,  # type: ignore[arg-type]
             **data,
@@ -113,8 +142,10 @@ class SubscriptionService(BaseService):
         await self.uow.commit()
 
         if db_updated_subscription:
-            if subscription.user:
-                await self.user_service.clear_user_cache(telegram_id=subscription.user.telegram_id)
+            self.identity_map.evict_namespace("current_subscription")
+            await self.user_service.clear_user_cache(
+                telegram_id=db_updated_subscription.user_telegram_id
+            )
             logger.info(f"Updated subscription '{subscription.id}' successfully")
         else:
             logger.warning(
@@ -124,11 +155,102 @@ class SubscriptionService(BaseService):
 
         return SubscriptionDto.from_model(db_updated_subscription)
 
-    async def get_subscribed_users(self) -> list[UserDto]:
-        db_users = await self.uow.repository.users._get_many(User)
-        users = [user for user in db_users if user.current_subscription]
-        logger.debug(f"Retrieved '{len(users)}' users with subscription")
-        return UserDto.from_model_list(users)
+    async def sync_from_panel(self, remna_users: Sequence[RemnaUserDto]) -> tuple[int, int]:
+        remna_users_map = {
+            remna_user.telegram_id: remna_user
+            for remna_user in remna_users
+            if remna_user.telegram_id
+        }
+
+        if not remna_users_map:
+            return 0, 0
+
+        db_subscriptions = await self.uow.repository.subscriptions.get_current_by_users(
+            list(remna_users_map)
+        )
+
+        subscriptions = SubscriptionDto.from_model_list(db_subscriptions)
+        changes: list[dict] = []
+        changed_ids: list[int] = []
+
+        for db_subscription, subscription in zip(db_subscriptions, subscriptions):
+            telegram_id = db_subscription.user_telegram_id
+            remna_user = remna_users_map.pop(telegram_id)
+            remna_subscription = RemnaSubscriptionDto.from_remna_user(remna_user.model_dump())
+            subscription.apply_sync(remna_subscription)
+
+            if subscription.changed_data:
+                changes.append({"id": subscription.id, **subscription.changed_data})
+                changed_ids.append(telegram_id)
+
+        await self.uow.repository.subscriptions.update_many(changes)
+        created_ids = await self._create_from_panel(list(remna_users_map.values()))
+        await self.uow.commit()
+
+        if changed_ids or created_ids:
+            self.identity_map.evict_namespace("current_subscription")
+            await self.user_service.clear_users_cache(changed_ids + created_ids)
+
+        logger.info(
+            f"Synced panel users: '{len(changes)}' subscriptions updated, "
+            f"'{len(created_ids)}' created"
+        )
+        return len(changes), len(created_ids)
+
+    async def _create_from_panel(self, remna_users: list[RemnaUserDto]) -> list[int]:
+        if not remna_users:
+            return []
+
+        await self.user_service.create_many_from_panel(
+            [remna_user.telegram_id for remna_user in remna_users]  # type: ignore[misc]
+        )
+
+        subscriptions: list[dict] = []
+
+        for remna_user in remna_users:
+            remna_subscription = RemnaSubscriptionDto.from_remna_user(remna_user.model_dump())
+            subscription = self.build_imported(remna_user, remna_subscription)
+            data = subscription.model_dump(exclude={"id", "user", "created_at", "updated_at"})
+            data["plan"] = subscription.plan.model_dump(mode="json")
+            data["user_telegram_id"] = remna_user.telegram_id
+            subscriptions.append(data)
+
+        db_subscriptions = await self.uow.repository.subscriptions.create_many(subscriptions)
+        current_subscriptions = [
+            (db_subscription.user_telegram_id, db_subscription.id)
+            for db_subscription in db_subscriptions
+        ]
+        await self.uow.repository.users.set_current_subscriptions(current_subscriptions)
+        return [telegram_id for telegram_id, _ in current_subscriptions]
+
+    @staticmethod
+    def build_imported(
+        remna_user: RemnaUserDto,
+        remna_subscription: RemnaSubscriptionDto,
+    ) -> SubscriptionDto:
+        temp_plan = PlanSnapshotDto(
+            id=-1,
+            name=IMPORTED_TAG,
+            type=format_limits_to_plan_type(
+                remna_subscription.traffic_limit,
+                remna_subscription.device_limit,
+            ),
+            traffic_limit=remna_subscription.traffic_limit,
+            device_limit=remna_subscription.device_limit,
+            duration=-1,
+            internal_squads=remna_subscription.internal_squads,
+        )
+        return SubscriptionDto(
+            user_remna_id=remna_user.uuid,
+            status=remna_user.status,
+            traffic_limit=temp_plan.traffic_limit,
+            device_limit=temp_plan.device_limit,
+            internal_squads=remna_subscription.internal_squads,
+            expire_at=remna_user.expire_at,
+            url=remna_subscription.url,
+            plan=temp_plan,
+            sync_hash=remna_subscription.fingerprint,
+        )
 
     async def get_users_by_plan(self, plan_id: int) -> list[UserDto]:
         db_subscriptions = await self.uow.repository.subscriptions.filter_by_plan_id(plan_id)
@@ -144,37 +266,6 @@ class SubscriptionService(BaseService):
         logger.debug(f"Retrieved '{len(users)}' users for active plan '{plan_id}'")
         return users
 
-    async def get_unsubscribed_users(self) -> list[UserDto]:
-        db_users = await self.uow.repository.users._get_many(User)
-        users = [user for user in db_users if not user.current_subscription]
-        logger.debug(f"Retrieved '{len(users)}' users without subscription")
-        return UserDto.from_model_list(users)
-
-    async def get_expired_users(self) -> list[UserDto]:
-        db_users = await self.uow.repository.users._get_many(User)
-
-        users = [
-            user
-            for user in db_users
-            if user.current_subscription
-            and user.current_subscription.status == SubscriptionStatus.EXPIRED
-        ]
-
-        logger.debug(f"Retrieved '{len(users)}' users with expired subscription")
-        return UserDto.from_model_list(users)
-
-    async def get_trial_users(self) -> list[UserDto]:
-        db_users = await self.uow.repository.users._get_many(User)
-
-        users = [
-            user
-            for user in db_users
-            if user.current_subscription and user.current_subscription.is_trial
-        ]
-
-        logger.debug(f"Retrieved '{len(users)}' users with trial subscription")
-        return UserDto.from_model_list(users)
-
     async def has_any_subscription(self, user: UserDto) -> bool:
         count = await self.uow.repository.subscriptions._count(
             Subscription, Subscription.user_telegram_id == user.telegram_id
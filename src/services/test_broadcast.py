@@ -55,3 +55,36 @@ async def test_get_audience_count_all(broadcast_service):
     # Assert
     assert result == 42
     broadcast_service.uow.repository.users._count.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_iter_audience_users_uses_keyset_pages(broadcast_service, monkeypatch):
+    """Аудитория читается страницами по telegram_id, без загрузки всего списка."""
+    # Arrange
+    first_page = [MagicMock(telegram_id=1), MagicMock(telegram_id=2)]
+    second_page = [MagicMock(telegram_id=5)]
+
+    async def iter_batches(*args, **kwargs):
+        for page in (first_page, second_page):
+            yield page
+
+    iter_batches_mock = MagicMock(side_effect=iter_batches)
+    broadcast_service.uow.repository.users.iter_batches = iter_batches_mock
+    monkeypatch.setattr(
+        "src.services.broadcast.UserDto.from_model_list",
+        lambda users: users,
+    )
+
+    # Act
+    pages = [
+        page
+        async for page in broadcast_service.iter_audience_users(
+            BroadcastAudience.ALL,
+            batch_size=2,
+        )
+    ]
+
+    # Assert
+    assert pages == [first_page, second_page]
+    iter_batches_mock.assert_called_once()
+    assert iter_batches_mock.call_args.kwargs["batch_size"] == 2
@@ -0,0 +1,105 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiogram.enums import ChatMemberStatus
+from pydantic import SecretStr
+
+from src.core.config import AppConfig
+from src.core.storage.keys import ChannelMemberKey, ChannelMembersKey
+from src.infrastructure.database.models.dto import SettingsDto
+from src.infrastructure.redis import RedisRepository
+from src.services.channel import ChannelService
+
+
+@pytest.fixture
+def pipe():
+    return MagicMock(execute=AsyncMock())
+
+
+@pytest.fixture
+def channel_service(pipe):
+    redis_client = MagicMock()
+    redis_client.get = AsyncMock(return_value=None)
+    redis_client.mget = AsyncMock()
+    ctx = MagicMock()
+    ctx.__aenter__.return_value = pipe
+    redis_client.pipeline = MagicMock(return_value=ctx)
+
+    settings_service = AsyncMock()
+    settings_service.get.return_value = SettingsDto(
+        channel_required=True,
+        channel_link=SecretStr("@channel"),
+    )
+
+    return ChannelService(
+        config=MagicMock(spec=AppConfig),
+        bot=AsyncMock(),
+        redis_client=redis_client,
+        redis_repository=AsyncMock(spec=RedisRepository),
+        translator_hub=MagicMock(),
+        settings_service=settings_service,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_member_status_uses_cache(channel_service):
+    # Arrange
+    channel_service.redis_client.get.return_value = b"member"
+
+    # Act
+    status = await channel_service.get_member_status("@channel", 123)
+
+    # Assert
+    assert status == ChatMemberStatus.MEMBER
+    channel_service.bot.get_chat_member.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_member_status_caches_fetched_status(channel_service, pipe):
+    # Arrange
+    channel_service.redis_client.get.return_value = b"member"
+    channel_service.bot.get_chat_member.return_value = MagicMock(status=ChatMemberStatus.LEFT)
+
+    # Act
+    # Принудительная проверка игнорирует кеш
+    status = await channel_service.get_member_status("@channel", 123, force=True)
+
+    # Assert
+    assert status == ChatMemberStatus.LEFT
+    key = ChannelMemberKey(chat_id="@channel", telegram_id=123).pack()
+    assert pipe.set.call_args.args == (key, "left")
+    pipe.srem.assert_called_once_with(ChannelMembersKey(chat_id="@channel").pack(), 123)
+
+
+@pytest.mark.asyncio
+async def test_handle_member_updated_ignores_other_chats(channel_service):
+    # Arrange
+    chat = MagicMock(username="other")
+
+    # Act
+    handled = await channel_service.handle_member_updated(chat, 123, ChatMemberStatus.MEMBER)
+
+    # Assert
+    assert handled is False
+    channel_service.redis_client.pipeline.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_reverify_members_rechecks_only_cached_members(channel_service, pipe):
+    # Arrange
+    channel_service.redis_repository.collection_members.return_value = ["1", "2"]
+    channel_service.redis_client.mget.return_value = [b"member", None]
+    channel_service.bot.get_chat_member.return_value = MagicMock(status=ChatMemberStatus.KICKED)
+
+    # Act
+    with patch("src.services.channel.TokenBucket") as bucket:
+        bucket.return_value.acquire = AsyncMock()
+        left = await channel_service.reverify_members()
+
+    # Assert
+    assert left == 1
+    channel_service.bot.get_chat_member.assert_awaited_once_with(chat_id="@channel", user_id=1)
+    # Просроченная запись удаляется из набора без запроса к Telegram
+    channel_service.redis_repository.collection_remove.assert_awaited_once_with(
+        ChannelMembersKey(chat_id="@channel"), 2
+    )
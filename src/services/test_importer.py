@@ -0,0 +1,120 @@
+import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.core.config import AppConfig
+from src.core.constants import IMPORT_SEGMENT_ACTIVE, IMPORT_SEGMENT_EXPIRED
+from src.core.utils import json_utils
+from src.infrastructure.database.models.dto import ImportChunkResultDto, ImportDto
+from src.infrastructure.redis import RedisRepository
+from src.services.importer import ImporterService
+
+
+@pytest.fixture
+def importer_service():
+    # Трансформация в потоке вместо процесса — поведение то же, а тест быстрее
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        yield ImporterService(
+            config=MagicMock(spec=AppConfig),
+            bot=MagicMock(),
+            redis_client=AsyncMock(),
+            redis_repository=AsyncMock(spec=RedisRepository),
+            translator_hub=MagicMock(),
+            import_executor=executor,
+        )
+
+
+@pytest.mark.asyncio
+async def test_export_users_streams_xui_clients(importer_service, tmp_path):
+    # Arrange
+    db_path = tmp_path / "x-ui.db"
+    clients = [
+        {"email": "111", "enable": True, "expiryTime": 0},
+        {"email": "222", "enable": True, "expiryTime": 1000},
+        {"email": "no-digits", "enable": True},
+        {"email": "333", "enable": False},
+    ]
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.execute("CREATE TABLE inbounds (id INTEGER PRIMARY KEY, settings TEXT)")
+        conn.executemany(
+            "INSERT INTO inbounds VALUES (?, ?)",
+            [
+                (1, json.dumps({"clients": clients[:1]})),
+                (2, json.dumps({"clients": clients})),
+                (3, "not json"),
+            ],
+        )
+        conn.commit()
+
+    # Act
+    exported = await importer_service.export_users(db_path)
+
+    # Assert
+    # Берётся инбаунд с наибольшим числом клиентов, отключённые и без id отбрасываются
+    assert exported.active_count == 1
+    assert exported.expired_count == 1
+    pushed = {
+        call.args[0].segment: call.args[1:]
+        for call in importer_service.redis_repository.list_append.await_args_list
+    }
+    assert json_utils.decode(pushed[IMPORT_SEGMENT_ACTIVE][0])["telegram_id"] == "111"
+    assert json_utils.decode(pushed[IMPORT_SEGMENT_EXPIRED][0])["telegram_id"] == "222"
+
+
+@pytest.mark.asyncio
+async def test_create_import_splits_segments_into_chunks(importer_service):
+    # Arrange
+    export_id = uuid4()
+    importer_service.redis_repository.list_length.side_effect = [5, 2]
+
+    # Act
+    with patch("src.services.importer.IMPORT_CHUNK_SIZE", 2):
+        job = await importer_service.create_import(
+            export_id,
+            segments=[IMPORT_SEGMENT_ACTIVE, IMPORT_SEGMENT_EXPIRED],
+            active_internal_squads=[uuid4()],
+        )
+
+    # Assert
+    assert job.total_count == 7
+    # Пользователи не передаются в аргументах задачи, чанки ссылаются на диапазоны списков
+    assert job.chunks == [
+        (IMPORT_SEGMENT_ACTIVE, 0, 1),
+        (IMPORT_SEGMENT_ACTIVE, 2, 3),
+        (IMPORT_SEGMENT_ACTIVE, 4, 4),
+        (IMPORT_SEGMENT_EXPIRED, 0, 1),
+    ]
+    importer_service.redis_repository.set.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_progress_sums_checkpoints(importer_service):
+    # Arrange
+    import_id = uuid4()
+    redis_repository = importer_service.redis_repository
+    redis_repository.get.return_value = ImportDto(
+        import_id=import_id,
+        export_id=uuid4(),
+        total_count=1000,
+        chunks=[(IMPORT_SEGMENT_ACTIVE, 0, 499), (IMPORT_SEGMENT_ACTIVE, 500, 999)],
+        active_internal_squads=[],
+    )
+    redis_repository.hash_values.return_value = [
+        ImportChunkResultDto(chunk=0, success_count=490, failed_count=10),
+    ]
+    redis_repository.exists.return_value = False
+
+    # Act
+    progress = await importer_service.get_progress(import_id)
+
+    # Assert
+    assert progress.success_count == 490
+    assert progress.failed_count == 10
+    # Второй чанк не обработан, а блокировки нет — импорт можно продолжить
+    assert progress.is_finished is False
+    assert progress.is_running is False
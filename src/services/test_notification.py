@@ -29,6 +29,7 @@ def notification_service():
         translator_hub=mock_hub,
         user_service=AsyncMock(),
         settings_service=AsyncMock(),
+        message_deletion_queue=AsyncMock(),
     )
 
 
@@ -118,4 +119,4 @@ async def test_notify_user_success_with_type(notification_service):
         notification_service.settings_service.is_notification_enabled.assert_awaited_once_with(
             ntf_type
         )
-        mock_send.assert_awaited_once_with(user, payload)  # ← позиционные аргументы!
+        mock_send.assert_awaited_once_with(user, payload, raise_on_flood=False)
@@ -0,0 +1,249 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, call, patch
+from uuid import uuid4
+
+import pytest
+from remnawave.models.webhook import UserDto as UserWebhookDto
+from remnawave.models.webhook import WebhookPayloadDto
+
+from src.core.config import AppConfig
+from src.core.enums import RemnaUserEvent, SubscriptionStatus
+from src.core.storage.keys import RemnawaveEventsKey
+from src.infrastructure.database.models.dto import RemnaSubscriptionDto
+from src.infrastructure.redis import RedisRepository
+from src.services.remnawave import RemnawaveService
+
+
+@pytest.fixture
+def remnawave_service():
+    return RemnawaveService(
+        config=MagicMock(spec=AppConfig),
+        bot=MagicMock(),
+        redis_client=AsyncMock(),
+        redis_repository=AsyncMock(spec=RedisRepository),
+        translator_hub=MagicMock(),
+        remnawave=MagicMock(),
+        user_service=AsyncMock(),
+        subscription_update_queue=AsyncMock(),
+    )
+
+
+def make_pipeline(redis_client, results=None):
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=results or [])
+    context = MagicMock()
+    context.__aenter__.return_value = pipe
+    redis_client.pipeline = MagicMock(return_value=context)
+    return pipe
+
+
+def make_remna_subscription(status=SubscriptionStatus.ACTIVE):
+    return RemnaSubscriptionDto(
+        uuid=uuid4(),
+        status=status,
+        expire_at=datetime(2030, 1, 1, tzinfo=timezone.utc),
+        url="https://example.com/sub",
+        traffic_limit=100,
+        device_limit=3,
+        internal_squads=[],
+    )
+
+
+def make_payload(event, user_uuid, second=0):
+    return WebhookPayloadDto.model_construct(
+        event=event,
+        timestamp=datetime(2025, 1, 1, 0, 0, second, tzinfo=timezone.utc),
+        data=UserWebhookDto.model_construct(uuid=user_uuid),
+    )
+
+
+@pytest.mark.asyncio
+async def test_ingest_event_skips_duplicates(remnawave_service):
+    # Arrange
+    remnawave_service.redis_client.set.return_value = None
+    payload = make_payload(RemnaUserEvent.MODIFIED, uuid4())
+
+    # Act
+    with patch(
+        "src.infrastructure.taskiq.tasks.remnawave.process_remnawave_events_task.kiq",
+        new=AsyncMock(),
+    ) as kiq:
+        accepted = await remnawave_service.ingest_event(payload, "{}")
+
+    # Assert
+    assert accepted is False
+    remnawave_service.redis_repository.stream_add.assert_not_awaited()
+    kiq.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_ingest_event_queues_and_schedules_consumer(remnawave_service):
+    # Arrange
+    remnawave_service.redis_client.set.return_value = True
+    user_uuid = uuid4()
+    payload = make_payload(RemnaUserEvent.MODIFIED, user_uuid)
+
+    # Act
+    with patch(
+        "src.infrastructure.taskiq.tasks.remnawave.process_remnawave_events_task.kiq",
+        new=AsyncMock(),
+    ) as kiq:
+        accepted = await remnawave_service.ingest_event(payload, '{"event": "user.modified"}')
+
+    # Assert
+    assert accepted is True
+    dedup_key = remnawave_service.redis_client.set.await_args_list[0].args[0]
+    assert dedup_key.startswith(f"remnawave_event:{RemnaUserEvent.MODIFIED}:")
+    assert user_uuid.hex in dedup_key
+    remnawave_service.redis_repository.stream_add.assert_awaited_once()
+    assert remnawave_service.redis_repository.stream_add.await_args.args[0] == RemnawaveEventsKey()
+    kiq.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_ingest_event_retry_is_queued_after_failed_append(remnawave_service):
+    # Arrange
+    stored_keys: set[str] = set()
+
+    async def set_key(name, value, nx=False, ex=None):
+        if nx and name in stored_keys:
+            return None
+        stored_keys.add(name)
+        return True
+
+    async def delete_key(*names):
+        stored_keys.difference_update(names)
+        return len(names)
+
+    remnawave_service.redis_client.set.side_effect = set_key
+    remnawave_service.redis_client.delete.side_effect = delete_key
+    remnawave_service.redis_repository.stream_add.side_effect = [ConnectionError(), "1-0"]
+    payload = make_payload(RemnaUserEvent.MODIFIED, uuid4())
+
+    # Act
+    with patch(
+        "src.infrastructure.taskiq.tasks.remnawave.process_remnawave_events_task.kiq",
+        new=AsyncMock(),
+    ) as kiq:
+        with pytest.raises(ConnectionError):
+            await remnawave_service.ingest_event(payload, "{}")
+
+        accepted = await remnawave_service.ingest_event(payload, "{}")
+
+    # Assert
+    # Повторная доставка от панели не считается дубликатом, если XADD упал
+    assert accepted is True
+    assert remnawave_service.redis_repository.stream_add.await_count == 2
+    kiq.assert_awaited_once()
+
+
+def test_coalesce_events_keeps_latest_modified_per_user():
+    # Arrange
+    first_uuid, second_uuid = uuid4(), uuid4()
+    payloads = [
+        make_payload(RemnaUserEvent.MODIFIED, first_uuid, 1),
+        make_payload(RemnaUserEvent.MODIFIED, second_uuid, 2),
+        make_payload(RemnaUserEvent.EXPIRED, first_uuid, 3),
+        make_payload(RemnaUserEvent.MODIFIED, first_uuid, 4),
+    ]
+    entries = [(f"{index}-0", {"payload": "{}"}) for index in range(len(payloads))]
+
+    # Act
+    with patch(
+        "src.services.remnawave.WebhookPayloadDto.from_dict",
+        side_effect=payloads,
+    ):
+        result = RemnawaveService.coalesce_events(entries)
+
+    # Assert
+    # Первый MODIFIED схлопывается, порядок остальных событий сохраняется
+    assert result == payloads[1:]
+
+
+def test_coalesce_events_drops_malformed_entries():
+    # Act
+    result = RemnawaveService.coalesce_events([("1-0", {"payload": "not json"})])
+
+    # Assert
+    assert result == []
+
+
+@pytest.mark.asyncio
+async def test_process_events_drains_stream_under_lock(remnawave_service):
+    # Arrange
+    redis_repository = remnawave_service.redis_repository
+    remnawave_service.redis_client.set.return_value = True
+    redis_repository.stream_range.side_effect = [[("1-0", {"payload": "{}"})], []]
+    payload = make_payload(RemnaUserEvent.MODIFIED, uuid4())
+
+    # Act
+    with (
+        patch.object(RemnawaveService, "coalesce_events", return_value=[payload]),
+        patch.object(remnawave_service, "handle_event", new=AsyncMock()) as handle_event,
+    ):
+        processed = await remnawave_service.process_events()
+
+    # Assert
+    assert processed == 1
+    handle_event.assert_awaited_once_with(payload)
+    redis_repository.stream_delete.assert_awaited_once_with(RemnawaveEventsKey(), "1-0")
+    remnawave_service.redis_client.delete.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_process_events_skips_when_locked(remnawave_service):
+    # Arrange
+    remnawave_service.redis_client.set.return_value = None
+
+    # Act
+    processed = await remnawave_service.process_events()
+
+    # Assert
+    assert processed == 0
+    remnawave_service.redis_repository.stream_range.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_queue_subscription_update_schedules_once_per_window(remnawave_service):
+    # Arrange
+    pipe = make_pipeline(remnawave_service.redis_client)
+    queue = remnawave_service.subscription_update_queue
+    queue.schedule.side_effect = [True, False]
+    remna_subscription = make_remna_subscription()
+
+    # Act
+    await remnawave_service.queue_subscription_update(1, remna_subscription)
+    await remnawave_service.queue_subscription_update(1, status=SubscriptionStatus.LIMITED)
+
+    # Assert
+    # Оба события ставят пользователя в очередь, NX оставляет первый срок применения
+    assert queue.schedule.await_args_list == [call(1), call(1)]
+    pipe.hset.assert_any_call(
+        "subscription_update:1", "remna_subscription", remna_subscription.model_dump_json()
+    )
+    pipe.hdel.assert_called_once_with("subscription_update:1", "status")
+    pipe.hset.assert_any_call("subscription_update:1", "status", SubscriptionStatus.LIMITED.value)
+
+
+@pytest.mark.asyncio
+async def test_pop_subscription_update_returns_merged_state(remnawave_service):
+    # Arrange
+    remna_subscription = make_remna_subscription()
+    make_pipeline(
+        remnawave_service.redis_client,
+        results=[
+            {
+                b"remna_subscription": remna_subscription.model_dump_json().encode(),
+                b"status": SubscriptionStatus.LIMITED.value.encode(),
+            },
+            1,
+        ],
+    )
+
+    # Act
+    update = await remnawave_service.pop_subscription_update(1)
+
+    # Assert
+    assert update.remna_subscription == remna_subscription
+    assert update.status == SubscriptionStatus.LIMITED
+    assert not update.is_empty
@@ -1,10 +1,21 @@
 # tests/services/test_subscription_service.py
+from datetime import datetime, timezone
+from uuid import uuid4
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
 from src.core.config import AppConfig
+from src.core.constants import IMPORTED_TAG
+from src.core.enums import SubscriptionStatus
+from src.core.utils.identity_map import IdentityMap
 from src.services.subscription import SubscriptionService
 from src.infrastructure.database import UnitOfWork
+from src.infrastructure.database.models.dto import RemnaSubscriptionDto, SubscriptionDto
+from src.infrastructure.database.models.sql import Subscription
+
+REMNA_UUID = uuid4()
+EXPIRE_AT = datetime(2030, 1, 1, tzinfo=timezone.utc)
 
 
 @pytest.fixture
@@ -26,6 +37,7 @@ def subscription_service(mock_uow):
         translator_hub=MagicMock(),
         uow=mock_uow,
         user_service=MagicMock(),
+        identity_map=IdentityMap(),
     )
 
 
@@ -61,3 +73,144 @@ class TestHasAnySubscription:
         # Assert
         assert result is False
         mock_uow.repository.subscriptions._count.assert_awaited_once()
+
+
+class TestGetCurrent:
+    @pytest.mark.asyncio
+    async def test_reads_database_once_per_request(self, subscription_service, mock_uow):
+        # Arrange
+        mock_uow.repository.users = AsyncMock()
+        mock_uow.repository.users.get.return_value = None
+
+        # Act
+        first = await subscription_service.get_current(12345)
+        second = await subscription_service.get_current(12345)
+
+        # Assert
+        assert first is None
+        assert second is None
+        mock_uow.repository.users.get.assert_awaited_once_with(12345)
+
+
+def make_remna_user(telegram_id, status=SubscriptionStatus.ACTIVE):
+    data = {
+        "uuid": REMNA_UUID,
+        "status": status,
+        "expire_at": EXPIRE_AT,
+        "subscription_url": "https://sub.example/abc",
+        "traffic_limit_bytes": 0,
+        "hwid_device_limit": 0,
+        "active_internal_squads": [],
+    }
+    remna_user = MagicMock(telegram_id=telegram_id, uuid=REMNA_UUID, status=status)
+    remna_user.expire_at = EXPIRE_AT
+    remna_user.model_dump.return_value = data
+    return remna_user
+
+
+def make_db_subscription(telegram_id):
+    remna_subscription = RemnaSubscriptionDto.from_remna_user(
+        make_remna_user(telegram_id).model_dump()
+    )
+    subscription = SubscriptionService.build_imported(
+        make_remna_user(telegram_id), remna_subscription
+    )
+    return Subscription(
+        **subscription.model_dump(exclude={"id", "user", "plan", "created_at", "updated_at"}),
+        id=telegram_id * 10,
+        user_telegram_id=telegram_id,
+        plan=subscription.plan.model_dump(mode="json"),
+    )
+
+
+class TestSyncFromPanel:
+    @pytest.mark.asyncio
+    async def test_updates_only_changed_subscriptions(self, subscription_service, mock_uow):
+        # Arrange
+        subscription_service.user_service = AsyncMock()
+        mock_uow.repository.subscriptions.get_current_by_users.return_value = [
+            make_db_subscription(1),
+            make_db_subscription(2),
+        ]
+        remna_users = [
+            make_remna_user(1),
+            make_remna_user(2, status=SubscriptionStatus.DISABLED),
+        ]
+
+        # Act
+        result = await subscription_service.sync_from_panel(remna_users)
+
+        # Assert
+        assert result == (1, 0)
+        # Пишем в базу только реально изменившиеся поля одним батчем
+        remna_subscription = RemnaSubscriptionDto.from_remna_user(remna_users[1].model_dump())
+        mock_uow.repository.subscriptions.update_many.assert_awaited_once_with(
+            [
+                {
+                    "id": 20,
+                    "status": SubscriptionStatus.DISABLED,
+                    "sync_hash": remna_subscription.fingerprint,
+                }
+            ]
+        )
+        mock_uow.repository.subscriptions.create_many.assert_not_awaited()
+        subscription_service.user_service.clear_users_cache.assert_awaited_once_with([2])
+
+    @pytest.mark.asyncio
+    async def test_creates_missing_subscriptions_in_bulk(self, subscription_service, mock_uow):
+        # Arrange
+        subscription_service.user_service = AsyncMock()
+        mock_uow.repository.users = AsyncMock()
+        mock_uow.repository.subscriptions.get_current_by_users.return_value = []
+        mock_uow.repository.subscriptions.create_many.return_value = [
+            MagicMock(id=10, user_telegram_id=1)
+        ]
+
+        # Act
+        result = await subscription_service.sync_from_panel([make_remna_user(1)])
+
+        # Assert
+        assert result == (0, 1)
+        subscription_service.user_service.create_many_from_panel.assert_awaited_once_with([1])
+        created = mock_uow.repository.subscriptions.create_many.await_args.args[0]
+        assert created[0]["user_telegram_id"] == 1
+        assert created[0]["plan"]["name"] == IMPORTED_TAG
+        mock_uow.repository.users.set_current_subscriptions.assert_awaited_once_with([(1, 10)])
+
+
+class TestUpdate:
+    @pytest.mark.asyncio
+    async def test_skips_write_for_same_panel_fingerprint(self, subscription_service, mock_uow):
+        # Arrange
+        subscription = SubscriptionDto.from_model(make_db_subscription(1))
+        remna_subscription = RemnaSubscriptionDto.from_remna_user(
+            make_remna_user(1).model_dump()
+        )
+
+        # Act
+        subscription.apply_sync(remna_subscription)
+        result = await subscription_service.update(subscription)
+
+        # Assert
+        assert result is subscription
+        mock_uow.repository.subscriptions.update.assert_not_awaited()
+        mock_uow.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_local_edit_resets_panel_fingerprint(self, subscription_service, mock_uow):
+        # Arrange
+        subscription_service.user_service = AsyncMock()
+        subscription = SubscriptionDto.from_model(make_db_subscription(1))
+        mock_uow.repository.subscriptions.update.return_value = None
+
+        # Act
+        subscription.status = SubscriptionStatus.DISABLED
+        await subscription_service.update(subscription)
+
+        # Assert
+        # Следующее событие панели должно примениться, даже если совпадёт со старым отпечатком
+        mock_uow.repository.subscriptions.update.assert_awaited_once_with(
+            subscription_id=10,
+            status=SubscriptionStatus.DISABLED,
+            sync_hash=None,
+        )
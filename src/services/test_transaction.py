@@ -0,0 +1,108 @@
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.core.config import AppConfig
+from src.core.enums import PaymentGatewayType, TransactionStatus
+from src.infrastructure.database import UnitOfWork
+from src.services.transaction import TransactionService
+
+
+@pytest.fixture
+def mock_uow():
+    uow = MagicMock(spec=UnitOfWork)
+    uow.repository = MagicMock()
+    uow.repository.transactions = AsyncMock()
+    uow.repository.statistics = AsyncMock()
+    return uow
+
+
+@pytest.fixture
+def transaction_service(mock_uow):
+    return TransactionService(
+        config=MagicMock(spec=AppConfig),
+        bot=MagicMock(),
+        redis_client=MagicMock(),
+        redis_repository=MagicMock(),
+        translator_hub=MagicMock(),
+        uow=mock_uow,
+    )
+
+
+@pytest.fixture(autouse=True)
+def mock_from_model():
+    # Ответ репозитория — мок, валидировать его в DTO не нужно
+    with patch("src.services.transaction.TransactionDto.from_model") as from_model:
+        yield from_model
+
+
+def make_transaction(status):
+    transaction = MagicMock()
+    transaction.payment_id = uuid4()
+    transaction.changed_data = {"status": status}
+    transaction.pricing.final_amount = Decimal(90)
+    transaction.pricing.original_amount = Decimal(100)
+    return transaction
+
+
+def make_db_transaction(status):
+    db_transaction = MagicMock()
+    db_transaction.id = 1
+    db_transaction.user_telegram_id = 12345
+    db_transaction.status = status
+    db_transaction.gateway_type = PaymentGatewayType.YOOKASSA
+    return db_transaction
+
+
+@pytest.mark.asyncio
+async def test_update_records_completed_transaction(transaction_service, mock_uow):
+    # Arrange
+    transaction = make_transaction(TransactionStatus.COMPLETED)
+    mock_uow.repository.transactions.get_status.return_value = TransactionStatus.PENDING
+    mock_uow.repository.transactions.update.return_value = make_db_transaction(
+        TransactionStatus.COMPLETED
+    )
+
+    # Act
+    await transaction_service.update(transaction)
+
+    # Assert
+    mock_uow.repository.statistics.record_transaction.assert_awaited_once()
+    kwargs = mock_uow.repository.statistics.record_transaction.await_args.kwargs
+    assert kwargs["sign"] == 1
+    assert kwargs["final_amount"] == Decimal(90)
+
+
+@pytest.mark.asyncio
+async def test_update_reverts_failed_completed_transaction(transaction_service, mock_uow):
+    # Arrange
+    transaction = make_transaction(TransactionStatus.FAILED)
+    mock_uow.repository.transactions.get_status.return_value = TransactionStatus.COMPLETED
+    mock_uow.repository.transactions.update.return_value = make_db_transaction(
+        TransactionStatus.FAILED
+    )
+
+    # Act
+    await transaction_service.update(transaction)
+
+    # Assert
+    kwargs = mock_uow.repository.statistics.record_transaction.await_args.kwargs
+    assert kwargs["sign"] == -1
+
+
+@pytest.mark.asyncio
+async def test_update_skips_statistics_without_status_transition(transaction_service, mock_uow):
+    # Arrange
+    transaction = make_transaction(TransactionStatus.COMPLETED)
+    mock_uow.repository.transactions.get_status.return_value = TransactionStatus.COMPLETED
+    mock_uow.repository.transactions.update.return_value = make_db_transaction(
+        TransactionStatus.COMPLETED
+    )
+
+    # Act
+    await transaction_service.update(transaction)
+
+    # Assert
+    mock_uow.repository.statistics.record_transaction.assert_not_awaited()
@@ -0,0 +1,62 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.config import AppConfig
+from src.core.utils.identity_map import IdentityMap
+from src.infrastructure.database import UnitOfWork
+from src.infrastructure.redis import RedisRepository
+from src.services.user import UserService
+
+
+@pytest.fixture
+def mock_uow():
+    uow = MagicMock(spec=UnitOfWork)
+    uow.repository = MagicMock()
+    uow.repository.users = AsyncMock()
+    return uow
+
+
+@pytest.fixture
+def user_service(mock_uow):
+    return UserService(
+        config=MagicMock(spec=AppConfig),
+        bot=MagicMock(),
+        redis_client=AsyncMock(),
+        redis_repository=AsyncMock(spec=RedisRepository),
+        translator_hub=MagicMock(),
+        uow=mock_uow,
+        identity_map=IdentityMap(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_clear_user_cache_invalidates_list_caches(user_service):
+    # Act
+    with patch("src.services.user.invalidate_cache", new=AsyncMock()) as invalidate:
+        await user_service.clear_user_cache(12345)
+
+    # Assert
+    # Счётчик пользователей кешируется с префиксом users_count
+    list_keys = invalidate.await_args_list[-1].args[1:]
+    assert "cache:users_count" in list_keys
+
+
+@pytest.mark.asyncio
+async def test_get_blocked_users_reads_only_first_page(user_service, mock_uow):
+    # Arrange
+    first_page = [MagicMock(), MagicMock()]
+
+    async def iter_blocked(batch_size):
+        yield first_page
+        raise AssertionError("Следующая страница не должна запрашиваться")
+
+    mock_uow.repository.users.iter_blocked = MagicMock(side_effect=iter_blocked)
+
+    # Act
+    with patch("src.services.user.UserDto.from_model_list", side_effect=list):
+        users = await user_service.get_blocked_users(limit=2)
+
+    # Assert
+    assert users == first_page
+    mock_uow.repository.users.iter_blocked.assert_called_once_with(batch_size=2)
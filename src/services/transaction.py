@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
 from aiogram import Bot
@@ -7,6 +7,7 @@ from loguru import logger
 from redis.asyncio import Redis
 
 from src.core.config import AppConfig
+from src.core.constants import DATABASE_BATCH_SIZE
 from src.core.enums import TransactionStatus
 from src.infrastructure.database import UnitOfWork
 from src.infrastructure.database.models.dto import TransactionDto, UserDto
@@ -57,17 +58,28 @@ class TransactionService(BaseService):
         logger.debug(f"Retrieved '{len(db_transactions)}' transactions for user '{telegram_id}'")
         return TransactionDto.from_model_list(db_transactions)
 
-    async def get_all(self) -> list[TransactionDto]:
-        db_transactions = await self.uow.repository.transactions.get_all()
-        logger.debug(f"Retrieved '{len(db_transactions)}' total transactions")
-        return TransactionDto.from_model_list(db_transactions)
-
-    async def get_by_status(self, status: TransactionStatus) -> list[TransactionDto]:
-        db_transactions = await self.uow.repository.transactions.get_by_status(status)
-        logger.debug(f"Retrieved '{len(db_transactions)}' transactions with status '{status}'")
-        return TransactionDto.from_model_list(db_transactions)
+    async def iter_by_status(
+        self,
+        status: TransactionStatus,
+        batch_size: int = DATABASE_BATCH_SIZE,
+    ) -> AsyncIterator[list[TransactionDto]]:
+        async for db_transactions in self.uow.repository.transactions.iter_by_status(
+            status,
+            batch_size,
+        ):
+            logger.debug(
+                f"Retrieved batch of '{len(db_transactions)}' transactions with status '{status}'"
+            )
+            yield TransactionDto.from_model_list(db_transactions)
 
     async def update(self, transaction: TransactionDto) -> Optional[TransactionDto]:
+        previous_status = None
+
+        if "status" in transaction.changed_data:
+            previous_status = await self.uow.repository.transactions.get_status(
+                transaction.payment_id
+            )
+
         db_updated_transaction = await self.uow.repository.transactions.update(
             payment_id=transaction.payment_id,
             **transaction.changed_data,
@@ -75,6 +87,7 @@ class TransactionService(BaseService):
 
         if db_updated_transaction:
             logger.info(f"Updated transaction '{transaction.payment_id}' successfully")
+            await self._record_statistics(transaction, db_updated_transaction, previous_status)
         else:
             logger.warning(
                 f"Attempted to update transaction '{transaction.payment_id}', "
@@ -92,3 +105,31 @@ class TransactionService(BaseService):
         count = await self.uow.repository.transactions.count_by_status(status)
         logger.debug(f"Transactions count with status '{status}': '{count}'")
         return count
+
+    #
+
+    async def _record_statistics(
+        self,
+        transaction: TransactionDto,
+        db_transaction: Transaction,
+        previous_status: Optional[TransactionStatus],
+    ) -> None:
+        was_completed = previous_status == TransactionStatus.COMPLETED
+        is_completed = db_transaction.status == TransactionStatus.COMPLETED
+
+        if previous_status is None or was_completed == is_completed:
+            return
+
+        await self.uow.repository.statistics.record_transaction(
+            telegram_id=db_transaction.user_telegram_id,
+            transaction_id=db_transaction.id,
+            gateway_type=db_transaction.gateway_type,
+            final_amount=transaction.pricing.final_amount,
+            original_amount=transaction.pricing.original_amount,
+            created_at=db_transaction.created_at,
+            sign=1 if is_completed else -1,
+        )
+        logger.debug(
+            f"Recorded transaction '{transaction.payment_id}' in statistics "
+            f"as '{db_transaction.status}'"
+        )
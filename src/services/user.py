@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from aiogram import Bot
 from aiogram.types import Message
@@ -9,6 +9,8 @@ from redis.asyncio import Redis
 
 from src.core.config import AppConfig
 from src.core.constants import (
+    BLACKLIST_PAGE_SIZE,
+    DATABASE_BATCH_SIZE,
     RECENT_ACTIVITY_MAX_COUNT,
     RECENT_REGISTERED_MAX_COUNT,
     waveshop_PREFIX,
@@ -18,17 +20,19 @@ from src.core.constants import (
 from src.core.enums import Locale, UserRole
 from src.core.storage.key_builder import StorageKey, build_key
 from src.core.storage.keys import RecentActivityUsersKey, RecentRegisteredUsersKey
+from src.core.utils.identity_map import IdentityMap
 from src.core.utils.types import RemnaUserDto
 from src.infrastructure.database import UnitOfWork
 from src.infrastructure.database.models.dto import UserDto
 from src.infrastructure.database.models.sql import User
-from src.infrastructure.redis import RedisRepository, redis_cache
+from src.infrastructure.redis import RedisRepository, invalidate_cache, redis_cache
 
 from .base import BaseService
 
 
 class UserService(BaseService):
     uow: UnitOfWork
+    identity_map: IdentityMap
 
     def __init__(
         self,
@@ -39,9 +43,11 @@ class UserService(BaseService):
         translator_hub: TranslatorHub,
         #
         uow: UnitOfWork,
+        identity_map: IdentityMap,
     ) -> None:
         super().__init__(config, bot, redis_client, redis_repository, translator_hub)
         self.uow = uow
+        self.identity_map = identity_map
 
     async def create(self, aiogram_user: AiogramUser) -> UserDto:
         user = UserDto(
@@ -61,6 +67,7 @@ class UserService(BaseService):
         )
         db_user = User(**user.model_dump())
         db_created_user = await self.uow.repository.users.create(db_user)
+        await self.uow.repository.statistics.record_registration(db_created_user.created_at)
 
         await self.add_to_recent_registered(user.telegram_id)
         await self.clear_user_cache(user.telegram_id)
@@ -76,14 +83,48 @@ class UserService(BaseService):
         )
         db_user = User(**user.model_dump())
         db_created_user = await self.uow.repository.users.create(db_user)
+        await self.uow.repository.statistics.record_registration(db_created_user.created_at)
 
         await self.add_to_recent_registered(user.telegram_id)
         await self.clear_user_cache(user.telegram_id)
         logger.info(f"Created new user '{user.telegram_id}' from panel")
         return UserDto.from_model(db_created_user)  # type: ignore[return-value]
 
-    @redis_cache(prefix="get_user", ttl=TIME_1M)
+    async def create_many_from_panel(self, telegram_ids: list[int]) -> list[int]:
+        users = [
+            UserDto(
+                telegram_id=telegram_id,
+                name=str(telegram_id),
+                role=UserRole.USER,
+                language=self.config.default_locale,
+            ).model_dump(exclude={"id", "created_at", "updated_at", "current_subscription"})
+            for telegram_id in telegram_ids
+        ]
+        db_created_users = await self.uow.repository.users.create_many(users)
+
+        if not db_created_users:
+            return []
+
+        await self.uow.repository.statistics.record_registration(
+            db_created_users[0].created_at,
+            count=len(db_created_users),
+        )
+
+        created_ids = [db_user.telegram_id for db_user in db_created_users]
+        await self.clear_users_cache(created_ids)
+        logger.info(f"Created '{len(created_ids)}' new users from panel")
+        return created_ids
+
     async def get(self, telegram_id: int) -> Optional[UserDto]:
+        key = ("user", telegram_id)
+
+        if key not in self.identity_map:
+            self.identity_map[key] = await self._get(telegram_id)
+
+        return self.identity_map[key]  # type: ignore[no-any-return]
+
+    @redis_cache(prefix="get_user", ttl=TIME_1M, local=True)
+    async def _get(self, telegram_id: int) -> Optional[UserDto]:
         db_user = await self.uow.repository.users.get(telegram_id)
 
         if db_user:
@@ -172,23 +213,44 @@ class UserService(BaseService):
         logger.debug(f"Total users count: '{count}'")
         return count
 
+    @redis_cache(prefix="blocked_users_count", ttl=TIME_10M)
+    async def count_blocked(self) -> int:
+        count = await self.uow.repository.users.count_blocked()
+        logger.debug(f"Blocked users count: '{count}'")
+        return count
+
+    # Privileged roles are a handful of users, so the whole list is cached
     @redis_cache(prefix="get_by_role", ttl=TIME_10M)
     async def get_by_role(self, role: UserRole) -> list[UserDto]:
-        db_users = await self.uow.repository.users.filter_by_role(role)
-        logger.debug(f"Retrieved '{len(db_users)}' users with role '{role}'")
-        return UserDto.from_model_list(db_users)
+        users: list[UserDto] = []
 
-    @redis_cache(prefix="get_blocked_users", ttl=TIME_10M)
-    async def get_blocked_users(self) -> list[UserDto]:
-        db_users = await self.uow.repository.users.filter_by_blocked(blocked=True)
-        logger.debug(f"Retrieved '{len(db_users)}' blocked users")
-        return UserDto.from_model_list(list(reversed(db_users)))
+        async for batch in self.iter_by_role(role):
+            users.extend(batch)
 
-    @redis_cache(prefix="get_all", ttl=TIME_10M)
-    async def get_all(self) -> list[UserDto]:
-        db_users = await self.uow.repository.users.get_all()
-        logger.debug(f"Retrieved '{len(db_users)}' users")
-        return UserDto.from_model_list(db_users)
+        logger.debug(f"Retrieved '{len(users)}' users with role '{role}'")
+        return users
+
+    async def iter_by_role(
+        self,
+        role: UserRole,
+        batch_size: int = DATABASE_BATCH_SIZE,
+    ) -> AsyncIterator[list[UserDto]]:
+        async for db_users in self.uow.repository.users.iter_by_role(role, batch_size):
+            yield UserDto.from_model_list(db_users)
+
+    async def get_blocked_users(self, limit: int = BLACKLIST_PAGE_SIZE) -> list[UserDto]:
+        async for db_users in self.uow.repository.users.iter_blocked(batch_size=limit):
+            logger.debug(f"Retrieved '{len(db_users)}' blocked users")
+            return UserDto.from_model_list(db_users)
+
+        return []
+
+    async def iter_blocked_users(
+        self,
+        batch_size: int = DATABASE_BATCH_SIZE,
+    ) -> AsyncIterator[list[UserDto]]:
+        async for db_users in self.uow.repository.users.iter_blocked(batch_size):
+            yield UserDto.from_model_list(db_users)
 
     async def set_block(self, user: UserDto, blocked: bool) -> None:
         user.is_blocked = blocked
@@ -345,22 +407,33 @@ class UserService(BaseService):
     #
 
     async def clear_user_cache(self, telegram_id: int) -> None:
-        user_cache_key: str = build_key("cache", "get_user", telegram_id)
-        await self.redis_client.delete(user_cache_key)
-        await self._clear_list_caches()
+        await self.clear_users_cache([telegram_id])
         logger.debug(f"User cache for '{telegram_id}' invalidated")
 
+    async def clear_users_cache(self, telegram_ids: list[int]) -> None:
+        if not telegram_ids:
+            return
+
+        user_cache_keys: list[str] = []
+
+        for telegram_id in telegram_ids:
+            self.identity_map.evict(("user", telegram_id), ("current_subscription", telegram_id))
+            user_cache_keys.append(build_key("cache", "get_user", telegram_id))
+
+        await invalidate_cache(self.redis_client, *user_cache_keys)
+        await self._clear_list_caches()
+
     async def _clear_list_caches(self) -> None:
         list_cache_keys_to_invalidate = [
-            build_key("cache", "get_blocked_users"),
-            build_key("cache", "count"),
+            build_key("cache", "blocked_users_count"),
+            build_key("cache", "users_count"),
         ]
 
         for role in UserRole:
             key = build_key("cache", "get_by_role", role=role)
             list_cache_keys_to_invalidate.append(key)
 
-        await self.redis_client.delete(*list_cache_keys_to_invalidate)
+        await invalidate_cache(self.redis_client, *list_cache_keys_to_invalidate)
         logger.debug(f"List caches invalidated")
 
     async def _add_to_recent_list(self, key: StorageKey, telegram_id: int) -> None: